@@ -3,7 +3,17 @@ from earlywarningsignals.signals.general import EWarningGeneral
 from earlywarningsignals.signals.specific import EWarningSpecific
 from earlywarningsignals.signals.dnm import EWarningDNM
 from earlywarningsignals.signals.landscape_dnm import EWarningLDNM
+from earlywarningsignals.signals.online import FoldChangeDetector
 
 from earlywarningsignals.signals.dynamic_adjacency.specific import EWarningSpecificDynamic
 from earlywarningsignals.signals.dynamic_adjacency.dnm import EWarningDNMDynamic
 from earlywarningsignals.signals.dynamic_adjacency.landscape_dnm import EWarningLDNMDynamic
+
+from earlywarningsignals.signals.cache import check_windows_cached
+from earlywarningsignals.signals.indicators import critical_slowing_down
+from earlywarningsignals.signals.sensitivity import leave_one_out, country_influence
+from earlywarningsignals.signals.sharding import run_shards
+from earlywarningsignals.signals.sweep import window_size_sweep, correlation_sweep, window_size_markers
+from earlywarningsignals.signals.refinement import strided_networks, refine_tipping_points
+from earlywarningsignals.signals.bootstrap import bootstrap_markers, bootstrap_bands
+from earlywarningsignals.signals.surrogates import surrogate_test
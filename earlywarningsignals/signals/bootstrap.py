@@ -0,0 +1,132 @@
+# Data Structures and basic Algorithms Libraries
+import numpy as np
+# Generic Python Libraries
+import copy
+
+# Library classes
+from earlywarningsignals.signals.dnm import EWarningDNM
+from earlywarningsignals.signals.landscape_dnm import EWarningLDNM
+# Vectorized correlation kernels
+import earlywarningsignals.signals.correlation as correlation
+
+# Default Parameters
+REPLICATES_DEFAULT = 100
+BLOCK_SIZE_DEFAULT = 3
+CONFIDENCE_DEFAULT = 0.95
+BATCH_SIZE_DEFAULT = 10
+
+
+def block_indices(replicates, windows, window_size, block_size=BLOCK_SIZE_DEFAULT, seed=None):
+    """
+    Generates the positions of the dates selected by a moving block bootstrap inside each window. Every window is
+    filled with blocks of block_size consecutive dates starting at random positions of the window, so the short term
+    dependence between consecutive dates is kept. The same positions are used for every country, keeping the
+    relation between countries. The result is reproducible for the same seed.
+
+    :param int replicates: Number of bootstrap replicates.
+    :param int windows: Number of windows.
+    :param int window_size: Number of dates of each window.
+    :param int block_size: Number of consecutive dates of each block. It is limited to the window size.
+    :param int seed: Seed of the random number generator.
+
+    :return: Positions inside each window with shape (replicates, windows, window_size).
+    :rtype: numpy [[[int]]]
+    """
+    rng = np.random.default_rng(seed)
+    block_size = min(max(block_size, 1), window_size)
+    blocks = -(-window_size // block_size)
+    starts = rng.integers(0, window_size - block_size + 1, size=(replicates, windows, blocks))
+    indices = starts[..., np.newaxis] + np.arange(block_size)
+    return indices.reshape(replicates, windows, blocks * block_size)[..., :window_size]
+
+
+def bootstrap_markers(ew, marker, marker_args=(), replicates=REPLICATES_DEFAULT, block_size=BLOCK_SIZE_DEFAULT,
+                      seed=None, batch_size=BATCH_SIZE_DEFAULT):
+    """
+    Calculates an early warning signal for each bootstrap replicate of the windows of the data. The networks of each
+    batch of replicates are generated at once from the resampled windows with the method networks_from_windows() of
+    the class. For the EWarningDNM class and its specializations, each network compares two consecutive windows, so
+    both windows are taken from the same resampled span of window size plus one dates, keeping their pairing. Only the
+    dates shared by both windows are resampled, while the first date of the span (only in the first window) and the
+    last one (only in the second window) are kept, because their exchange is the change measured by the network.
+
+    :param EWarningGeneral ew: Instance of any of the classes of the library with window size greater than zero,
+        whose method check_windows() has already been called.
+    :param string marker: Name of the method of the class that calculates the early warning signal, for example
+        "density", "clustering_coefficient" or "mst_dnm".
+    :param tuple marker_args: Additional arguments of the method of the early warning signal.
+    :param int replicates: Number of bootstrap replicates.
+    :param int block_size: Number of consecutive dates of each block, as described in the function block_indices().
+        For the EWarningDNM class and its specializations, it is limited to the window size minus one.
+    :param int seed: Seed of the random number generator.
+    :param int batch_size: Number of replicates whose networks are generated at once.
+
+    :return: Values of the early warning signal for each replicate, with shape (replicates, ...).
+    :rtype: numpy [[float]]
+
+    :raises:
+        ValueError: If the window size of the instance is not greater than zero. If the early warning signal is the
+            L-DNM.
+    """
+    if not ew.window_size:
+        raise ValueError('The bootstrap of the windows requires a <window_size> greater than zero.')
+    if isinstance(ew, EWarningLDNM) and marker == 'landscape_dnm':
+        raise ValueError('The L-DNM is not calculated from the networks of the replicates, so it has no bootstrap.')
+
+    dnm = isinstance(ew, EWarningDNM)
+    ew_windows = ew
+    if dnm:
+        # The windows are given in pairs (t0, t1), with the adjacencies of both windows of each network
+        ew_windows = copy.copy(ew)
+        ew_windows.adjacencies = np.asarray(ew.adjacencies)[np.repeat(np.arange(len(ew.adjacencies)), 2)[1:-1]]
+    spans = correlation.sliding_windows(np.asarray(ew.data, dtype=float), ew.window_size + 1 if dnm else ew.window_size)
+    if dnm:
+        shared = ew.window_size - 1
+        indices = block_indices(replicates, spans.shape[-3], shared, block_size, seed) + 1 if shared else \
+            np.zeros((replicates, spans.shape[-3], 0), dtype=int)
+        indices = np.concatenate((np.zeros(indices.shape[:-1] + (1,), dtype=int), indices,
+                                  np.full(indices.shape[:-1] + (1,), ew.window_size)), axis=-1)
+    else:
+        indices = block_indices(replicates, spans.shape[-3], spans.shape[-1], block_size, seed)
+    values = []
+    for start in range(0, replicates, batch_size):
+        batch = indices[start:start + batch_size, :, np.newaxis, :]
+        resampled = np.take_along_axis(spans[np.newaxis], batch, axis=-1)
+        if dnm:
+            resampled = np.stack((resampled[..., :-1], resampled[..., 1:]), axis=-3)
+            resampled = resampled.reshape(resampled.shape[:1] + (-1,) + resampled.shape[-2:])
+            batch_networks = ew_windows.networks_from_windows(resampled)[:, ::2]
+        else:
+            batch_networks = ew_windows.networks_from_windows(resampled)
+        for networks in batch_networks:
+            values.append(getattr(ew.with_networks(networks), marker)(*marker_args))
+    return np.array(values)
+
+
+def bootstrap_bands(ew, marker, marker_args=(), replicates=REPLICATES_DEFAULT, block_size=BLOCK_SIZE_DEFAULT,
+                    confidence=CONFIDENCE_DEFAULT, seed=None, batch_size=BATCH_SIZE_DEFAULT):
+    """
+    Calculates the confidence bands of an early warning signal with a block bootstrap of the dates inside each
+    window, using the percentiles of the bootstrap replicates. The bands are aligned with the values of the early
+    warning signal, so they have one value for each instant of study between the established dates.
+
+    :param EWarningGeneral ew: Instance of any of the classes of the library with window size greater than zero,
+        whose method check_windows() has already been called.
+    :param string marker: Name of the method of the class that calculates the early warning signal.
+    :param tuple marker_args: Additional arguments of the method of the early warning signal.
+    :param int replicates: Number of bootstrap replicates.
+    :param int block_size: Number of consecutive dates of each block, as described in the function block_indices().
+    :param float confidence: Confidence level of the bands, between 0 and 1.
+    :param int seed: Seed of the random number generator.
+    :param int batch_size: Number of replicates whose networks are generated at once.
+
+    :return: The lower band and the upper band, both with the same shape as the early warning signal.
+    :rtype: (numpy [float], numpy [float])
+
+    :raises:
+        ValueError: If the window size of the instance is not greater than zero. If the early warning signal is the
+            L-DNM.
+    """
+    values = bootstrap_markers(ew, marker, marker_args, replicates, block_size, seed, batch_size)
+    lower, upper = np.nanquantile(values, [(1 - confidence) / 2, (1 + confidence) / 2], axis=0)
+    return lower, upper
@@ -0,0 +1,97 @@
+# Generic Python Libraries
+import shutil
+import os
+
+# Library classes
+from earlywarningsignals.signals.general import EWarningGeneral
+
+# Default Parameters
+MAX_SIZE_DEFAULT = 2 ** 30  # 1 GiB
+
+
+def cache_key(ew):
+    """
+    Generates the key of the results of the method check_windows() of a class, given by its method parameters_key().
+    Two classes with the same key obtain the same results.
+
+    :param EWarningGeneral ew: Instance of any of the classes of the library.
+
+    :return: Hexadecimal SHA-256 hash of the class.
+    :rtype: string
+    """
+    return ew.parameters_key()
+
+
+def cache_entries(directory):
+    """
+    Gives the entries stored in a cache folder, from the least recently used to the most recently used one.
+
+    :param string directory: Location path of the cache folder.
+
+    :return: List with the path and the size in bytes of each entry.
+    :rtype: [(string, int)]
+    """
+    entries = []
+    for key in os.listdir(directory):
+        path = os.path.join(directory, key)
+        if os.path.isdir(path) and not key.startswith('.'):
+            size = sum(entry.stat().st_size for entry in os.scandir(path) if entry.is_file())
+            entries.append((os.stat(path).st_mtime, path, size))
+    return [(path, size) for _, path, size in sorted(entries)]
+
+
+def evict(directory, max_size=MAX_SIZE_DEFAULT, keep=None):
+    """
+    Removes the least recently used entries of a cache folder until its size is not greater than the maximum size.
+
+    :param string directory: Location path of the cache folder.
+    :param int max_size: Maximum size in bytes of the cache folder.
+    :param string keep: Path of an entry that must not be removed, even if the cache folder is still too big.
+    """
+    entries = cache_entries(directory)
+    total_size = sum(size for _, size in entries)
+    for path, size in entries:
+        if total_size <= max_size:
+            break
+        if path != keep:
+            shutil.rmtree(path, ignore_errors=True)
+            total_size -= size
+
+
+def check_windows_cached(ew, directory, max_size=MAX_SIZE_DEFAULT):
+    """
+    Calls the method check_windows() of the class, storing its results in a cache folder shared by any number of
+    processes. The results are saved with the method save() of the class, under the key generated by the function
+    cache_key(). When the key is already stored, the results (data, adjacencies, networks, L-DNM...) are read from the
+    cache instead of being computed. The least recently used entries are removed when the cache grows beyond its
+    maximum size.
+
+    :param EWarningGeneral ew: Instance of any of the classes of the library, whose method check_windows() hasn't been
+        called yet.
+    :param string directory: Location path of the cache folder, that is created if needed.
+    :param int max_size: Maximum size in bytes of the cache folder.
+
+    :return: True if the results were read from the cache, False if they were computed.
+    :rtype: boolean
+    """
+    os.makedirs(directory, exist_ok=True)
+    path = os.path.join(directory, cache_key(ew))
+
+    if os.path.isdir(path):
+        cached = EWarningGeneral.load(path)
+        for attribute in list(ew.time_axes()) + ['start_date', 'end_date', 'window_size']:
+            setattr(ew, attribute, getattr(cached, attribute))
+        os.utime(path)  # Most recently used entry
+        evict(directory, max_size, keep=path)
+        return True
+
+    ew.check_windows()
+    # The entry is written in a temporary folder and renamed, so other processes never read an incomplete entry
+    temporary = os.path.join(directory, f'.{os.path.basename(path)}.{os.getpid()}')
+    ew.save(temporary)
+    try:
+        os.rename(temporary, path)
+    except OSError:  # The same entry was stored by another process
+        shutil.rmtree(temporary, ignore_errors=True)
+    evict(directory, max_size, keep=path)
+    return False
@@ -0,0 +1,217 @@
+# Data Structures and basic Algorithms Libraries
+import numpy as np
+from scipy import stats
+
+
+def sliding_windows(data, window_size):
+    """
+    Generates a view of all the windows of consecutive dates of the data, without copying it.
+
+    :param numpy [[float]] data: Data of the confirmed covid cases, where the Rows represent each country and the
+        Columns represent each date. Any number of leading axes (for example a batch of surrogates) is accepted.
+    :param int window_size: Number of dates of each window.
+
+    :return: Windows of the data with shape (..., windows, countries, window_size), where each window starts one date
+        after the previous one.
+    :rtype: numpy [[[float]]]
+    """
+    windows = np.lib.stride_tricks.sliding_window_view(data, window_size, axis=-1)
+    return np.swapaxes(windows, -3, -2)
+
+
+def normalized_products(vectors, constant):
+    """
+    Computes the cosine similarity between every pair of vectors of the same group, which is the correlation
+    coefficient when the vectors are centered. Pairs including a constant vector get a coefficient equal to zero, as
+    well as the main diagonal.
+
+    :param numpy [[float]] vectors: Groups of vectors with shape (..., countries, length).
+    :param numpy [bool] constant: Boolean array with shape (..., countries) that marks the constant vectors.
+
+    :return: Matrices of coefficients with shape (..., countries, countries).
+    :rtype: numpy [[float]]
+    """
+    products = np.matmul(vectors, np.swapaxes(vectors, -1, -2))
+    norms = np.sqrt(np.diagonal(products, axis1=-2, axis2=-1))
+    with np.errstate(divide='ignore', invalid='ignore'):
+        coefficients = np.clip(products / (norms[..., :, np.newaxis] * norms[..., np.newaxis, :]), -1, 1)
+    coefficients[constant[..., :, np.newaxis] | constant[..., np.newaxis, :]] = 0
+    diagonal = np.arange(coefficients.shape[-1])
+    coefficients[..., diagonal, diagonal] = 0
+    return np.nan_to_num(coefficients)
+
+
+def pearson(windows):
+    """
+    Computes the Pearson Correlation between every pair of countries of each window at once.
+
+    :param numpy [[float]] windows: Windows of data with shape (..., countries, window_size).
+
+    :return: Correlation matrices with shape (..., countries, countries), with zeros in the main diagonal and for
+        the undefined coefficients.
+    :rtype: numpy [[float]]
+    """
+    windows = np.asarray(windows, dtype=float)
+    constant = np.all(windows == windows[..., :1], axis=-1)
+    return normalized_products(windows - windows.mean(axis=-1, keepdims=True), constant)
+
+
+def spearman(windows):
+    """
+    Computes the Spearman Correlation between every pair of countries of each window at once, as the Pearson
+    Correlation of the ranks of each window (tied values get the average of their ranks).
+
+    :param numpy [[float]] windows: Windows of data with shape (..., countries, window_size).
+
+    :return: Correlation matrices with shape (..., countries, countries), with zeros in the main diagonal and for
+        the undefined coefficients.
+    :rtype: numpy [[float]]
+    """
+    return pearson(stats.rankdata(windows, axis=-1))
+
+
+def kendall(windows):
+    """
+    Computes the Kendall Correlation (tau-b, which takes ties into account) between every pair of countries of each
+    window at once. The coefficient is the cosine similarity between the signs of the differences of every pair of
+    dates of both countries.
+
+    :param numpy [[float]] windows: Windows of data with shape (..., countries, window_size).
+
+    :return: Correlation matrices with shape (..., countries, countries), with zeros in the main diagonal and for
+        the undefined coefficients.
+    :rtype: numpy [[float]]
+    """
+    windows = np.asarray(windows, dtype=float)
+    signs = np.sign(windows[..., :, np.newaxis] - windows[..., np.newaxis, :])
+    signs = signs.reshape(signs.shape[:-2] + (-1,))
+    return normalized_products(signs, np.all(signs == 0, axis=-1))
+
+
+def correlation_matrices(windows, correlation):
+    """
+    Computes the correlation between every pair of countries of each window at once, with the same type of
+    correlation as the method calculate_correlation() of the class EWarningGeneral.
+
+    :param numpy [[float]] windows: Windows of data with shape (..., countries, window_size).
+    :param string correlation: Type of correlation to use for each window between each pair of countries.
+        List of possible correlation values:
+             - "pearson": Pearson Correlation
+             - "spearman": Spearman Correlation
+             - "kendall":Kendall Correlation
+             - any other value: Pearson Correlation
+
+    :return: Correlation matrices with shape (..., countries, countries), with zeros in the main diagonal and for
+        the undefined coefficients.
+    :rtype: numpy [[float]]
+    """
+    if correlation == 'spearman':
+        return spearman(windows)
+    elif correlation == 'kendall':
+        return kendall(windows)
+    return pearson(windows)
+
+
+def multiple_correlation_matrices(windows, correlations):
+    """
+    Computes several types of correlation between every pair of countries of each window at once, sharing the work
+    between them: the ranks of the windows are computed only once, and used both by the Spearman Correlation and by
+    the Kendall Correlation (the order of the ranks is the same as the order of the values).
+
+    :param numpy [[float]] windows: Windows of data with shape (..., countries, window_size).
+    :param [string] correlations: List of the types of correlation, as described in the function
+        correlation_matrices().
+
+    :return: Dictionary with each type of correlation as key, and as value the correlation matrices with shape
+        (..., countries, countries).
+    :rtype: {string: numpy [[float]]}
+    """
+    windows = np.asarray(windows, dtype=float)
+    ranks = stats.rankdata(windows, axis=-1) if {'spearman', 'kendall'} & set(correlations) else None
+    results = {}
+    for correlation in correlations:
+        if correlation == 'spearman':
+            results[correlation] = pearson(ranks)
+        elif correlation == 'kendall':
+            results[correlation] = kendall(ranks)
+        elif 'pearson' not in results:
+            results[correlation] = results['pearson'] = pearson(windows)
+        else:
+            results[correlation] = results['pearson']
+    return {correlation: results[correlation] for correlation in correlations}
+
+
+def window_correlations(data, window_size, correlation):
+    """
+    Computes the correlation matrix of every window of consecutive dates of the data at once.
+
+    :param numpy [[float]] data: Data of the confirmed covid cases, where the Rows represent each country and the
+        Columns represent each date. Any number of leading axes (for example a batch of surrogates) is accepted.
+    :param int window_size: Number of dates of each window.
+    :param string correlation: Type of correlation, as described in the function correlation_matrices().
+
+    :return: Correlation matrices with shape (..., windows, countries, countries).
+    :rtype: numpy [[[float]]]
+    """
+    return correlation_matrices(sliding_windows(data, window_size), correlation)
+
+
+def prefix_sums(data):
+    """
+    Computes the cumulative sums over the dates of the values, the squared values and the products of every pair of
+    countries, which give the sums of any window of consecutive dates with one subtraction. The values of each country
+    are shifted by its rounded mean and the sums are accumulated with extended precision (numpy longdouble), so they
+    are exact for integer data and lose almost no precision otherwise.
+
+    :param numpy [[float]] data: Data of the confirmed covid cases, where the Rows represent each country and the
+        Columns represent each date.
+
+    :return: Cumulative sums of the values and of the squared values with shape (countries, dates + 1), and cumulative
+        sums of the products with shape (dates + 1, countries, countries), all of them starting with zeros.
+    :rtype: (numpy [[float]], numpy [[float]], numpy [[[float]]])
+    """
+    data = np.asarray(data, dtype=float)
+    data = (data - np.round(data.mean(axis=-1, keepdims=True))).astype(np.longdouble)
+    zeros = np.zeros((data.shape[0], 1), dtype=np.longdouble)
+    sums = np.concatenate([zeros, np.cumsum(data, axis=-1)], axis=-1)
+    squares = np.concatenate([zeros, np.cumsum(data ** 2, axis=-1)], axis=-1)
+    products = np.cumsum(data.T[:, :, np.newaxis] * data.T[:, np.newaxis, :], axis=0)
+    products = np.concatenate([np.zeros((1,) + products.shape[1:], dtype=np.longdouble), products], axis=0)
+    return sums, squares, products
+
+
+def prefix_statistics(data, sums, window_size):
+    """
+    Computes the Pearson Correlation between every pair of countries and the standard deviation of each country for
+    every window of consecutive dates of the data, using the cumulative sums of the function prefix_sums(), so the
+    cost of each window doesn't depend on its size.
+
+    :param numpy [[float]] data: Data of the confirmed covid cases, where the Rows represent each country and the
+        Columns represent each date. It is used to find the constant windows.
+    :param tuple sums: Cumulative sums of the data given by the function prefix_sums(), aligned with the data (they can
+        be views of the cumulative sums of a longer period that starts at the same date).
+    :param int window_size: Number of dates of each window.
+
+    :return: Correlation matrices with shape (windows, countries, countries), with zeros in the main diagonal and for
+        the undefined coefficients, and standard deviations with shape (windows, countries).
+    :rtype: (numpy [[[float]]], numpy [[float]])
+    """
+    data = np.asarray(data, dtype=float)
+    windows = data.shape[-1] - window_size + 1
+    sums, squares, products = sums[0], sums[1], sums[2]
+    # Sums of each window multiplied by the window size, to avoid any division before the subtractions
+    totals = (sums[:, window_size:windows + window_size] - sums[:, :windows]).T
+    variances = window_size * (squares[:, window_size:windows + window_size] - squares[:, :windows]).T - totals ** 2
+    covariances = window_size * (products[window_size:windows + window_size] - products[:windows]) \
+        - totals[:, :, np.newaxis] * totals[:, np.newaxis, :]
+
+    constant = np.ptp(np.lib.stride_tricks.sliding_window_view(data, window_size, axis=-1), axis=-1).T == 0
+    variances = np.where(constant, 0, np.maximum(variances, 0))
+    with np.errstate(divide='ignore', invalid='ignore'):
+        coefficients = covariances / np.sqrt(variances[:, :, np.newaxis] * variances[:, np.newaxis, :])
+        coefficients = np.clip(coefficients.astype(float), -1, 1)
+    coefficients[constant[:, :, np.newaxis] | constant[:, np.newaxis, :]] = 0
+    diagonal = np.arange(coefficients.shape[-1])
+    coefficients[:, diagonal, diagonal] = 0
+    deviations = np.sqrt(variances / (window_size * (window_size - 1))).astype(float)
+    return np.nan_to_num(coefficients), deviations
@@ -2,23 +2,27 @@
 import pandas as pd
 import numpy as np
 from scipy import stats
-# Graph and Network auxiliary Libraries
-import networkx as nx
-# Time and Progress Bar Libraries
-from tqdm import tqdm
+from scipy import sparse
+from scipy.sparse import csgraph
+# Time Library
 from datetime import timedelta
 # Generic Python Libraries
 import warnings
+import copy
 
 # Original class to be extended
 from earlywarningsignals.signals import EWarningGeneral
 import earlywarningsignals.signals.general as general
+# Vectorized correlation kernels
+import earlywarningsignals.signals.correlation as correlation
 # Dedicated Exceptions for the Library
 from earlywarningsignals.signals.exceptions import DateOutRangeException, CountryUndefinedException
 
 # Default Class Parameters
 WINDOW_SIZE_DEFAULT = 0
 CUMULATIVE_DATA_DEFAULT = False
+# Edges with a lower weight are not considered as part of the networks by the graph based markers
+EDGE_WEIGHT_MIN = np.float64(1.0e-12)
 
 
 class EWarningDNM(EWarningGeneral):
@@ -34,7 +38,8 @@ class EWarningDNM(EWarningGeneral):
                  covid_file=general.COVID_FILE_DEFAULT, countries=general.COUNTRIES_DEFAULT,
                  window_size=WINDOW_SIZE_DEFAULT, correlation=general.CORRELATION_DEFAULT,
                  cumulative_data=CUMULATIVE_DATA_DEFAULT, static_adjacency=general.STATIC_ADJACENCY_DEFAULT,
-                 progress_bar=general.PROGRESS_BAR_DEFAULT):
+                 progress_bar=general.PROGRESS_BAR_DEFAULT, executor=general.EXECUTOR_DEFAULT,
+                 workers=general.WORKERS_DEFAULT, keep_unmasked=general.KEEP_UNMASKED_DEFAULT):
         """
         Main constructor for the Class that receive all possible parameters.
 
@@ -68,6 +73,16 @@ class EWarningDNM(EWarningGeneral):
             the time or new daily cases of confirmed covid cases (True).
         :param numpy [[float]] static_adjacency: Static adjacency for each graph.
         :param bool progress_bar: Boolean that determines whether a progress bar will be showing the progression.
+        :param string executor: Type of execution of the windows, which are split in chunks of consecutive dates to be
+            computed concurrently. List of possible executor values:
+                 - "serial": Sequential execution in the current process
+                 - "thread": Pool of threads
+                 - "process": Pool of processes
+                 - any other value: Sequential execution in the current process
+        :param int workers: Number of threads or processes of the pool. By default, the number of processors.
+        :param bool keep_unmasked: Boolean that determines whether to keep the networks before the product with the
+            adjacencies (class property networks_unmasked), which are needed by the method with_adjacencies(). It
+            doubles the memory used by the networks, and the space of the saved class.
 
         :raises:
             DateOutRangeException: If start_date is greater than end_date or the database doesn't contain it. If there
@@ -78,7 +93,7 @@ class EWarningDNM(EWarningGeneral):
         """
         super().__init__(start_date=start_date, end_date=end_date, covid_file=covid_file, countries=countries,
                          window_size=window_size, correlation=correlation, static_adjacency=static_adjacency,
-                         progress_bar=progress_bar)
+                         progress_bar=progress_bar, executor=executor, workers=workers, keep_unmasked=keep_unmasked)
         self.cumulative_data = cumulative_data
 
     def check_dates(self):
@@ -159,7 +174,8 @@ class EWarningDNM(EWarningGeneral):
                 self.networks = self.generate_networks(start_date_window)
                 self.start_date += timedelta(self.window_size - 1 - rest_days)
             self.window_size -= 1
-        self.networks = np.multiply(self.networks, self.adjacencies[1:])
+        self.networks_unmasked = self.networks if self.keep_unmasked else None
+        self.networks = self.mask_networks(self.networks)
 
     def window_to_network(self, window_t0, window_t1, adjacency_t0, adjacency_t1):
         """
@@ -211,32 +227,22 @@ class EWarningDNM(EWarningGeneral):
         :return: List of the correlation matrices for each temporal instant from the start date to the end date.
         :rtype: numpy [[[float]]]
         """
-        networks = []
-        i = 0
-        if self.progress_bar:
-            pbar = tqdm(total=(self.end_date + timedelta(days=1) - start_date_window).days)
-            while start_date_window + timedelta(days=2) <= self.end_date:
-                window_t1 = self.data[:, :i + 2 + 1]
-                window_t0 = window_t1[:, :-1]
-                # print(f't-1: {window_t0}')
-                # print(f't: {window_t1}')
-                networks.append(self.window_to_network(window_t0, window_t1,
-                                                       self.adjacencies[i], self.adjacencies[i + 1]))
-                start_date_window += timedelta(days=1)
-                i += 1
-                pbar.update(1)
-            pbar.close()
-        else:
-            while start_date_window + timedelta(days=2) <= self.end_date:
-                window_t1 = self.data[:, :i + 2 + 1]
-                window_t0 = window_t1[:, :-1]
-                # print(f't-1: {window_t0}')
-                # print(f't: {window_t1}')
-                networks.append(self.window_to_network(window_t0, window_t1,
-                                                       self.adjacencies[i], self.adjacencies[i + 1]))
-                start_date_window += timedelta(days=1)
-                i += 1
-        return np.array(networks)
+        days = (self.end_date - (start_date_window + timedelta(days=2))).days + 1
+        return self.execute_windows(self.growing_window_networks, days)
+
+    def growing_window_networks(self, start, stop):
+        """
+        Generates the networks of a chunk of consecutive instants of study, as in the method
+        generate_networks_no_window(), where the windows grow from the first date.
+
+        :param int start: Position of the first instant of study of the chunk.
+        :param int stop: Position following the last instant of study of the chunk.
+
+        :return: List of the correlation matrices for each temporal instant of the chunk.
+        :rtype: [numpy [[float]]]
+        """
+        return [self.window_to_network(self.data[:, :i + 2], self.data[:, :i + 2 + 1],
+                                       self.adjacencies[i], self.adjacencies[i + 1]) for i in range(start, stop)]
 
     def generate_adjacencies_no_window(self, start_date_window):
         """
@@ -269,35 +275,156 @@ class EWarningDNM(EWarningGeneral):
         :return: List of the correlation matrices for each temporal instant from the start date to the end date.
         :rtype: numpy [[[float]]]
         """
-        networks = []
-        i = 0
-        if self.progress_bar:
-            pbar = tqdm(total=((self.end_date + timedelta(days=2)) -
-                               (start_date_window + timedelta(days=self.window_size))).days)
-            while start_date_window + timedelta(days=self.window_size) <= self.end_date + timedelta(days=1):
-                window = self.data[:, i:i + self.window_size]
-                window_t0 = window[:, :-1]
-                window_t1 = window[:, 1:]
-                # print(f't-1: {window_t0}')
-                # print(f't: {window_t1}')
-                networks.append(self.window_to_network(window_t0, window_t1,
-                                                       self.adjacencies[i], self.adjacencies[i + 1]))
-                start_date_window += timedelta(days=1)
-                i += 1
-                pbar.update(1)
-            pbar.close()
+        days = ((self.end_date + timedelta(days=2)) - (start_date_window + timedelta(days=self.window_size))).days
+        return self.execute_windows(self.window_networks, days)
+
+    def window_networks(self, start, stop):
+        """
+        Specialization of the method that generates the networks of a chunk of consecutive instants of study, as in
+        the method generate_networks(), where each network requires two windows with one date of difference.
+
+        :param int start: Position of the first instant of study of the chunk.
+        :param int stop: Position following the last instant of study of the chunk.
+
+        :return: List of the correlation matrices for each temporal instant of the chunk.
+        :rtype: [numpy [[float]]]
+        """
+        return [self.window_to_network(self.data[:, i:i + self.window_size - 1],
+                                       self.data[:, i + 1:i + self.window_size],
+                                       self.adjacencies[i], self.adjacencies[i + 1]) for i in range(start, stop)]
+
+    def mask_networks(self, networks):
+        """
+        Specialization of the method that applies the adjacencies to the networks generated before masking them, where
+        each network is multiplied by the adjacency of the second of its windows.
+
+        :param numpy [[[float]]] networks: List of the networks for each temporal instant from the start date to the
+            end date, without the product with the adjacencies.
+
+        :return: List of the networks multiplied by the adjacency of each temporal instant.
+        :rtype: numpy [[[float]]]
+        """
+        return np.multiply(networks, self.adjacencies[1:])
+
+    def window_statistics(self, data):
+        """
+        Computes the correlation matrix and the standard deviation of each country for every window of the data at
+        once. In case that the window size is fixed to 0, the windows grow from the first three dates until the
+        whole data, as in the method generate_networks_no_window().
+
+        :param numpy [[float]] data: Transformed data with the same shape as the class property data. Any number of
+            leading axes is accepted.
+
+        :return: Correlation matrices with shape (..., windows, countries, countries), and standard deviations with
+            shape (..., windows, countries), with one window more than networks.
+        :rtype: (numpy [[[float]]], numpy [[float]])
+        """
+        data = np.asarray(data, dtype=float)
+        if self.window_size is None or self.window_size == 0:
+            windows = [data[..., :end] for end in range(2, data.shape[-1] + 1)]
+            correlations = np.stack([correlation.correlation_matrices(window, self.correlation)
+                                     for window in windows], axis=-3)
+            deviations = np.stack([np.std(window, axis=-1, ddof=1) for window in windows], axis=-2)
         else:
-            while start_date_window + timedelta(days=self.window_size) <= self.end_date + timedelta(days=1):
-                window = self.data[:, i:i + self.window_size]
-                window_t0 = window[:, :-1]
-                window_t1 = window[:, 1:]
-                # print(f't-1: {window_t0}')
-                # print(f't: {window_t1}')
-                networks.append(self.window_to_network(window_t0, window_t1,
-                                                       self.adjacencies[i], self.adjacencies[i + 1]))
-                start_date_window += timedelta(days=1)
-                i += 1
-        return np.array(networks)
+            correlations, deviations = self.statistics_from_windows(correlation.sliding_windows(data,
+                                                                                                self.window_size))
+        return correlations, deviations
+
+    def statistics_from_windows(self, windows):
+        """
+        Computes the correlation matrix and the standard deviation of each country for every window at once.
+
+        :param numpy [[[float]]] windows: Windows of the data with shape (..., windows, countries, window_size).
+
+        :return: Correlation matrices with shape (..., windows, countries, countries), and standard deviations with
+            shape (..., windows, countries).
+        :rtype: (numpy [[[float]]], numpy [[float]])
+        """
+        return correlation.correlation_matrices(windows, self.correlation), np.std(windows, axis=-1, ddof=1)
+
+    def windows_to_networks(self, data):
+        """
+        Specialization of the vectorized equivalent of the method generate_networks(), where each network is
+        generated from two consecutive windows as in the method window_to_network().
+
+        :param numpy [[float]] data: Transformed data with the same shape as the class property data. Any number of
+            leading axes is accepted.
+
+        :return: List of the networks for each temporal instant from the start date to the end date, with the same
+            leading axes as the data.
+        :rtype: numpy [[[float]]]
+        """
+        return self.networks_from_statistics(*self.window_statistics(data))
+
+    def networks_from_windows(self, windows):
+        """
+        Specialization of the method that generates the networks from the windows of the data, where each network is
+        generated from two consecutive windows. Hence, there must be one window more than networks, and it is only
+        valid for instances with window size greater than zero.
+
+        :param numpy [[[float]]] windows: Windows of the data with shape (..., windows, countries, window_size).
+
+        :return: List of the networks for each temporal instant from the start date to the end date, with the same
+            leading axes as the windows.
+        :rtype: numpy [[[float]]]
+        """
+        return self.networks_from_statistics(*self.statistics_from_windows(windows))
+
+    def networks_from_statistics(self, correlations, deviations):
+        """
+        Generates each network from the correlation matrices and the standard deviations of two consecutive windows,
+        as in the method window_to_network(), followed by the product with the adjacencies.
+
+        :param numpy [[[float]]] correlations: Correlation matrices with shape (..., windows, countries, countries).
+        :param numpy [[float]] deviations: Standard deviations with shape (..., windows, countries).
+
+        :return: List of the networks for each temporal instant from the start date to the end date.
+        :rtype: numpy [[[float]]]
+        """
+        cc_t = np.abs(correlations[..., 1:, :, :]) - np.abs(correlations[..., :-1, :, :])
+        deviations = (deviations[..., :, np.newaxis] + deviations[..., np.newaxis, :]) / 2
+        sd_t = deviations[..., 1:, :, :] - deviations[..., :-1, :, :]
+        networks = np.abs(cc_t) * np.abs(sd_t)
+        diagonal = np.arange(networks.shape[-1])
+        networks[..., diagonal, diagonal] = 0
+        return self.mask_networks(np.nan_to_num(networks))
+
+    def networks_at(self, positions):
+        """
+        Specialization of the method that generates the networks of some instants of study only, where each network
+        requires the window of its instant and the previous one. The windows are given in pairs, and only the
+        difference inside each pair is kept.
+
+        :param [int] positions: Positions of the instants of study, where 0 is the first date of the networks.
+
+        :return: List of the networks for each of the given instants of study.
+        :rtype: numpy [[[float]]]
+
+        :raises:
+            ValueError: If the window size is zero.
+        """
+        if not self.window_size:
+            raise ValueError('The networks of some instants of study require a <window_size> greater than zero.')
+        # The network of the position i uses the windows (and adjacencies) i and i + 1
+        pairs = np.stack((positions, np.add(positions, 1)), axis=-1).ravel().astype(int)
+        ew = copy.copy(self)
+        ew.adjacencies = np.asarray(self.adjacencies)[pairs]
+        windows = correlation.sliding_windows(np.asarray(self.data, dtype=float), self.window_size)
+        return ew.networks_from_windows(windows[pairs])[::2]
+
+    def positions_adjacencies(self, positions):
+        """
+        Specialization of the method that gives the adjacencies of some instants of study only, keeping one adjacency
+        more than networks, where the adjacency of each instant is the one of the second of its windows.
+
+        :param [int] positions: Positions of the instants of study, where 0 is the first date of the networks.
+
+        :return: List of the adjacency matrices for each of the given instants of study, preceded by the adjacency of
+            the first window of the first instant.
+        :rtype: numpy [[[float]]]
+        """
+        positions = np.asarray(positions, dtype=int)
+        return np.asarray(self.adjacencies)[np.concatenate((positions[:1], positions + 1))]
 
     def generate_adjacencies(self, start_date_window):
         """
@@ -319,30 +446,47 @@ class EWarningDNM(EWarningGeneral):
         self.window_size += 1
         return np.array(adjacencies)
 
+    def sparse_networks(self):
+        """
+        Generates a single sparse graph where each network is a block of its diagonal, so the graph algorithms can
+        process every instant of study at once. Edges with a weight lower than EDGE_WEIGHT_MIN are not included, and
+        the original networks aren't modified.
+
+        :return: Sparse matrix with as many Rows and Columns as the number of networks multiplied by the number of
+            countries, where the node of the country i in the network t is placed at the position t * countries + i.
+        :rtype: scipy csr_matrix
+        """
+        days, nodes = self.networks.shape[0], self.networks.shape[1]
+        t, i, j = np.nonzero(self.networks >= EDGE_WEIGHT_MIN)
+        return sparse.csr_matrix((self.networks[t, i, j], (t * nodes + i, t * nodes + j)),
+                                 shape=(days * nodes, days * nodes))
+
     def mst_dnm(self):
         """
         Calculates the early warning signals based on the Minimum Spanning Tree - Dynamic Network Marker (MST-DNM).
+        The minimum spanning forest of all the networks is obtained at once from their block diagonal sparse graph.
 
         :return: List of all the values of the Minimum Spanning Tree - Dynamic Network Marker (MST-DNM) of each network
             between the established dates.
         :rtype: numpy [float]
         """
-        mst_dnm_s = []
-        for network in self.networks:
-            network[network < np.float64(1.0e-12)] = 0.0
-            g = nx.Graph(network)
-            edges = nx.minimum_spanning_tree(g).edges(data=True)
-            mst_dnm_s.append(sum([w['weight'] for (_, _, w) in edges]))
-        return np.array(mst_dnm_s)
+        days, nodes = self.networks.shape[0], self.networks.shape[1]
+        mst = csgraph.minimum_spanning_tree(self.sparse_networks()).tocoo()
+        return np.bincount(mst.row // nodes, weights=mst.data, minlength=days)
 
-    def sp_dnm(self, paths=[('NO', 'IT'), ('IE', 'UA'), ('IS', 'AZ'), ('PT', 'FI')]):
+    def sp_dnm(self, paths=[('NO', 'IT'), ('IE', 'UA'), ('IS', 'AZ'), ('PT', 'FI')], all_pairs=False):
         """
         Calculates the early warning signals based on the Shortest Path - Dynamic Network Marker (SP-DNM).
+        For each network, Dijkstra's algorithm is run only once from every different origin country, and the
+        lengths of all the requested paths are extracted from its result.
 
         :param [(string, string)] paths: List of the pair of countries from which the shortest path will be searched.
             This pair of countries will also be lists but in this case of size two, where the first element is a
             ISO-3166-Alpha2 of the origin country and the second one is another ISO-3166-Alpha2 reference of the
             destination country.
+        :param bool all_pairs: Boolean that determines whether to ignore the parameter paths and calculate the shortest
+            path between every pair of different countries, in the same order as the class property countries (the
+            pairs are the origin country followed by each of the next countries of the list).
 
         :return: List of all the values of the Shortest Path - Dynamic Network Marker (SP-DNM) of each network between
         the established dates.
@@ -352,22 +496,21 @@ class EWarningDNM(EWarningGeneral):
             CountryUndefinedException: If any ISO-3166-Alpha2 references of the parameter paths isn't contained on
                 the Class, or it is incorrect.
         """
-        sp_dnm_s = []
-        paths_ids = []
-        for (origen, destination) in paths:
-            if origen not in self.countries or destination not in self.countries:
-                raise CountryUndefinedException('Some ISO-3166-Alpha2 references for the paths are incorrect '
-                                                'or not established in the Class.')
-            paths_ids.append((self.data_dataframe.loc[self.data_dataframe["ISO-3166-Alpha2"] == origen].index[0],
-                              self.data_dataframe.loc[self.data_dataframe["ISO-3166-Alpha2"] == destination].index[0]))
-            sp_dnm_s.append([])
-        for network in self.networks:
-            network[network < np.float64(1.0e-12)] = 0.0
-            g = nx.Graph(network)
-            for i, (origen, destination) in enumerate(paths_ids):
-                try:
-                    path_length = nx.shortest_path_length(g, source=origen, target=destination, weight='weight')
-                    sp_dnm_s[i].append(path_length)
-                except nx.NetworkXNoPath:
-                    sp_dnm_s[i].append(0)
-        return np.array([np.array(i) for i in sp_dnm_s])
+        if all_pairs:
+            origins, destinations = np.triu_indices(len(self.countries), k=1)
+        else:
+            for (origen, destination) in paths:
+                if origen not in self.countries_index or destination not in self.countries_index:
+                    raise CountryUndefinedException('Some ISO-3166-Alpha2 references for the paths are incorrect '
+                                                    'or not established in the Class.')
+            origins = np.array([self.countries_index[origen] for (origen, _) in paths], dtype=int)
+            destinations = np.array([self.countries_index[destination] for (_, destination) in paths], dtype=int)
+
+        sources, sources_ids = np.unique(origins, return_inverse=True)
+        sp_dnm_s = np.zeros((len(origins), len(self.networks)))
+        for t, network in enumerate(self.networks):
+            distances = csgraph.dijkstra(np.where(network >= EDGE_WEIGHT_MIN, network, 0.), directed=False,
+                                         indices=sources)
+            sp_dnm_s[:, t] = distances[sources_ids, destinations]
+        sp_dnm_s[np.isinf(sp_dnm_s)] = 0  # Pairs of countries without a path between them
+        return sp_dnm_s
@@ -26,7 +26,9 @@ class EWarningDNMDynamic(EWarningDNM):
     def __init__(self, start_date=general.START_DATE_DEFAULT, end_date=general.END_DATE_DEFAULT,
                  covid_file=general.COVID_FILE_DEFAULT, countries=general.COUNTRIES_DEFAULT,
                  window_size=dnm.WINDOW_SIZE_DEFAULT, correlation=general.CORRELATION_DEFAULT,
-                 cumulative_data=dnm.CUMULATIVE_DATA_DEFAULT, progress_bar=general.PROGRESS_BAR_DEFAULT):
+                 cumulative_data=dnm.CUMULATIVE_DATA_DEFAULT, progress_bar=general.PROGRESS_BAR_DEFAULT,
+                 executor=general.EXECUTOR_DEFAULT, workers=general.WORKERS_DEFAULT,
+                 keep_unmasked=general.KEEP_UNMASKED_DEFAULT):
         """
         Main constructor for the Class that receive all possible parameters.
 
@@ -59,6 +61,16 @@ class EWarningDNMDynamic(EWarningDNM):
         :param bool cumulative_data: Boolean that determines whether to use cumulative confirmed covid cases (True) over
             the time or new daily cases of confirmed covid cases (True).
         :param bool progress_bar: Boolean that determines whether a progress bar will be showing the progression.
+        :param string executor: Type of execution of the windows, which are split in chunks of consecutive dates to be
+            computed concurrently. List of possible executor values:
+                 - "serial": Sequential execution in the current process
+                 - "thread": Pool of threads
+                 - "process": Pool of processes
+                 - any other value: Sequential execution in the current process
+        :param int workers: Number of threads or processes of the pool. By default, the number of processors.
+        :param bool keep_unmasked: Boolean that determines whether to keep the networks before the product with the
+            adjacencies (class property networks_unmasked), which are needed by the method with_adjacencies(). It
+            doubles the memory used by the networks, and the space of the saved class.
 
         :raises:
             DateOutRangeException: If start_date is greater than end_date or the database doesn't contain it. If there
@@ -75,7 +87,8 @@ class EWarningDNMDynamic(EWarningDNM):
         static_adjacency = np.zeros(shape=(len(countries), len(countries)))
         super().__init__(start_date=start_date, end_date=end_date, covid_file=covid_file, countries=countries,
                          window_size=window_size, correlation=correlation, cumulative_data=cumulative_data,
-                         static_adjacency=static_adjacency, progress_bar=progress_bar)
+                         static_adjacency=static_adjacency, progress_bar=progress_bar, executor=executor,
+                         workers=workers, keep_unmasked=keep_unmasked)
 
 
     def generate_adjacencies_no_window(self, start_date_window):
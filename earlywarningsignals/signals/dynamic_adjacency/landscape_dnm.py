@@ -7,6 +7,7 @@ from datetime import timedelta
 from earlywarningsignals.signals import EWarningLDNM
 import earlywarningsignals.signals.general as general
 import earlywarningsignals.signals.dnm as dnm
+import earlywarningsignals.signals.landscape_dnm as landscape_dnm
 # Import adjacency matrices based on the flight frequency for the COUNTRIES_DEFAULT
 import earlywarningsignals.signals.flight_adjacencies as flight_adjacencies
 # Dedicated Exceptions for the Library
@@ -25,7 +26,9 @@ class EWarningLDNMDynamic(EWarningLDNM):
     def __init__(self, start_date=general.START_DATE_DEFAULT, end_date=general.END_DATE_DEFAULT,
                  covid_file=general.COVID_FILE_DEFAULT, countries=general.COUNTRIES_DEFAULT,
                  window_size=dnm.WINDOW_SIZE_DEFAULT, correlation=general.CORRELATION_DEFAULT,
-                 cumulative_data=dnm.CUMULATIVE_DATA_DEFAULT, progress_bar=general.PROGRESS_BAR_DEFAULT):
+                 cumulative_data=dnm.CUMULATIVE_DATA_DEFAULT, progress_bar=general.PROGRESS_BAR_DEFAULT,
+                 checkpoint_dir=None, checkpoint_interval=landscape_dnm.CHECKPOINT_INTERVAL_DEFAULT,
+                 keep_unmasked=general.KEEP_UNMASKED_DEFAULT):
         """
         Main constructor for the Class that receive all possible parameters.
 
@@ -58,6 +61,15 @@ class EWarningLDNMDynamic(EWarningLDNM):
         :param bool cumulative_data: Boolean that determines whether to use cumulative confirmed covid cases (True) over
             the time or new daily cases of confirmed covid cases (True).
         :param bool progress_bar: Boolean that determines whether a progress bar will be showing the progression.
+        :param string checkpoint_dir: Location of the folder where the networks and the L-DNM of the days already
+            calculated are periodically saved, in a subfolder named after the parameters of the class. If the subfolder
+            already exists when the networks are generated with the same parameters, those days are restored instead of
+            being calculated again. By default, there is no checkpoint.
+        :param int checkpoint_interval: Number of days calculated between two consecutive saves of the checkpoint, which
+            are stored in a new file each time.
+        :param bool keep_unmasked: Boolean that determines whether to keep the networks before the product with the
+            adjacencies (class property networks_unmasked), which are needed by the method with_adjacencies(). It
+            doubles the memory used by the networks, and the space of the saved class.
 
         :raises:
             DateOutRangeException: If start_date is greater than end_date or the database doesn't contain it. If there
@@ -74,7 +86,9 @@ class EWarningLDNMDynamic(EWarningLDNM):
         static_adjacency = np.zeros(shape=(len(countries), len(countries)))
         super().__init__(start_date=start_date, end_date=end_date, covid_file=covid_file, countries=countries,
                          window_size=window_size, correlation=correlation, cumulative_data=cumulative_data,
-                         static_adjacency=static_adjacency, progress_bar=progress_bar)
+                         static_adjacency=static_adjacency, progress_bar=progress_bar,
+                         checkpoint_dir=checkpoint_dir, checkpoint_interval=checkpoint_interval,
+                         keep_unmasked=keep_unmasked)
 
     def generate_adjacencies_no_window(self, start_date_window):
         """
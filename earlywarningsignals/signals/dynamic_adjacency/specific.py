@@ -26,7 +26,9 @@ class EWarningSpecificDynamic(EWarningSpecific):
                  covid_file=general.COVID_FILE_DEFAULT, countries=general.COUNTRIES_DEFAULT,
                  window_size=general.WINDOW_SIZE_DEFAULT, correlation=general.CORRELATION_DEFAULT,
                  threshold=specific.THRESHOLD_DEFAULT, cumulative_data=specific.CUMULATIVE_DATA_DEFAULT,
-                 square_root_data=specific.SQUARE_ROOT_DATA, progress_bar=general.PROGRESS_BAR_DEFAULT):
+                 square_root_data=specific.SQUARE_ROOT_DATA, progress_bar=general.PROGRESS_BAR_DEFAULT,
+                 unweighted_format=specific.UNWEIGHTED_FORMAT_DEFAULT, executor=general.EXECUTOR_DEFAULT,
+                 workers=general.WORKERS_DEFAULT, keep_unmasked=general.KEEP_UNMASKED_DEFAULT):
         """
         Main constructor for the Class that receive all possible parameters.
 
@@ -64,6 +66,21 @@ class EWarningSpecificDynamic(EWarningSpecific):
         :param bool square_root_data: Boolean that determines whether to apply the square root to each confirmed covid
             case value to smooth the results.
         :param bool progress_bar: Boolean that determines whether a progress bar will be showing the progression.
+        :param string unweighted_format: Storage format of the unweighted networks. List of possible values:
+                 - "int": Integer matrices, one integer for each edge flag.
+                 - "bool": Boolean matrices, one byte for each edge flag.
+                 - "packed": Bit-packed matrices along the last axis (numpy.packbits), one bit for each edge flag.
+                 - any other value: Integer matrices.
+        :param string executor: Type of execution of the windows, which are split in chunks of consecutive dates to be
+            computed concurrently. List of possible executor values:
+                 - "serial": Sequential execution in the current process
+                 - "thread": Pool of threads
+                 - "process": Pool of processes
+                 - any other value: Sequential execution in the current process
+        :param int workers: Number of threads or processes of the pool. By default, the number of processors.
+        :param bool keep_unmasked: Boolean that determines whether to keep the networks before the product with the
+            adjacencies (class property networks_unmasked), which are needed by the method with_adjacencies(). It
+            doubles the memory used by the networks, and the space of the saved class.
 
         :raises:
             DateOutRangeException: If start_date is greater than end_date or the database doesn't contain it. If there
@@ -81,7 +98,8 @@ class EWarningSpecificDynamic(EWarningSpecific):
         super().__init__(start_date=start_date, end_date=end_date, covid_file=covid_file, countries=countries,
                          window_size=window_size, correlation=correlation, static_adjacency=static_adjacency,
                          threshold=threshold, cumulative_data=cumulative_data, square_root_data=square_root_data,
-                         progress_bar=progress_bar)
+                         progress_bar=progress_bar, unweighted_format=unweighted_format, executor=executor,
+                         workers=workers, keep_unmasked=keep_unmasked)
 
     def generate_adjacencies(self, start_date_window):
         """
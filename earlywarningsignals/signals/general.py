@@ -9,13 +9,18 @@ from scipy import stats
 # Time and Progress Bar Libraries
 from tqdm import tqdm
 from datetime import timedelta
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
 # Generic Python Libraries
 import warnings
+import hashlib
 import pickle
 import sys
+import copy
 
 # All global variables of the Library
 from earlywarningsignals.__init__ import *
+# Vectorized correlation kernels
+import earlywarningsignals.signals.correlation as correlation
 # Dedicated Exceptions for the Library
 from earlywarningsignals.signals.exceptions import DateOutRangeException, CountryUndefinedException
 
@@ -30,8 +35,19 @@ WINDOW_SIZE_DEFAULT = 14
 CORRELATION_DEFAULT = 'pearson'
 STATIC_ADJACENCY_DEFAULT = np.ones((len(COUNTRIES_DEFAULT), len(COUNTRIES_DEFAULT)))
 np.fill_diagonal(STATIC_ADJACENCY_DEFAULT, 0)
+KEEP_UNMASKED_DEFAULT = False
+# Default Persistence Parameters
+CHUNK_DAYS_DEFAULT = 30
+METADATA_FILE = 'metadata.pkl'
+# Properties that don't change the results of the method check_windows()
+KEY_IGNORED_PROPERTIES = ['progress_bar', 'os_date_format', 'countries_info', 'networks_cache', 'checkpoint_dir',
+                          'checkpoint_interval', 'executor', 'workers']
 # Default Visualization Parameters
 PROGRESS_BAR_DEFAULT = True
+# Default Execution Parameters
+EXECUTOR_DEFAULT = 'serial'
+WORKERS_DEFAULT = None
+CHUNKS_PER_WORKER = 4
 
 
 class EWarningGeneral:
@@ -46,7 +62,8 @@ class EWarningGeneral:
                  covid_file=COVID_FILE_DEFAULT, countries=COUNTRIES_DEFAULT,
                  window_size=WINDOW_SIZE_DEFAULT, correlation=CORRELATION_DEFAULT,
                  static_adjacency=STATIC_ADJACENCY_DEFAULT,
-                 progress_bar=PROGRESS_BAR_DEFAULT):
+                 progress_bar=PROGRESS_BAR_DEFAULT, executor=EXECUTOR_DEFAULT, workers=WORKERS_DEFAULT,
+                 keep_unmasked=KEEP_UNMASKED_DEFAULT):
         """
         Main constructor for the Class that receive all possible parameters.
 
@@ -78,6 +95,16 @@ class EWarningGeneral:
                  - any other value: Pearson Correlation
         :param numpy [[float]] static_adjacency: Static adjacency for each graph.
         :param bool progress_bar: Boolean that determines whether a progress bar will be showing the progression.
+        :param string executor: Type of execution of the windows, which are split in chunks of consecutive dates to be
+            computed concurrently. List of possible executor values:
+                 - "serial": Sequential execution in the current process
+                 - "thread": Pool of threads
+                 - "process": Pool of processes
+                 - any other value: Sequential execution in the current process
+        :param int workers: Number of threads or processes of the pool. By default, the number of processors.
+        :param bool keep_unmasked: Boolean that determines whether to keep the networks before the product with the
+            adjacencies (class property networks_unmasked), which are needed by the method with_adjacencies(). It
+            doubles the memory used by the networks, and the space of the saved class.
 
         :raises:
             DateOutRangeException: If start_date is greater than end_date or the database doesn't contain it. If there
@@ -89,13 +116,18 @@ class EWarningGeneral:
         self.start_date = start_date
         self.end_date = end_date
         self.countries = sorted(set(countries))  # Sorted list without repetitions
+        self.countries_index = {country: i for i, country in enumerate(self.countries)}  # Row of each country
         self.window_size = window_size
         self.correlation = correlation
         self.static_adjacency = static_adjacency
+        self.keep_unmasked = keep_unmasked
 
         self.progress_bar = progress_bar
+        self.executor = executor
+        self.workers = workers
 
         self.networks = None
+        self.networks_unmasked = None
         self.adjacencies = None
         self.data_dataframe = None
         self.data_original = None
@@ -234,7 +266,8 @@ class EWarningGeneral:
             self.adjacencies = self.generate_adjacencies(start_date_window)
             self.networks = self.generate_networks(start_date_window)
             self.start_date += timedelta(self.window_size - 1 - rest_days)
-        self.networks = np.multiply(self.networks, self.adjacencies)
+        self.networks_unmasked = self.networks if self.keep_unmasked else None
+        self.networks = self.mask_networks(self.networks)
 
     def calculate_correlation(self, x, y):
         """
@@ -297,25 +330,287 @@ class EWarningGeneral:
         :return: List of the correlation matrices for each temporal instant from the start date to the end date.
         :rtype: numpy [[[float]]]
         """
-        networks = []
-        i = 0
-        if self.progress_bar:
-            pbar = tqdm(total=((self.end_date + timedelta(days=2)) -
-                               (start_date_window + timedelta(days=self.window_size))).days)
-            while start_date_window + timedelta(days=self.window_size) <= self.end_date + timedelta(days=1):
-                # print(window)
-                networks.append(self.window_to_network(self.data[:, i:i + self.window_size]))
-                start_date_window += timedelta(days=1)
-                i += 1
-                pbar.update(1)
-            pbar.close()
+        days = ((self.end_date + timedelta(days=2)) - (start_date_window + timedelta(days=self.window_size))).days
+        return self.execute_windows(self.window_networks, days)
+
+    def window_networks(self, start, stop):
+        """
+        Generates the networks of a chunk of consecutive instants of study, as in the method generate_networks().
+
+        :param int start: Position of the first instant of study of the chunk.
+        :param int stop: Position following the last instant of study of the chunk.
+
+        :return: List of the correlation matrices for each temporal instant of the chunk.
+        :rtype: [numpy [[float]]]
+        """
+        return [self.window_to_network(self.data[:, i:i + self.window_size]) for i in range(start, stop)]
+
+    def execute_windows(self, function, days):
+        """
+        Splits the instants of study in chunks of consecutive dates and generates the networks of each chunk with the
+        executor of the class (sequentially, with a pool of threads or with a pool of processes). The networks of the
+        chunks are merged in order, so the result doesn't depend on the executor. The progress bar is updated each time
+        a chunk finishes.
+
+        :param function function: Function that receives the positions of the first instant and the one following the
+            last instant of a chunk, and returns the list of their networks. With a pool of processes it must be
+            serializable, as the methods of the class.
+        :param int days: Number of instants of study.
+
+        :return: List of the networks for each temporal instant from the start date to the end date.
+        :rtype: numpy [[[float]]]
+        """
+        if self.executor == 'thread':
+            pool = ThreadPoolExecutor(self.workers)
+        elif self.executor == 'process':
+            pool = ProcessPoolExecutor(self.workers)
+        else:
+            pool = None
+        workers = self.workers or os.cpu_count() or 1
+        chunk_size = max(1, -(-days // (workers * CHUNKS_PER_WORKER))) if pool is not None else 1
+        chunks = [(start, min(start + chunk_size, days)) for start in range(0, days, chunk_size)]
+        results = [None] * len(chunks)
+        pbar = tqdm(total=days) if self.progress_bar else None
+
+        if pool is None:
+            for k, (start, stop) in enumerate(chunks):
+                results[k] = function(start, stop)
+                if pbar is not None:
+                    pbar.update(stop - start)
         else:
-            while start_date_window + timedelta(days=self.window_size) <= self.end_date + timedelta(days=1):
-                # print(window)
-                networks.append(self.window_to_network(self.data[:, i:i + self.window_size]))
-                start_date_window += timedelta(days=1)
-                i += 1
-        return np.array(networks)
+            with pool:
+                futures = {pool.submit(function, start, stop): k for k, (start, stop) in enumerate(chunks)}
+                for future in as_completed(futures):
+                    results[futures[future]] = future.result()
+                    if pbar is not None:
+                        pbar.update(len(results[futures[future]]))
+
+        if pbar is not None:
+            pbar.close()
+        return np.array([network for result in results for network in result])
+
+    def windows_to_networks(self, data):
+        """
+        Vectorized equivalent of the method generate_networks() followed by the product with the adjacencies, which
+        computes the networks of every window of the data at once. It accepts a batch of data with the same shape as
+        the class property data, for example to evaluate the networks of alternative versions of the data.
+
+        :param numpy [[float]] data: Transformed data with the same shape as the class property data. Any number of
+            leading axes is accepted.
+
+        :return: List of the networks for each temporal instant from the start date to the end date, with the same
+            leading axes as the data.
+        :rtype: numpy [[[float]]]
+        """
+        return self.networks_from_windows(correlation.sliding_windows(data, self.window_size))
+
+    def networks_from_windows(self, windows):
+        """
+        Generates the networks from the windows of the data, with one window for each instant of study as in the
+        method generate_networks(). The values of each window don't need to be consecutive dates of the data, so it
+        can also be used with resampled windows.
+
+        :param numpy [[[float]]] windows: Windows of the data with shape (..., windows, countries, window_size).
+
+        :return: List of the networks for each temporal instant from the start date to the end date, with the same
+            leading axes as the windows.
+        :rtype: numpy [[[float]]]
+        """
+        return self.networks_from_statistics(correlation.correlation_matrices(windows, self.correlation), None)
+
+    def networks_from_statistics(self, correlations, deviations):
+        """
+        Generates the networks from the correlation matrices of the windows, with one window for each instant of study,
+        followed by the product with the adjacencies.
+
+        :param numpy [[[float]]] correlations: Correlation matrices with shape (..., windows, countries, countries).
+        :param numpy [[float]] deviations: Standard deviations with shape (..., windows, countries). In this case they
+            are not needed, so they will be ignored.
+
+        :return: List of the networks for each temporal instant from the start date to the end date.
+        :rtype: numpy [[[float]]]
+        """
+        return self.mask_networks(correlations)
+
+    def networks_at(self, positions):
+        """
+        Generates the networks of some instants of study only, with the vectorized kernels, so the networks of the
+        rest of instants aren't computed. Each network is equal to the one of the same instant obtained with the method
+        check_windows(). The data and the adjacencies must be already imported and transformed.
+
+        :param [int] positions: Positions of the instants of study, where 0 is the first date of the networks.
+
+        :return: List of the networks for each of the given instants of study.
+        :rtype: numpy [[[float]]]
+
+        :raises:
+            ValueError: If the window size is zero.
+        """
+        if not self.window_size:
+            raise ValueError('The networks of some instants of study require a <window_size> greater than zero.')
+        positions = np.asarray(positions, dtype=int)
+        ew = copy.copy(self)
+        ew.adjacencies = np.asarray(self.adjacencies)[positions]
+        windows = correlation.sliding_windows(np.asarray(self.data, dtype=float), self.window_size)
+        return ew.networks_from_windows(windows[positions])
+
+    def positions_adjacencies(self, positions):
+        """
+        Gives the adjacencies of some instants of study only.
+
+        :param [int] positions: Positions of the instants of study, where 0 is the first date of the networks.
+
+        :return: List of the adjacency matrices for each of the given instants of study.
+        :rtype: numpy [[[float]]]
+        """
+        return np.asarray(self.adjacencies)[np.asarray(positions, dtype=int)]
+
+    def with_positions(self, positions, networks=None):
+        """
+        Generates a shallow copy of the class restricted to some instants of study, with their adjacencies and their
+        networks, so the early warning signals of the copy are the ones of the class at those instants. The data and
+        the adjacencies must be already imported and transformed.
+
+        :param [int] positions: Positions of the instants of study in chronological order, where 0 is the first date
+            of the networks.
+        :param numpy [[[float]]] networks: Networks of the given instants of study, if they are already computed. By
+            default, they are generated with the method networks_at().
+
+        :return: Copy of the class restricted to the given instants of study.
+        :rtype: EWarningGeneral
+
+        :raises:
+            ValueError: If the window size is zero.
+        """
+        networks = self.networks_at(positions) if networks is None else networks
+        ew = copy.copy(self)
+        ew.adjacencies = self.positions_adjacencies(positions)
+        ew.networks_unmasked = None
+        return ew.with_networks(networks)
+
+    def with_networks(self, networks):
+        """
+        Generates a shallow copy of the class with a different list of networks, which can be used to calculate the
+        early warning signals of those networks without modifying the original instance.
+
+        :param numpy [[[float]]] networks: List of the networks for each temporal instant from the start date to the
+            end date, with the same shape as the class property networks.
+
+        :return: Copy of the class with the new networks.
+        :rtype: EWarningGeneral
+        """
+        ew = copy.copy(self)
+        ew.networks = networks
+        return ew
+
+    def mask_networks(self, networks):
+        """
+        Applies the adjacencies of the class to the networks generated before masking them, as in the method
+        check_windows().
+
+        :param numpy [[[float]]] networks: List of the networks for each temporal instant from the start date to the
+            end date, without the product with the adjacencies.
+
+        :return: List of the networks multiplied by the adjacency of each temporal instant.
+        :rtype: numpy [[[float]]]
+        """
+        return np.multiply(networks, self.adjacencies)
+
+    def with_adjacencies(self, adjacencies):
+        """
+        Generates a shallow copy of the class with a different list of adjacencies, whose networks are obtained from
+        the networks of the class before masking them (class property networks_unmasked), without calculating any
+        correlation again. It can be used to compare several adjacency schemes, for example static and dynamic
+        adjacencies, or scenarios of travel restrictions.
+
+        :param numpy [[[float]]] adjacencies: List of the adjacency matrices for each temporal instant, with the same
+            shape as the class property adjacencies.
+
+        :return: Copy of the class with the new adjacencies and networks.
+        :rtype: EWarningGeneral
+
+        :raises:
+            ValueError: If the networks before masking them aren't available, because the class wasn't constructed
+                with keep_unmasked or the method check_windows() hasn't been called yet.
+        """
+        if getattr(self, 'networks_unmasked', None) is None:
+            raise ValueError('The unmasked networks are not available, the class must be constructed with '
+                             '<keep_unmasked> and <check_windows()> must be called first.')
+        ew = copy.copy(self)
+        ew.adjacencies = np.asarray(adjacencies)
+        return ew.with_networks(ew.mask_networks(self.networks_unmasked))
+
+    def restricted_adjacencies(self, countries, start_date=None, end_date=None, factor=0):
+        """
+        Generates a copy of the adjacencies of the class for a scenario of travel restrictions, where the edges of the
+        selected countries are multiplied by a factor between the given dates. The result can be applied with the
+        method with_adjacencies().
+
+        :param [string] countries: List of the restricted countries in the ISO-3166-Alpha2 format.
+        :param pandas datetime start_date: First date of the restrictions. By default, the start date of the class.
+        :param pandas datetime end_date: Last date of the restrictions. By default, the end date of the class.
+        :param float factor: Factor applied to the edges of the restricted countries, where 0 removes the edges.
+
+        :return: List of the adjacency matrices for each temporal instant with the restrictions.
+        :rtype: numpy [[[float]]]
+
+        :raises:
+            CountryUndefinedException: If any country isn't contained in the class.
+            ValueError: If start_date is greater than end_date.
+        """
+        if not set(countries).issubset(self.countries_index):
+            raise CountryUndefinedException('Some ISO-3166-Alpha2 references for the restrictions are incorrect or not '
+                                            'established in the Class.')
+        start_date = self.start_date if start_date is None else start_date
+        end_date = self.end_date if end_date is None else end_date
+        if start_date > end_date:
+            raise ValueError('The <start_date> of the restrictions must not be greater than their <end_date>.')
+        # The last adjacency always corresponds to the end date, and dates out of the adjacencies restrict nothing
+        length = len(self.adjacencies)
+        first = min(max(length - 1 - (self.end_date - start_date).days, 0), length)
+        stop = min(max(length - (self.end_date - end_date).days, 0), length)
+        rows = [self.countries_index[country] for country in countries]
+
+        adjacencies = np.array(self.adjacencies, dtype=float)
+        adjacencies[first:stop, rows, :] *= factor
+        adjacencies[first:stop, :, rows] *= factor
+        return adjacencies
+
+    def with_countries(self, countries):
+        """
+        Generates a shallow copy of the class restricted to a subset of its countries, where the rows and columns of
+        the rest of countries are removed from the data, the adjacencies and the networks. As each edge only depends on
+        its pair of countries, the networks are the same as the ones of a class constructed with only those countries,
+        without calculating any correlation again.
+
+        :param [string] countries: List of countries of the subset in the ISO-3166-Alpha2 format.
+
+        :return: Copy of the class restricted to the subset of countries.
+        :rtype: EWarningGeneral
+
+        :raises:
+            CountryUndefinedException: If there are less than two selected countries. If any country isn't contained
+                in the class.
+        """
+        countries = sorted(set(countries))
+        if len(countries) < 2 or not set(countries).issubset(self.countries_index):
+            raise CountryUndefinedException('The subset must contain at least two different ISO-3166-Alpha2 country '
+                                            'references established in the Class.')
+        rows = np.array([self.countries_index[country] for country in countries])
+
+        ew = copy.copy(self)
+        ew.countries = countries
+        ew.countries_index = {country: i for i, country in enumerate(countries)}
+        ew.static_adjacency = self.static_adjacency[np.ix_(rows, rows)]
+        ew.data_dataframe = self.data_dataframe.iloc[rows].reset_index(drop=True)
+        if self.networks is not None:
+            ew.data_original = self.data_original[rows]
+            ew.data = self.data[rows]
+            ew.adjacencies = self.adjacencies[:, rows][:, :, rows]
+            ew.networks = self.networks[:, rows][:, :, rows]
+        if getattr(self, 'networks_unmasked', None) is not None:
+            ew.networks_unmasked = self.networks_unmasked[:, rows][:, :, rows]
+        return ew
 
     def generate_adjacencies(self, start_date_window):
         """
@@ -337,34 +632,267 @@ class EWarningGeneral:
             day += timedelta(days=1)
         return np.array(adjacencies)
 
-    def save(self, name):
+    def time_axes(self):
         """
-        Generate and save a serialization of the constructed class with all its data to be recovered any time in the
-        future.
+        Gives the array properties of the class that contain one element for each date, together with the axis of the
+        dates. The last element of each of them always corresponds to the end date, which allows to read any interval
+        of dates from the saved arrays.
 
-        :param string name: Destination path of the serializable object to be saved.
+        :return: Dictionary with the name of each property as key and the axis of its dates as value.
+        :rtype: {string: int}
         """
-        with open(name, 'wb') as f:
-            pickle.dump(self, f)
+        return {'data_original': 1, 'data': 1, 'adjacencies': 0, 'networks': 0, 'networks_unmasked': 0}
+
+    def parameters_key(self):
+        """
+        Generates the key of the results of the method check_windows() of the class, as a hash of the name of the class,
+        the data imported from the covid file and every parameter of the class (dates, countries, window size,
+        correlation, transformations of the data, adjacency...). Two classes with the same key obtain the same results.
+
+        :return: Hexadecimal SHA-256 hash of the class.
+        :rtype: string
+        """
+        outputs = self.time_axes()
+        digest = hashlib.sha256(f'{type(self).__module__}.{type(self).__qualname__}'.encode())
+        for attribute, value in sorted(vars(self).items()):
+            if attribute in KEY_IGNORED_PROPERTIES or attribute in outputs:
+                continue
+            digest.update(attribute.encode())
+            if isinstance(value, pd.DataFrame):
+                digest.update(str(list(value.columns)).encode())
+                digest.update(pd.util.hash_pandas_object(value, index=False).to_numpy().tobytes())
+            elif isinstance(value, np.ndarray):
+                digest.update(f'{value.shape}{value.dtype}'.encode())
+                digest.update(np.ascontiguousarray(value).tobytes())
+            else:
+                digest.update(repr(value).encode())
+        return digest.hexdigest()
+
+    def save(self, name, compress=False, chunk_days=CHUNK_DAYS_DEFAULT):
+        """
+        Saves the constructed class with all its data to be recovered any time in the future. The destination is a
+        folder that contains a small serialization of the class without its arrays (metadata), and each array
+        containing one element for each date (as given by the method time_axes()) in its own binary file. This allows to
+        load the arrays memory-mapped or to read only an interval of dates, without deserializing the whole class.
+
+        :param string name: Destination path of the folder to be saved.
+        :param boolean compress: If True, the arrays are compressed and split in chunks of dates, so only the chunks
+            of the desired dates have to be read. Compressed arrays can not be memory-mapped.
+        :param int chunk_days: Number of dates of each chunk of the compressed arrays.
+        """
+        os.makedirs(name, exist_ok=True)
+        metadata = copy.copy(self)
+        arrays = {}
+        for attribute, axis in self.time_axes().items():
+            array = getattr(self, attribute, None)
+            if not isinstance(array, np.ndarray):
+                continue
+            setattr(metadata, attribute, None)
+            length = array.shape[axis]
+            chunks = [(start, min(start + chunk_days, length)) for start in range(0, length, chunk_days)] \
+                if compress else None
+            arrays[attribute] = {'axis': axis, 'length': length, 'chunks': chunks}
+            if compress:
+                for i, (start, stop) in enumerate(chunks):
+                    np.savez_compressed(os.path.join(name, f'{attribute}_{i}.npz'),
+                                        array=np.take(array, range(start, stop), axis=axis))
+            else:
+                np.save(os.path.join(name, f'{attribute}.npy'), array)
+
+        with open(os.path.join(name, METADATA_FILE), 'wb') as f:
+            pickle.dump({'class': metadata, 'arrays': arrays}, f)
 
     @staticmethod
-    def load(name):
+    def load_array(name, attribute, info, front, back, mmap=False):
         """
-        Generate the corresponding Python Class object from a serializable file.
+        Reads one of the arrays saved with the method save(), without the given number of elements at the beginning
+        and at the end of the axis of the dates.
+
+        :param string name: Location path of the saved folder.
+        :param string attribute: Name of the property of the array.
+        :param dict info: Information of the array stored in the metadata (axis of the dates, length and chunks).
+        :param int front: Number of elements to skip at the beginning of the axis of the dates.
+        :param int back: Number of elements to skip at the end of the axis of the dates.
+        :param boolean mmap: If True, an uncompressed array is returned memory-mapped (read only) instead of being
+            read into memory.
+
+        :return: The requested part of the array.
+        :rtype: numpy [[float]]
+        """
+        axis, stop = info['axis'], info['length'] - back
+        if info['chunks'] is None:
+            array = np.load(os.path.join(name, f'{attribute}.npy'), mmap_mode='r')
+            array = array[(slice(None),) * axis + (slice(front, stop),)]
+            return array if mmap else np.array(array)
+
+        parts = []
+        for i, (chunk_start, chunk_stop) in enumerate(info['chunks']):
+            if chunk_stop > front and chunk_start < stop:
+                with np.load(os.path.join(name, f'{attribute}_{i}.npz')) as f:
+                    part = f['array']
+                parts.append(np.take(part, range(max(front, chunk_start) - chunk_start,
+                                                 min(stop, chunk_stop) - chunk_start), axis=axis))
+        return np.concatenate(parts, axis=axis)
+
+    @staticmethod
+    def load(name, start_date=None, end_date=None, mmap=False):
+        """
+        Generate the corresponding Python Class object from a folder saved with the method save(), or from a
+        serializable file of the previous versions of the library. When an interval of dates is given, only the
+        corresponding part of each array is read, and the start date and end date of the class are updated. The data
+        keeps the dates previous to the new start date required by the windows.
+
+        :param string name: Location path of the saved folder (or serializable file) to be transformed back into a
+            Python Class object.
+        :param pandas datetime start_date: First date to be read. By default, the start date of the saved class.
+        :param pandas datetime end_date: Last date to be read. By default, the end date of the saved class.
+        :param boolean mmap: If True, the uncompressed arrays are memory-mapped (read only) instead of being read into
+            memory.
+
+        :return: The new constructed class obtained form the saved folder.
+
+        :raises:
+            DateOutRangeException: If the interval of dates isn't contained in the dates of the saved class.
+        """
+        if os.path.isfile(name):
+            with open(name, 'rb') as f:
+                return pickle.load(f)
+
+        with open(os.path.join(name, METADATA_FILE), 'rb') as f:
+            metadata = pickle.load(f)
+        ew = metadata['class']
+        start_date = ew.start_date if start_date is None else start_date
+        end_date = ew.end_date if end_date is None else end_date
+        if start_date > end_date or start_date < ew.start_date or end_date > ew.end_date:
+            raise DateOutRangeException(f'Dates out of range. [{ew.start_date.date()} , {ew.end_date.date()}]')
+
+        front, back = (start_date - ew.start_date).days, (ew.end_date - end_date).days
+        for attribute, info in metadata['arrays'].items():
+            # Without window size the windows grow from the first date, so the data keeps all of them
+            array_front = 0 if not ew.window_size and attribute in ('data_original', 'data') else front
+            setattr(ew, attribute, EWarningGeneral.load_array(name, attribute, info, array_front, back, mmap))
+        ew.start_date, ew.end_date = start_date, end_date
+        return ew
 
-        :param string name: Location path of the serializable object to be transformed back into a Python Class object.
+    @staticmethod
+    def adjacency_spectrum(networks):
+        """
+        Calculates the eigenvalues of the adjacency matrix of every network at once. The networks are symmetrized
+        averaging each pair of opposite edges, so all the eigenvalues are real.
 
-        :return: The new constructed class obtained form the serializable object.
+        :param numpy [[[float]]] networks: List of the matrices of the networks, one for each instant of study.
+
+        :return: Matrix where each Row represents an instant of study and each Column contains one of the eigenvalues
+            of its network, sorted in ascending order.
+        :rtype: numpy [[float]]
         """
-        with open(name, 'rb') as f:
-            return pickle.load(f)
+        networks = np.array(networks, dtype=float)
+        return np.linalg.eigvalsh((networks + networks.transpose(0, 2, 1)) / 2)
+
+    @staticmethod
+    def laplacian_spectrum(networks):
+        """
+        Calculates the eigenvalues of the Laplacian matrix (degree matrix minus adjacency matrix) of every network at
+        once. The networks are symmetrized averaging each pair of opposite edges, so all the eigenvalues are real.
+
+        :param numpy [[[float]]] networks: List of the matrices of the networks, one for each instant of study.
+
+        :return: Matrix where each Row represents an instant of study and each Column contains one of the eigenvalues
+            of the Laplacian of its network, sorted in ascending order.
+        :rtype: numpy [[float]]
+        """
+        networks = np.array(networks, dtype=float)
+        networks = (networks + networks.transpose(0, 2, 1)) / 2
+        laplacians = -networks
+        diagonal = np.arange(networks.shape[1])
+        laplacians[:, diagonal, diagonal] += networks.sum(axis=2)
+        return np.linalg.eigvalsh(laplacians)
+
+    def spectral_networks(self, weighted=True):
+        """
+        Obtains the networks used by the spectral early warning signals. The general classes only have weighted
+        networks, so they are always used.
+
+        :param bool weighted: Boolean that determines whether to use the weighted networks (True) or the unweighted
+            networks, in the specializations that have them (False).
+
+        :return: List of the matrices of the networks for each instant of study.
+        :rtype: numpy [[[float]]]
+        """
+        return self.networks
+
+    def leading_eigenvalue(self, weighted=True):
+        """
+        Calculates the early warning signals based on the leading eigenvalue (the largest one) of the adjacency matrix
+        of the network. The eigenvalues of all the networks are obtained with a single batched decomposition.
+
+        :param bool weighted: Boolean that determines whether to use the weighted networks (True) or the unweighted
+            networks, as described in the method spectral_networks().
+
+        :return: List of all the values of the leading eigenvalue of each network between the established dates.
+        :rtype: numpy [float]
+        """
+        return self.adjacency_spectrum(self.spectral_networks(weighted))[:, -1]
+
+    def spectral_gap(self, weighted=True):
+        """
+        Calculates the early warning signals based on the spectral gap of the network, the difference between the two
+        largest eigenvalues of its adjacency matrix.
+
+        :param bool weighted: Boolean that determines whether to use the weighted networks (True) or the unweighted
+            networks, as described in the method spectral_networks().
+
+        :return: List of all the values of the spectral gap of each network between the established dates.
+        :rtype: numpy [float]
+        """
+        spectrum = self.adjacency_spectrum(self.spectral_networks(weighted))
+        return spectrum[:, -1] - spectrum[:, -2]
+
+    def algebraic_connectivity(self, weighted=True):
+        """
+        Calculates the early warning signals based on the algebraic connectivity of the network, the second smallest
+        eigenvalue of its Laplacian matrix. For networks without negative weights (as the DNM networks or the
+        unweighted networks) it is zero whenever the network is disconnected. The correlation networks may have
+        negative weights, so their Laplacian can have negative eigenvalues and that property doesn't hold.
+
+        :param bool weighted: Boolean that determines whether to use the weighted networks (True) or the unweighted
+            networks, as described in the method spectral_networks().
+
+        :return: List of all the values of the algebraic connectivity of each network between the established dates.
+        :rtype: numpy [float]
+        """
+        return self.laplacian_spectrum(self.spectral_networks(weighted))[:, 1]
+
+    @staticmethod
+    def fold_change_origins(series, step):
+        """
+        Generates for each sample of the time series the previous samples to which it must be compared by the fold
+        change measures, so all the comparisons can be made at once. The samples at the last step positions are never
+        used as origin of a comparison.
+
+        :param numpy [float] series: Time series, or matrix of time series where each Row represents a time series.
+        :param int step: Number of samples from the original one to be compared.
+
+        :return: The previous samples of each sample, with an additional last axis of size step where the position c
+            contains the sample step - c positions before, and a boolean array with the same shape which indicates the
+            positions that correspond to a valid origin of a comparison.
+        :rtype: (numpy [[float]], numpy [[bool]])
+        """
+        length = series.shape[-1]
+        padding = np.zeros(series.shape[:-1] + (step,), dtype=series.dtype)
+        origins = np.lib.stride_tricks.sliding_window_view(np.concatenate((padding, series), axis=-1), step,
+                                                           axis=-1)[..., :length, :]
+        positions = np.arange(length)[:, np.newaxis] - step + np.arange(step)
+        valid = (positions >= 0) & (positions < length - step)
+        return origins, valid
 
     @staticmethod
     def k_fold_changes(series, k_fold, step=1):
         """
         Generates the tipping points of a time series based on fold change. This measure established a tipping point if
         a value increments k_fold times from one sample to the next one. Instead of using the default measure, it has
-        been upgraded to compare one sample to the following ones based on a step parameter.
+        been upgraded to compare one sample to the following ones based on a step parameter. All the comparisons are
+        made at once, and if series is a matrix, each Row is treated as an independent time series.
 
         :param numpy [float] series: Time series for finding the tipping points.
         :param float k_fold: Quantity of change between one sample and the next one.
@@ -374,14 +902,13 @@ class EWarningGeneral:
             points which have 1.
         :rtype: numpy [int]
         """
-        tipping_points = np.zeros(series.shape)
+        series = np.asarray(series)
+        if step < 1:
+            return np.zeros(series.shape)
 
-        for i in range(len(series) - step):
-            for j in range(1, step + 1):
-                if series[i + j] > k_fold * series[i] and series[i] != 0:
-                    tipping_points[i + j] = 1
-
-        return tipping_points
+        origins, valid = EWarningGeneral.fold_change_origins(series, step)
+        fold_changes = (series[..., np.newaxis] > k_fold * origins) & (origins != 0) & valid
+        return np.any(fold_changes, axis=-1).astype(float)
 
     @staticmethod
     def k_fold_changes_multiple(series, k_fold, step=1, rate_compare=0.8):
@@ -391,7 +918,7 @@ class EWarningGeneral:
         Instead of using the default measure, it has been upgraded to compare one sample to the following ones
         based on a step parameter. Additionally, to be less strict in case of a comparison between a large amount of
         time series it also incorporates a rate_compare parameter to determine the minimum number of time series that
-        satisfies the measure.
+        satisfies the measure. All the comparisons are made at once, and a single time series is also accepted.
 
         :param numpy [[float]] series: The group of time series for finding the tipping points. All must have same size.
         :param float k_fold: Quantity of change between one sample and the next one.
@@ -402,15 +929,55 @@ class EWarningGeneral:
             points which have 1.
         :rtype: numpy [int]
         """
-        intervale_size = series.shape[1]
-        tipping_points = np.zeros(intervale_size)
-        series_transposed = series.transpose()
+        series = np.atleast_2d(np.asarray(series))
+        if step < 1:
+            return np.zeros(series.shape[1])
 
-        for i in range(intervale_size - step):
-            for j in range(1, step + 1):
-                if (sum(series_transposed[i + j] > k_fold * series_transposed[i]) / len(series_transposed[i])
-                        >= rate_compare)\
-                   and sum(series_transposed[i] != 0) / len(series_transposed[i]) >= rate_compare:
-                    tipping_points[i + j] = 1
+        origins, valid = EWarningGeneral.fold_change_origins(series, step)
+        rate_greater = np.count_nonzero(series[..., np.newaxis] > k_fold * origins, axis=0) / series.shape[0]
+        rate_non_zero = np.count_nonzero(origins != 0, axis=0) / series.shape[0]
+        fold_changes = (rate_greater >= rate_compare) & (rate_non_zero >= rate_compare) & valid
+        return np.any(fold_changes, axis=-1).astype(float)
 
-        return tipping_points
+    @staticmethod
+    def k_fold_changes_grid(series, k_folds, steps, rates_compare=(0.8,)):
+        """
+        Generates the tipping points of the method k_fold_changes_multiple() for every combination of the values of
+        k_fold, step and rate_compare at once, so a whole grid of parameters can be evaluated without looping over it.
+        The comparisons of the largest step are made once and shared by all the combinations.
+
+        :param numpy [[float]] series: The group of time series for finding the tipping points. All must have same size.
+            A single time series is also accepted.
+        :param [float] k_folds: List of quantities of change between one sample and the next one.
+        :param [int] steps: List of numbers of samples from the original one to be compared.
+        :param [float] rates_compare: List of minimum percentages of time series to fulfill the fold change measure.
+
+        :return: A numpy array of shape (len(k_folds), len(steps), len(rates_compare), length of the time series) with
+            the tipping points of each combination, filled with 0 except the tipping points which have 1, and a numpy
+            array of shape (len(k_folds), len(steps), len(rates_compare)) with the number of tipping points of each
+            combination.
+        :rtype: (numpy [[[[int]]]], numpy [[[int]]])
+        """
+        series = np.atleast_2d(np.asarray(series))
+        k_folds = np.asarray(k_folds, dtype=float)
+        steps = np.asarray(steps, dtype=int)
+        rates_compare = np.asarray(rates_compare, dtype=float)
+        length = series.shape[1]
+        step_max = max(int(steps.max()), 1)
+
+        origins, _ = EWarningGeneral.fold_change_origins(series, step_max)
+        k_fold_origins = k_folds[:, np.newaxis, np.newaxis, np.newaxis] * origins
+        rate_greater = np.count_nonzero(series[np.newaxis, :, :, np.newaxis] > k_fold_origins, axis=1) / series.shape[0]
+        rate_non_zero = np.count_nonzero(origins != 0, axis=0) / series.shape[0]
+
+        # Lag of each comparison and position of its origin, for every step
+        lags = step_max - np.arange(step_max)
+        positions = np.arange(length)[:, np.newaxis] - lags
+        valid = (lags <= steps[:, np.newaxis, np.newaxis]) & (positions >= 0) & \
+                (positions < length - steps[:, np.newaxis, np.newaxis])
+
+        rates = rates_compare[:, np.newaxis, np.newaxis]
+        fold_changes = (rate_greater[:, np.newaxis, np.newaxis] >= rates) & (rate_non_zero >= rates) & \
+            valid[np.newaxis, :, np.newaxis]
+        tipping_points = np.any(fold_changes, axis=-1).astype(float)
+        return tipping_points, np.count_nonzero(tipping_points, axis=-1)
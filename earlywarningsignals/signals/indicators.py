@@ -0,0 +1,81 @@
+# Data Structures and basic Algorithms Libraries
+import numpy as np
+
+# Default Parameters
+INDICATORS_DEFAULT = ['variance', 'autocorrelation', 'skewness', 'coefficient_variation']
+
+
+def window_indicators(windows, indicators=INDICATORS_DEFAULT):
+    """
+    Computes the classic indicators of critical slowing down of a group of windows at once, where the last axis
+    contains the dates of each window. Undefined values (for example the skewness of a constant window) are NaN.
+
+    :param numpy [[[float]]] windows: Windows of the data with shape (..., window_size), for example a strided view
+        with shape (countries, windows, window_size).
+    :param [string] indicators: List of the indicators to be calculated. List of possible values:
+             - "variance": Sample variance of the window.
+             - "autocorrelation": Lag-1 autocorrelation, the correlation between each date and the next one.
+             - "skewness": Skewness of the window (biased, as scipy.stats.skew).
+             - "coefficient_variation": Sample standard deviation divided by the mean of the window.
+
+    :return: Dictionary with the name of each indicator as key, and as value an array with the value of the
+        indicator for each window, with the shape of the windows without its last axis.
+    :rtype: {string: numpy [[float]]}
+    """
+    windows = np.asarray(windows, dtype=float)
+    size = windows.shape[-1]
+    constant = np.all(windows == windows[..., :1], axis=-1)
+    mean = windows.mean(axis=-1)
+    deviations = windows - mean[..., np.newaxis]
+    m2 = np.where(constant, 0, np.mean(deviations ** 2, axis=-1))
+    results = {}
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        variance = m2 * size / (size - 1) if size > 1 else np.full(mean.shape, np.nan)
+        if 'variance' in indicators:
+            results['variance'] = variance
+        if 'coefficient_variation' in indicators:
+            results['coefficient_variation'] = np.sqrt(variance) / mean
+        if 'skewness' in indicators:
+            results['skewness'] = np.where(constant, np.nan, np.mean(deviations ** 3, axis=-1) / m2 ** 1.5)
+        if 'autocorrelation' in indicators:
+            # Correlation between the dates x[:-1] and the following ones x[1:] of each window
+            x, y = windows[..., :-1], windows[..., 1:]
+            x_constant = np.all(x == x[..., :1], axis=-1) if size > 1 else np.ones(mean.shape, dtype=bool)
+            y_constant = np.all(y == y[..., :1], axis=-1) if size > 1 else np.ones(mean.shape, dtype=bool)
+            x = x - x.mean(axis=-1, keepdims=True)
+            y = y - y.mean(axis=-1, keepdims=True)
+            autocorrelation = np.sum(x * y, axis=-1) / np.sqrt(np.sum(x ** 2, axis=-1) * np.sum(y ** 2, axis=-1))
+            results['autocorrelation'] = np.where(x_constant | y_constant | (size < 3), np.nan,
+                                                  np.clip(autocorrelation, -1, 1))
+
+    return {indicator: results[indicator] for indicator in indicators}
+
+
+def critical_slowing_down(ew, indicators=INDICATORS_DEFAULT):
+    """
+    Computes the classic indicators of critical slowing down of every country over the class property data, with one
+    window for each network of the class. Each window ends at the date of its network and has the same size as the
+    windows used by the method check_windows(), so all of them are obtained at once from a strided view of the data.
+    In case that the window size is fixed to 0 (EWarningDNM), the windows grow from the first date and each one is
+    computed separately.
+
+    :param EWarningGeneral ew: Instance of any of the classes of the library, whose method check_windows() has already
+        been called.
+    :param [string] indicators: List of the indicators to be calculated, as described in the function
+        window_indicators().
+
+    :return: Dictionary with the name of each indicator as key, and as value a matrix where each Row represents a
+        country and each Column contains the value of the indicator for each instant of study between the established
+        dates.
+    :rtype: {string: numpy [[float]]}
+    """
+    data = np.asarray(ew.data, dtype=float)
+    days = len(ew.networks)
+    if ew.window_size:
+        windows = np.lib.stride_tricks.sliding_window_view(data, ew.window_size, axis=-1)[:, -days:]
+        return window_indicators(windows, indicators)
+
+    results = [window_indicators(data[:, :end], indicators)
+               for end in range(data.shape[-1] - days + 1, data.shape[-1] + 1)]
+    return {indicator: np.stack([result[indicator] for result in results], axis=-1) for indicator in indicators}
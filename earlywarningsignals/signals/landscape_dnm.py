@@ -10,6 +10,10 @@ import earlywarningsignals.signals.dnm as dnm
 from tqdm import tqdm
 from datetime import timedelta
 import multiprocessing as mp
+import os
+
+# Default Parameters
+CHECKPOINT_INTERVAL_DEFAULT = 10
 
 
 class EWarningLDNM(EWarningDNM):
@@ -25,7 +29,8 @@ class EWarningLDNM(EWarningDNM):
                  covid_file=general.COVID_FILE_DEFAULT, countries=general.COUNTRIES_DEFAULT,
                  window_size=dnm.WINDOW_SIZE_DEFAULT, correlation=general.CORRELATION_DEFAULT,
                  cumulative_data=dnm.CUMULATIVE_DATA_DEFAULT, static_adjacency=general.STATIC_ADJACENCY_DEFAULT,
-                 progress_bar=general.PROGRESS_BAR_DEFAULT):
+                 progress_bar=general.PROGRESS_BAR_DEFAULT, checkpoint_dir=None,
+                 checkpoint_interval=CHECKPOINT_INTERVAL_DEFAULT, keep_unmasked=general.KEEP_UNMASKED_DEFAULT):
         """
         Main constructor for the Class that receive all possible parameters.
 
@@ -59,6 +64,15 @@ class EWarningLDNM(EWarningDNM):
             the time or new daily cases of confirmed covid cases (True).
         :param numpy [[float]] static_adjacency: Static adjacency for each graph.
         :param bool progress_bar: Boolean that determines whether a progress bar will be showing the progression.
+        :param string checkpoint_dir: Location of the folder where the networks and the L-DNM of the days already
+            calculated are periodically saved, in a subfolder named after the parameters of the class. If the subfolder
+            already exists when the networks are generated with the same parameters, those days are restored instead of
+            being calculated again. By default, there is no checkpoint.
+        :param int checkpoint_interval: Number of days calculated between two consecutive saves of the checkpoint, which
+            are stored in a new file each time.
+        :param bool keep_unmasked: Boolean that determines whether to keep the networks before the product with the
+            adjacencies (class property networks_unmasked), which are needed by the method with_adjacencies(). It
+            doubles the memory used by the networks, and the space of the saved class.
 
         :raises:
             DateOutRangeException: If start_date is greater than end_date or the database doesn't contain it. If there
@@ -68,9 +82,74 @@ class EWarningLDNM(EWarningDNM):
                 countries list isn't contain in the database.
         """
         self.l_dnm_s = []
+        self.checkpoint_dir = checkpoint_dir
+        self.checkpoint_interval = checkpoint_interval
         super().__init__(start_date=start_date, end_date=end_date, covid_file=covid_file, countries=countries,
                          window_size=window_size, correlation=correlation, cumulative_data=cumulative_data,
-                         static_adjacency=static_adjacency, progress_bar=progress_bar)
+                         static_adjacency=static_adjacency, progress_bar=progress_bar, keep_unmasked=keep_unmasked)
+
+    def time_axes(self):
+        """
+        Specialization of the method that gives the array properties with one element for each date, where the L-DNM
+        of each country is also included.
+
+        :return: Dictionary with the name of each property as key and the axis of its dates as value.
+        :rtype: {string: int}
+        """
+        return {**super().time_axes(), 'l_dnm_s': 1}
+
+    def with_networks(self, networks):
+        """
+        Specialization of the method that generates a shallow copy of the class with a different list of networks. The
+        L-DNM of each country is calculated from the windows of the data instead of the networks, so it can't be
+        obtained from the new networks and it is not kept in the copy.
+
+        :param numpy [[[float]]] networks: List of the networks for each temporal instant from the start date to the
+            end date, with the same shape as the class property networks.
+
+        :return: Copy of the class with the new networks.
+        :rtype: EWarningLDNM
+        """
+        ew = super().with_networks(networks)
+        ew.l_dnm_s = []
+        return ew
+
+    def with_countries(self, countries):
+        """
+        Specialization of the method that generates a shallow copy of the class restricted to a subset of its
+        countries. The L-DNM of each country depends on its whole local network, so it is not kept in the copy.
+
+        :param [string] countries: List of countries of the subset in the ISO-3166-Alpha2 format.
+
+        :return: Copy of the class restricted to the subset of countries.
+        :rtype: EWarningLDNM
+
+        :raises:
+            CountryUndefinedException: If there are less than two selected countries. If any country isn't contained
+                in the class.
+        """
+        ew = super().with_countries(countries)
+        ew.l_dnm_s = []
+        return ew
+
+    def with_adjacencies(self, adjacencies):
+        """
+        Specialization of the method that generates a shallow copy of the class with a different list of adjacencies.
+        The L-DNM of each country depends on the adjacencies of its local network, so it is not kept in the copy.
+
+        :param numpy [[[float]]] adjacencies: List of the adjacency matrices for each temporal instant, with the same
+            shape as the class property adjacencies.
+
+        :return: Copy of the class with the new adjacencies and networks.
+        :rtype: EWarningLDNM
+
+        :raises:
+            ValueError: If the networks before masking them aren't available, because the method check_windows()
+                hasn't been called yet.
+        """
+        ew = super().with_adjacencies(adjacencies)
+        ew.l_dnm_s = []
+        return ew
 
     def generate_networks(self, start_date_window):
         """
@@ -86,7 +165,7 @@ class EWarningLDNM(EWarningDNM):
         :return: List of the correlation matrices for each temporal instant from the start date to the end date.
         :rtype: numpy [[[float]]]
         """
-        networks = []
+        networks = self.load_checkpoint()
         i = 0
         if self.progress_bar:
             pbar = tqdm(total=((self.end_date + timedelta(days=2)) -
@@ -97,7 +176,10 @@ class EWarningLDNM(EWarningDNM):
                 window_t1 = window[:, 1:]
                 # print(f't-1: {window_t0}')
                 # print(f't: {window_t1}')
-                networks.append(self.window_to_network(window_t0, window_t1, i))
+                if i == len(networks):
+                    networks.append(self.window_to_network(window_t0, window_t1, i))
+                    if len(networks) % self.checkpoint_interval == 0:
+                        self.save_checkpoint(networks)
                 start_date_window += timedelta(days=1)
                 i += 1
                 pbar.update(1)
@@ -109,9 +191,14 @@ class EWarningLDNM(EWarningDNM):
                 window_t1 = window[:, 1:]
                 # print(f't-1: {window_t0}')
                 # print(f't: {window_t1}')
-                networks.append(self.window_to_network(window_t0, window_t1, i))
+                if i == len(networks):
+                    networks.append(self.window_to_network(window_t0, window_t1, i))
+                    if len(networks) % self.checkpoint_interval == 0:
+                        self.save_checkpoint(networks)
                 start_date_window += timedelta(days=1)
                 i += 1
+        if len(networks) % self.checkpoint_interval:
+            self.save_checkpoint(networks)
         return np.array(networks)
 
     def generate_networks_no_window(self, start_date_window):
@@ -129,7 +216,7 @@ class EWarningLDNM(EWarningDNM):
         :return: List of the correlation matrices for each temporal instant from the start date to the end date.
         :rtype: numpy [[[float]]]
         """
-        networks = []
+        networks = self.load_checkpoint()
         i = 0
         if self.progress_bar:
             pbar = tqdm(total=(self.end_date + timedelta(days=1) - start_date_window).days)
@@ -138,7 +225,10 @@ class EWarningLDNM(EWarningDNM):
                 window_t0 = window_t1[:, :-1]
                 # print(f't-1: {window_t0}')
                 # print(f't: {window_t1}')
-                networks.append(self.window_to_network(window_t0, window_t1, i))
+                if i == len(networks):
+                    networks.append(self.window_to_network(window_t0, window_t1, i))
+                    if len(networks) % self.checkpoint_interval == 0:
+                        self.save_checkpoint(networks)
                 start_date_window += timedelta(days=1)
                 i += 1
                 pbar.update(1)
@@ -149,9 +239,14 @@ class EWarningLDNM(EWarningDNM):
                 window_t0 = window_t1[:, :-1]
                 # print(f't-1: {window_t0}')
                 # print(f't: {window_t1}')
-                networks.append(self.window_to_network(window_t0, window_t1, i))
+                if i == len(networks):
+                    networks.append(self.window_to_network(window_t0, window_t1, i))
+                    if len(networks) % self.checkpoint_interval == 0:
+                        self.save_checkpoint(networks)
                 start_date_window += timedelta(days=1)
                 i += 1
+        if len(networks) % self.checkpoint_interval:
+            self.save_checkpoint(networks)
         return np.array(networks)
 
     def generate_adjacencies(self, start_date_window):
@@ -194,6 +289,65 @@ class EWarningLDNM(EWarningDNM):
 
         return adjacencies
 
+    def checkpoint_folder(self):
+        """
+        Gives the folder of the checkpoint of the class, a subfolder of the checkpoint folder named after the key of the
+        parameters of the class. Copies of the class with different dates (for example the shards of a partition of
+        the dates) have different keys, so they never share their checkpoint.
+
+        :return: Location of the folder of the checkpoint, or None if there is no checkpoint.
+        :rtype: string
+        """
+        if self.checkpoint_dir is None:
+            return None
+        return os.path.join(self.checkpoint_dir, self.parameters_key())
+
+    def load_checkpoint(self):
+        """
+        Restores the days already calculated from the files of the checkpoint folder, if it was saved with the same
+        parameters of the class. Each file contains a group of consecutive days, named after the position of its first
+        day, and the files are read in order while they continue the days already restored. The L-DNM of those days
+        is restored in the class property l_dnm_s, which must already have its final shape.
+
+        :return: List of the networks of the days already calculated, from the first one.
+        :rtype: [numpy [[float]]]
+        """
+        folder = self.checkpoint_folder()
+        if folder is None or not os.path.isdir(folder):
+            return []
+        starts = sorted(int(name[:-len('.npz')]) for name in os.listdir(folder) if name.endswith('.npz'))
+        networks = []
+        for start in starts:
+            if start > len(networks):
+                break
+            with np.load(os.path.join(folder, f'{start}.npz')) as f:
+                chunk_networks, chunk_l_dnm_s = f['networks'], f['l_dnm_s']
+            if start + len(chunk_networks) > self.l_dnm_s.shape[1]:
+                break
+            new = slice(len(networks) - start, len(chunk_networks))
+            self.l_dnm_s[:, start + new.start:start + new.stop] = chunk_l_dnm_s[:, new]
+            networks.extend(chunk_networks[new])
+        return networks
+
+    def save_checkpoint(self, networks):
+        """
+        Saves the networks and the L-DNM of the last group of days calculated in a new file of the checkpoint folder,
+        so each save only writes the days calculated since the previous one. The groups start at multiples of the
+        checkpoint interval. Each file is replaced at once, so an interruption never leaves it incomplete.
+
+        :param [numpy [[float]]] networks: List of the networks of the days already calculated, from the first one.
+        """
+        folder = self.checkpoint_folder()
+        if folder is None or not networks:
+            return
+        os.makedirs(folder, exist_ok=True)
+        start = (len(networks) - 1) // self.checkpoint_interval * self.checkpoint_interval
+        temporary = os.path.join(folder, f'.{start}.{os.getpid()}.tmp')
+        with open(temporary, 'wb') as f:
+            np.savez(f, networks=np.array(networks[start:]).reshape(-1, len(self.countries), len(self.countries)),
+                     l_dnm_s=self.l_dnm_s[:, start:len(networks)])
+        os.replace(temporary, os.path.join(folder, f'{start}.npz'))
+
     def parallel_window_to_network(self, node, window_t0, window_t1, adjacency):
         """
         Due to the slow performance of this specific early warning marker, it has been necessary to parallelize
@@ -297,6 +451,23 @@ class EWarningLDNM(EWarningDNM):
                     network[j, node] = network[node, j]
         return np.nan_to_num(network)
 
+    def networks_from_statistics(self, correlations, deviations):
+        """
+        Specialization of the method that generates each network from the statistics of two consecutive windows,
+        where each network only contains the differential correlation as in the method window_to_network(). It is used
+        by the vectorized method windows_to_networks(), and the early warning signals of the Landscape - Dynamic Network
+        Marker (L-DNM) are not calculated.
+
+        :param numpy [[[float]]] correlations: Correlation matrices with shape (..., windows, countries, countries).
+        :param numpy [[float]] deviations: Standard deviations with shape (..., windows, countries). In this case they
+            are not needed, so they will be ignored.
+
+        :return: List of the networks for each temporal instant from the start date to the end date.
+        :rtype: numpy [[[float]]]
+        """
+        networks = np.abs(np.abs(correlations[..., 1:, :, :]) - np.abs(correlations[..., :-1, :, :]))
+        return self.mask_networks(networks)
+
     def landscape_dnm(self):
         """
         Calculates the early warning signals based on the Landscape - Dynamic Network Marker (L-DNM).
@@ -0,0 +1,94 @@
+# Data Structures and basic Algorithms Libraries
+import numpy as np
+
+# Default Class Parameters
+K_FOLD_DEFAULT = 2
+STEP_DEFAULT = 1
+RATE_COMPARE_DEFAULT = None
+
+
+class FoldChangeDetector:
+    """
+    Online detector of tipping points based on fold change, equivalent to the methods k_fold_changes() and
+    k_fold_changes_multiple() of the class EWarningGeneral, but receiving the value of the early warning signals one
+    instant of study at a time. Only the last step values of each time series are kept in a ring buffer, so every new
+    value is compared with them without processing again the whole history.
+    Notes: Differently from the offline methods, the last values of a time series are also used as origin of the
+    comparisons, since the detector doesn't know when the time series ends. Hence, the alarms are the same as the
+    ones of the offline methods except for the last step instants of study.
+    """
+
+    def __init__(self, k_fold=K_FOLD_DEFAULT, step=STEP_DEFAULT, rate_compare=RATE_COMPARE_DEFAULT, series=1):
+        """
+        Main constructor for the Class that receive all possible parameters.
+
+        :param float k_fold: Quantity of change between one sample and the next one.
+        :param int step: Number of previous samples to which each new sample is compared.
+        :param float rate_compare: Minimum percentage of time series to fulfill the fold change measure, as in the
+            method k_fold_changes_multiple(). If it is None, each time series is checked independently as in the method
+            k_fold_changes().
+        :param int series: Number of simultaneous time series received in each update, for example one for each node of
+            the L-DNM.
+        """
+        self.k_fold = k_fold
+        self.step = step
+        self.rate_compare = rate_compare
+        self.series = series
+
+        self.buffer = None
+        self.position = 0
+        self.samples = 0
+        self.reset()
+
+    def reset(self):
+        """
+        Discards all the previous values received by the detector.
+        """
+        self.buffer = np.zeros((self.series, max(self.step, 0)))
+        self.position = 0
+        self.samples = 0
+
+    def update(self, values):
+        """
+        Receives the values of the time series for a new instant of study, checks if it is a tipping point comparing
+        them with the last step values, and stores them in the ring buffer replacing the oldest ones.
+
+        :param numpy [float] values: Value of each time series for the new instant of study. A single number is also
+            accepted when there is only one time series.
+
+        :return: Whether the new instant of study is a tipping point. If rate_compare is None and there are several time
+            series, a list with the result for each time series.
+        :rtype: bool or numpy [bool]
+        """
+        values = np.asarray(values, dtype=float).reshape(self.series)
+        origins = self.buffer[:, :min(self.samples, self.step)]
+
+        if self.rate_compare is None:
+            alarms = np.any((values[:, np.newaxis] > self.k_fold * origins) & (origins != 0), axis=1)
+            alarm = alarms[0] if self.series == 1 else alarms
+        else:
+            rate_greater = np.count_nonzero(values[:, np.newaxis] > self.k_fold * origins, axis=0) / self.series
+            rate_non_zero = np.count_nonzero(origins != 0, axis=0) / self.series
+            alarm = np.any((rate_greater >= self.rate_compare) & (rate_non_zero >= self.rate_compare))
+
+        if self.step > 0:
+            self.buffer[:, self.position] = values
+            self.position = (self.position + 1) % self.step
+        self.samples += 1
+        return alarm
+
+    def process(self, series):
+        """
+        Receives a whole group of time series, one instant of study at a time, continuing from the values previously
+        received by the detector.
+
+        :param numpy [[float]] series: Time series where the last axis represents each instant of study, with as many
+            Rows as the number of simultaneous time series of the detector. A single time series is also accepted.
+
+        :return: A numpy array with the result of the method update() for each instant of study, filled with 0 except
+            the tipping points which have 1. If rate_compare is None and there are several time series, it has one Row
+            for each time series.
+        :rtype: numpy [int]
+        """
+        series = np.asarray(series, dtype=float).reshape(self.series, -1)
+        return np.array([self.update(series[:, t]) for t in range(series.shape[1])], dtype=float).T
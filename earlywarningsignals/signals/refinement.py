@@ -0,0 +1,144 @@
+# Data Structures and basic Algorithms Libraries
+import numpy as np
+# Time Library
+from datetime import timedelta
+
+# Library classes
+from earlywarningsignals.signals.general import EWarningGeneral
+from earlywarningsignals.signals.dnm import EWarningDNM
+from earlywarningsignals.signals.landscape_dnm import EWarningLDNM
+from earlywarningsignals.signals.sweep import window_size_copies
+
+# Default Parameters
+STRIDE_DEFAULT = 7
+
+
+def prepare_windows(ew):
+    """
+    Generates a copy of the class with the same dates, data and adjacencies as the ones obtained with the method
+    check_windows(), but without generating any network, and the number of instants of study of the class.
+
+    :param EWarningGeneral ew: Instance of any of the classes of the library with window size greater than zero, whose
+        method check_windows() doesn't need to be called.
+
+    :return: The copy of the class with its data and adjacencies, and the number of instants of study.
+    :rtype: (EWarningGeneral, int)
+
+    :raises:
+        ValueError: If the window size is not greater than zero.
+    """
+    ew_windows = window_size_copies(ew, [ew.window_size])[0][ew.window_size]
+    # The DNM classes have one adjacency more than networks
+    days = len(ew_windows.adjacencies) - 1 if isinstance(ew, EWarningDNM) else len(ew_windows.adjacencies)
+    return ew_windows, days
+
+
+def position_dates(ew, positions):
+    """
+    Gives the dates of some instants of study of a class.
+
+    :param EWarningGeneral ew: Instance of any of the classes of the library, with its start date already shifted by
+        the method check_windows() if needed.
+    :param [int] positions: Positions of the instants of study, where 0 is the start date.
+
+    :return: List of the dates of the instants of study.
+    :rtype: [pandas datetime]
+    """
+    return [ew.start_date + timedelta(days=int(position)) for position in positions]
+
+
+def strided_networks(ew, stride=STRIDE_DEFAULT):
+    """
+    Generates the networks of a class only every stride dates, starting at the start date, so a coarse scan of a long
+    period costs stride times less than the method check_windows(). Each network is equal to the one of the same date
+    obtained with the method check_windows(), so the early warning signals of the returned copy are the ones of the
+    class sampled every stride dates. The L-DNM is not calculated.
+
+    :param EWarningGeneral ew: Instance of any of the classes of the library with window size greater than zero, whose
+        method check_windows() doesn't need to be called.
+    :param int stride: Number of dates between two consecutive networks.
+
+    :return: Copy of the class with its data, adjacencies and the networks of the strided dates, and the positions of
+        those dates, where 0 is the start date.
+    :rtype: (EWarningGeneral, numpy [int])
+
+    :raises:
+        ValueError: If the window size or the stride are not greater than zero.
+    """
+    if stride < 1:
+        raise ValueError('The strided evaluation requires a <stride> greater than zero.')
+    ew_windows, days = prepare_windows(ew)
+    positions = np.arange(0, days, stride)
+    return ew_windows.with_positions(positions), positions
+
+
+def refinement_positions(candidates, days, stride, step=1, margin=None):
+    """
+    Gives the positions of the dates that must be computed at full resolution around the candidate tipping points of
+    a coarse pass. A tipping point found at a coarse position may have happened at any date since the origin of its
+    comparison, which is up to step coarse positions before, so every date from there until margin dates after the
+    candidate is included.
+
+    :param [int] candidates: Positions of the dates of the candidate tipping points of the coarse pass.
+    :param int days: Number of instants of study of the class.
+    :param int stride: Number of dates between two consecutive networks of the coarse pass.
+    :param int step: Number of samples from the original one compared by the fold change measure.
+    :param int margin: Number of dates added before and after each interval. By default, the stride.
+
+    :return: Sorted positions of the dates to be computed at full resolution.
+    :rtype: numpy [int]
+    """
+    margin = stride if margin is None else margin
+    intervals = [np.arange(max(candidate - step * stride - margin, 0), min(candidate + margin + 1, days))
+                 for candidate in candidates]
+    return np.unique(np.concatenate(intervals)).astype(int) if intervals else np.array([], dtype=int)
+
+
+def refine_tipping_points(ew, marker, k_fold, step=1, stride=STRIDE_DEFAULT, margin=None, marker_args=()):
+    """
+    Calculates an early warning signal with an adaptive resolution. A coarse pass computes the networks only every
+    stride dates as the function strided_networks(), and the tipping points of the coarse early warning signal are
+    found with the method k_fold_changes(). Then, the networks are computed at full resolution only for the dates
+    around those candidate tipping points, given by the function refinement_positions(), and the networks of the coarse
+    pass are reused. If the early warning signal has several time series, a candidate is any tipping point of any of
+    them. The L-DNM is not calculated, so it can't be refined.
+
+    :param EWarningGeneral ew: Instance of any of the classes of the library with window size greater than zero, whose
+        method check_windows() doesn't need to be called.
+    :param string marker: Name of the method of the class that calculates the early warning signal, for example
+        "density" or "mst_dnm". The last axis of its result must contain the instants of study.
+    :param float k_fold: Quantity of change between one sample and the next one, as in the method k_fold_changes().
+    :param int step: Number of samples of the coarse pass from the original one to be compared.
+    :param int stride: Number of dates between two consecutive networks of the coarse pass.
+    :param int margin: Number of dates computed at full resolution before and after each candidate interval. By
+        default, the stride.
+    :param tuple marker_args: Additional arguments of the method of the early warning signal.
+
+    :return: Copy of the class with the networks of the coarse and refined dates in chronological order, the positions
+        of those dates where 0 is the start date, and the positions of the candidate tipping points of the coarse pass.
+    :rtype: (EWarningGeneral, numpy [int], numpy [int])
+
+    :raises:
+        ValueError: If the window size or the stride are not greater than zero. If the early warning signal is the
+            L-DNM.
+    """
+    if isinstance(ew, EWarningLDNM) and marker == 'landscape_dnm':
+        raise ValueError('The L-DNM is not calculated by the strided evaluation, so it can\'t be refined.')
+    if stride < 1:
+        raise ValueError('The strided evaluation requires a <stride> greater than zero.')
+    ew_windows, days = prepare_windows(ew)
+    coarse_positions = np.arange(0, days, stride)
+    ew_coarse = ew_windows.with_positions(coarse_positions)
+
+    series = np.asarray(getattr(ew_coarse, marker)(*marker_args), dtype=float)
+    tipping_points = EWarningGeneral.k_fold_changes(series, k_fold, step)
+    tipping_points = tipping_points.reshape(-1, tipping_points.shape[-1]).any(axis=0)
+    candidates = coarse_positions[tipping_points]
+
+    refined_positions = np.setdiff1d(refinement_positions(candidates, days, stride, step, margin), coarse_positions)
+    positions = np.concatenate((coarse_positions, refined_positions))
+    networks = ew_coarse.networks
+    if len(refined_positions):
+        networks = np.concatenate((networks, ew_windows.networks_at(refined_positions)))
+    order = np.argsort(positions, kind='stable')
+    return ew_windows.with_positions(positions[order], networks[order]), positions[order], candidates
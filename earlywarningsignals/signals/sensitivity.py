@@ -0,0 +1,47 @@
+# Data Structures and basic Algorithms Libraries
+import numpy as np
+
+
+def leave_one_out(ew, marker, marker_args=(), countries=None):
+    """
+    Calculates an early warning signal removing each country from the class, one at a time. The networks of each
+    subset of countries are obtained from the networks of the class with the method with_countries(), so the
+    correlations are calculated only once and only the early warning signal is calculated again for each subset.
+
+    :param EWarningGeneral ew: Instance of any of the classes of the library, whose method check_windows() has already
+        been called.
+    :param string marker: Name of the method of the class that calculates the early warning signal, for example
+        "density", "clustering_coefficient" or "mst_dnm".
+    :param tuple marker_args: Additional arguments of the method of the early warning signal.
+    :param [string] countries: List of the countries to be removed in the ISO-3166-Alpha2 format. By default, every
+        country of the class.
+
+    :return: Dictionary with each removed country as key, and as value the early warning signal calculated without it.
+    :rtype: {string: numpy [float]}
+    """
+    countries = ew.countries if countries is None else countries
+    return {country: np.asarray(getattr(ew.with_countries([other for other in ew.countries if other != country]),
+                                        marker)(*marker_args))
+            for country in countries}
+
+
+def country_influence(ew, marker, marker_args=(), countries=None):
+    """
+    Calculates the influence of each country over an early warning signal, as the difference between the early warning
+    signal of the class and the one obtained removing the country. A positive influence means that the country raises
+    the value of the early warning signal.
+
+    :param EWarningGeneral ew: Instance of any of the classes of the library, whose method check_windows() has already
+        been called.
+    :param string marker: Name of the method of the class that calculates the early warning signal.
+    :param tuple marker_args: Additional arguments of the method of the early warning signal.
+    :param [string] countries: List of the countries in the ISO-3166-Alpha2 format. By default, every country of the
+        class.
+
+    :return: Matrix where each Row represents a country (in the same order as the list of countries), with the
+        influence of the country for each value of the early warning signal.
+    :rtype: numpy [[float]]
+    """
+    observed = np.asarray(getattr(ew, marker)(*marker_args))
+    values = leave_one_out(ew, marker, marker_args, countries)
+    return np.array([observed - value for value in values.values()])
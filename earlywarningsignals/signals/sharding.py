@@ -0,0 +1,139 @@
+# Data Structures and basic Algorithms Libraries
+import pandas as pd
+import numpy as np
+# Time Library
+from datetime import timedelta
+# Generic Python Libraries
+import multiprocessing as mp
+import copy
+import os
+
+# Library classes
+from earlywarningsignals.signals.general import EWarningGeneral
+from earlywarningsignals.signals.dnm import EWarningDNM
+
+# Default Parameters
+PROCESSES_DEFAULT = 1
+
+
+def halo_days(ew):
+    """
+    Gives the number of dates previous to the start date that are needed to compute the networks of the start date,
+    which is the window size minus one, or the window size for the EWarningDNM class and its specializations because
+    each network requires two windows with one date of difference.
+
+    :param EWarningGeneral ew: Instance of any of the classes of the library.
+
+    :return: Number of dates of the halo.
+    :rtype: int
+
+    :raises:
+        ValueError: If the window size is zero, because the windows grow from the first date and they can't be split.
+    """
+    if not ew.window_size:
+        raise ValueError('The partition of the dates requires a <window_size> greater than zero.')
+    return ew.window_size if isinstance(ew, EWarningDNM) else ew.window_size - 1
+
+
+def plan_shards(ew, shards):
+    """
+    Splits the dates of study of a class in consecutive intervals (shards) of similar length, that can be computed
+    independently. Each shard also needs the dates of its halo, the dates previous to its start date covered by the
+    windows of its first networks. The start date is shifted as in the method check_windows() if the database doesn't
+    have enough dates previous to it.
+
+    :param EWarningGeneral ew: Instance of any of the classes of the library, whose method check_windows() hasn't been
+        called yet.
+    :param int shards: Number of shards. It is limited to the number of dates of study.
+
+    :return: List with the start date, the end date and the first date of the halo of each shard.
+    :rtype: [(pandas datetime, pandas datetime, pandas datetime)]
+
+    :raises:
+        ValueError: If the window size is zero.
+    """
+    halo = halo_days(ew)
+    first_date = pd.to_datetime(ew.data_dataframe.columns[4], format='%m/%d/%y')
+    start_date = max(ew.start_date, first_date + timedelta(days=halo))
+    days = (ew.end_date - start_date).days + 1
+    bounds = np.linspace(0, days, min(max(shards, 1), days) + 1).round().astype(int)
+    return [(start_date + timedelta(days=int(start)), start_date + timedelta(days=int(stop) - 1),
+             start_date + timedelta(days=int(start) - halo)) for start, stop in zip(bounds[:-1], bounds[1:])]
+
+
+def compute_shard(ew, start_date, end_date, name, compress=False):
+    """
+    Worker of a shard, which calls the method check_windows() of a copy of the class restricted to the dates of the
+    shard and saves it with the method save() of the class. The halo of the shard is imported by the method
+    check_windows() itself.
+
+    :param EWarningGeneral ew: Instance of any of the classes of the library, whose method check_windows() hasn't been
+        called yet.
+    :param pandas datetime start_date: Start date of the shard.
+    :param pandas datetime end_date: End date of the shard.
+    :param string name: Destination path of the folder where the shard is saved.
+    :param boolean compress: If True, the arrays of the shard are compressed.
+
+    :return: Destination path of the folder where the shard is saved.
+    :rtype: string
+    """
+    shard = copy.copy(ew)
+    shard.start_date, shard.end_date = start_date, end_date
+    shard.check_windows()
+    shard.save(name, compress=compress)
+    return name
+
+
+def merge_shards(names):
+    """
+    Stitches the shards saved by the function compute_shard() in a single class, identical to the one obtained with
+    the method check_windows() for the whole interval of dates. The shards must be given in chronological order. As the
+    last element of each array corresponds to the end date of its shard, the elements of the halo are dropped from
+    every shard but the first one.
+
+    :param [string] names: Location paths of the folders of the shards, in chronological order.
+
+    :return: The class with the arrays of all the shards.
+    :rtype: EWarningGeneral
+    """
+    shards = [EWarningGeneral.load(name) for name in names]
+    ew = shards[0]
+    for attribute, axis in ew.time_axes().items():
+        if not isinstance(getattr(ew, attribute), np.ndarray):
+            continue
+        arrays = [getattr(ew, attribute)]
+        for shard in shards[1:]:
+            array = getattr(shard, attribute)
+            days = (shard.end_date - shard.start_date).days + 1
+            arrays.append(np.take(array, range(array.shape[axis] - days, array.shape[axis]), axis=axis))
+        setattr(ew, attribute, np.concatenate(arrays, axis=axis))
+    ew.end_date = shards[-1].end_date
+    return ew
+
+
+def run_shards(ew, shards, directory, processes=PROCESSES_DEFAULT, compress=False):
+    """
+    Computes the networks of a class split in shards with a pool of local processes, standing in for the nodes of a
+    cluster, and merges them in a single class. Each shard is saved in its own folder inside the given directory.
+
+    :param EWarningGeneral ew: Instance of any of the classes of the library, whose method check_windows() hasn't been
+        called yet.
+    :param int shards: Number of shards.
+    :param string directory: Location path of the folder where the shards are saved.
+    :param int processes: Number of processes between which the shards are distributed.
+    :param boolean compress: If True, the arrays of the shards are compressed.
+
+    :return: The class with the arrays of all the shards.
+    :rtype: EWarningGeneral
+
+    :raises:
+        ValueError: If the window size is zero.
+    """
+    arguments = [(ew, start_date, end_date, os.path.join(directory, f'shard_{i}'), compress)
+                 for i, (start_date, end_date, _) in enumerate(plan_shards(ew, shards))]
+    if processes > 1:
+        with mp.Pool(processes) as pool:
+            names = pool.starmap(compute_shard, arguments)
+    else:
+        names = [compute_shard(*argument) for argument in arguments]
+    return merge_shards(names)
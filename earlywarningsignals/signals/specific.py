@@ -1,6 +1,8 @@
 # Data Structures and basic Algorithms Libraries
 import pandas as pd
 import numpy as np
+from scipy import sparse
+from scipy.sparse import csgraph
 # Graph and Network auxiliary Libraries
 import networkx as nx
 from GraphRicciCurvature.FormanRicci import FormanRicci
@@ -15,11 +17,21 @@ from earlywarningsignals.__init__ import *
 # Original class to be extended
 from earlywarningsignals.signals import EWarningGeneral
 import earlywarningsignals.signals.general as general
+# Dedicated Exceptions for the Library
+from earlywarningsignals.signals.exceptions import CountryUndefinedException
 
 # Default Class Parameters
 THRESHOLD_DEFAULT = 0.5
 CUMULATIVE_DATA_DEFAULT = False
 SQUARE_ROOT_DATA = True
+UNWEIGHTED_FORMAT_DEFAULT = 'int'
+THRESHOLD_SWEEP_SIGNALS_DEFAULT = ['density', 'number_edges', 'clustering_coefficient', 'assortativity_coefficient',
+                                   'prs']
+COMPUTE_SIGNALS_DEFAULT = ['density', 'number_edges', 'clustering_coefficient', 'assortativity_coefficient', 'prs',
+                           'forman_ricci_curvature']
+
+# Number of bits set to one for every possible byte, used to count edges directly over bit-packed networks
+POPCOUNT_TABLE = np.unpackbits(np.arange(256, dtype=np.uint8)[:, np.newaxis], axis=1).sum(axis=1)
 
 
 # https://stackoverflow.com/questions/8391411/how-to-block-calls-to-print
@@ -48,7 +60,9 @@ class EWarningSpecific(EWarningGeneral):
                  window_size=general.WINDOW_SIZE_DEFAULT, correlation=general.CORRELATION_DEFAULT,
                  threshold=THRESHOLD_DEFAULT, cumulative_data=CUMULATIVE_DATA_DEFAULT,
                  square_root_data=SQUARE_ROOT_DATA, static_adjacency=general.STATIC_ADJACENCY_DEFAULT,
-                 progress_bar=general.PROGRESS_BAR_DEFAULT):
+                 progress_bar=general.PROGRESS_BAR_DEFAULT, unweighted_format=UNWEIGHTED_FORMAT_DEFAULT,
+                 executor=general.EXECUTOR_DEFAULT, workers=general.WORKERS_DEFAULT,
+                 keep_unmasked=general.KEEP_UNMASKED_DEFAULT):
         """
         Main constructor for the Class that receive all possible parameters.
 
@@ -87,6 +101,21 @@ class EWarningSpecific(EWarningGeneral):
             case value to smooth the results.
         :param numpy [[float]] static_adjacency: Static adjacency for each graph.
         :param bool progress_bar: Boolean that determines whether a progress bar will be showing the progression.
+        :param string unweighted_format: Storage format of the unweighted networks. List of possible values:
+                 - "int": Integer matrices, one integer for each edge flag.
+                 - "bool": Boolean matrices, one byte for each edge flag.
+                 - "packed": Bit-packed matrices along the last axis (numpy.packbits), one bit for each edge flag.
+                 - any other value: Integer matrices.
+        :param string executor: Type of execution of the windows, which are split in chunks of consecutive dates to be
+            computed concurrently. List of possible executor values:
+                 - "serial": Sequential execution in the current process
+                 - "thread": Pool of threads
+                 - "process": Pool of processes
+                 - any other value: Sequential execution in the current process
+        :param int workers: Number of threads or processes of the pool. By default, the number of processors.
+        :param bool keep_unmasked: Boolean that determines whether to keep the networks before the product with the
+            adjacencies (class property networks_unmasked), which are needed by the method with_adjacencies(). It
+            doubles the memory used by the networks, and the space of the saved class.
 
         :raises:
             DateOutRangeException: If start_date is greater than end_date or the database doesn't contain it. If there
@@ -97,12 +126,15 @@ class EWarningSpecific(EWarningGeneral):
         """
         super().__init__(start_date=start_date, end_date=end_date, covid_file=covid_file, countries=countries,
                          window_size=window_size, correlation=correlation, static_adjacency=static_adjacency,
-                         progress_bar=progress_bar)
+                         progress_bar=progress_bar, executor=executor, workers=workers, keep_unmasked=keep_unmasked)
         self.cumulative_data = cumulative_data
         self.square_root_data = square_root_data
         self.threshold = threshold
+        self.unweighted_format = unweighted_format
 
         self.networks_unweighted = None
+        self.countries_info = {}
+        self.networks_cache = None
 
     def check_windows(self):
         """
@@ -143,34 +175,237 @@ class EWarningSpecific(EWarningGeneral):
                                                                                        + self.os_date_format + 'd/%y')
                                       for i in range((self.end_date - start_date_window).days + 1)]].to_numpy()
 
+    def time_axes(self):
+        """
+        Specialization of the method that gives the array properties with one element for each date, where the
+        unweighted networks are also included.
+
+        :return: Dictionary with the name of each property as key and the axis of its dates as value.
+        :rtype: {string: int}
+        """
+        return {**super().time_axes(), 'networks_unweighted': 0}
+
+    def __getstate__(self):
+        """
+        Gives the state of the class to be serialized, without the cache of the graphs of the unweighted networks that
+        can always be regenerated.
+
+        :return: Dictionary with the properties of the class.
+        :rtype: dict
+        """
+        state = self.__dict__.copy()
+        state['networks_cache'] = None
+        return state
+
+    def with_networks(self, networks):
+        """
+        Specialization of the method that generates a shallow copy of the class with a different list of networks,
+        where the unweighted networks are also generated from the new networks.
+
+        :param numpy [[[float]]] networks: List of the networks for each temporal instant from the start date to the
+            end date, with the same shape as the class property networks.
+
+        :return: Copy of the class with the new networks.
+        :rtype: EWarningSpecific
+        """
+        ew = super().with_networks(networks)
+        ew.networks_unweighted = ew.generate_unweighted()
+        return ew
+
+    def with_positions(self, positions, networks=None):
+        """
+        Specialization of the method that generates a shallow copy of the class restricted to some instants of study,
+        where the confirmed covid cases (class property data_original) are also restricted to the last date of the
+        window of each instant of study, after the dates of the first window, so the PRS of each network is calculated
+        with the cases of its own date.
+
+        :param [int] positions: Positions of the instants of study in chronological order, where 0 is the first date
+            of the networks.
+        :param numpy [[[float]]] networks: Networks of the given instants of study, if they are already computed. By
+            default, they are generated with the method networks_at().
+
+        :return: Copy of the class restricted to the given instants of study.
+        :rtype: EWarningSpecific
+
+        :raises:
+            ValueError: If the window size is zero.
+        """
+        ew = super().with_positions(positions, networks)
+        positions = np.asarray(positions, dtype=int)
+        dates = np.concatenate((np.arange(self.window_size - 1), positions + self.window_size - 1))
+        ew.data_original = np.asarray(self.data_original)[:, dates]
+        return ew
+
+    def with_countries(self, countries):
+        """
+        Specialization of the method that generates a shallow copy of the class restricted to a subset of its
+        countries, where the unweighted networks are also generated from the new networks.
+
+        :param [string] countries: List of countries of the subset in the ISO-3166-Alpha2 format.
+
+        :return: Copy of the class restricted to the subset of countries.
+        :rtype: EWarningSpecific
+
+        :raises:
+            CountryUndefinedException: If there are less than two selected countries. If any country isn't contained
+                in the class.
+        """
+        ew = super().with_countries(countries)
+        ew.countries_info = {}
+        ew.networks_cache = None
+        if ew.networks is not None:
+            ew.networks_unweighted = ew.generate_unweighted()
+        return ew
+
     def generate_unweighted(self):
         """
         Generates an unweighted adjacency matrix for each instant of study between the start date and the end date.
         Each matrix is obtained by checking in the same time corresponding correlation network if the correlation
-        coefficient between each pair of nodes is greater than the threshold property of the class.
+        coefficient between each pair of nodes is greater than the threshold property of the class. The resulting
+        list is stored following the class property unweighted_format.
 
         :return: List of the unweighted adjacency matrices for each temporal instant from the start date to
             the end date.
         :rtype: numpy [[[int]]]
         """
-        unweighted = []
-        if self.threshold == 'GC':  # Giant Component - @TODO
-            for network in self.networks:
-                g = nx.Graph(network)
-                # https://stackoverflow.com/questions/26105764/how-do-i-get-the-giant-component-of-a-networkx-graph
-                gc = max(nx.connected_components(g), key=len)
-                gc_network = np.zeros(shape=network.shape, dtype=np.int8)
-                for i in range(network.shape[0]):
-                    if i in gc:
-                        for j in range(network.shape[1]):
-                            if j in gc and j > i:
-                                gc_network[i, j] = 1
-                                gc_network[j, i] = 1
-                unweighted.append(gc_network)
+        if self.threshold == 'GC':  # Giant Component
+            unweighted = self.giant_components()
         else:
-            for network in self.networks:
-                unweighted.append((network > self.threshold).astype(int))
-        return np.array(unweighted)
+            unweighted = self.networks > self.threshold
+        return self.compact_unweighted(unweighted)
+
+    def giant_components(self):
+        """
+        Generates for each instant of study a matrix that connects every pair of nodes that belong to the giant
+        component (the largest connected component) of its correlation network. In case of ties, the component
+        containing the node with the lowest position is selected. All the networks are handled as the blocks of a
+        single sparse graph, so the connected components of every instant of study are labeled at once.
+
+        :return: List of the giant component matrices for each temporal instant from the start date to the end date.
+        :rtype: numpy [[[bool]]]
+        """
+        days, nodes = self.networks.shape[0], self.networks.shape[1]
+        if days == 0 or nodes == 0:
+            return np.zeros(shape=(days, nodes, nodes), dtype=bool)
+        t, i, j = np.nonzero(self.networks)
+        graph = sparse.coo_matrix((np.ones(t.shape[0], dtype=np.int8), (t * nodes + i, t * nodes + j)),
+                                  shape=(days * nodes, days * nodes))
+        _, labels = csgraph.connected_components(graph, directed=False)
+        sizes = np.bincount(labels)[labels].reshape(days, nodes)
+        labels = labels.reshape(days, nodes)
+        gc_labels = labels[np.arange(days), np.argmax(sizes == sizes.max(axis=1)[:, np.newaxis], axis=1)]
+        in_gc = labels == gc_labels[:, np.newaxis]
+        gc_networks = in_gc[:, :, np.newaxis] & in_gc[:, np.newaxis, :]
+        gc_networks[:, np.arange(nodes), np.arange(nodes)] = False
+        return gc_networks
+
+    def compact_unweighted(self, unweighted):
+        """
+        Transforms a list of boolean unweighted adjacency matrices to the storage format established by the class
+        property unweighted_format.
+
+        :param numpy [[[bool]]] unweighted: List of the unweighted adjacency matrices as booleans.
+
+        :return: List of the unweighted adjacency matrices in the storage format of the class.
+        :rtype: numpy [[[int]]]
+        """
+        if self.unweighted_format == 'packed':
+            return np.packbits(unweighted, axis=-1)
+        elif self.unweighted_format == 'bool':
+            return unweighted
+        return unweighted.astype(int)
+
+    def unweighted_network(self, t):
+        """
+        Obtains the unweighted adjacency matrix of a specific instant of study as a 2d int array, independently of the
+        storage format established by the class property unweighted_format.
+
+        :param int t: Position of the instant of study, being 0 the start date.
+
+        :return: The unweighted adjacency matrix of the instant of study.
+        :rtype: numpy [[int]]
+        """
+        if self.unweighted_format == 'packed':
+            return np.unpackbits(self.networks_unweighted[t], axis=-1, count=len(self.countries)).astype(int)
+        return self.networks_unweighted[t].astype(int)
+
+    def unweighted_tensor(self):
+        """
+        Obtains the complete list of unweighted adjacency matrices as booleans, independently of the storage format
+        established by the class property unweighted_format.
+
+        :return: List of the unweighted adjacency matrices for each temporal instant from the start date to
+            the end date.
+        :rtype: numpy [[[bool]]]
+        """
+        if self.unweighted_format == 'packed':
+            return np.unpackbits(self.networks_unweighted, axis=-1, count=len(self.countries)).astype(bool)
+        return self.networks_unweighted.astype(bool)
+
+    def unweighted_count(self):
+        """
+        Counts the number of non-zero values of each unweighted adjacency matrix, reading directly the storage format
+        established by the class property unweighted_format.
+
+        :return: List with the number of non-zero values of each unweighted adjacency matrix.
+        :rtype: numpy [int]
+        """
+        if self.unweighted_format == 'packed':
+            return POPCOUNT_TABLE[self.networks_unweighted].sum(axis=(1, 2))
+        return np.count_nonzero(self.networks_unweighted, axis=(1, 2))
+
+    def network_cache(self):
+        """
+        Obtains the cache shared by all the early warning signals with the graph representations of the unweighted
+        networks. The graphs are only generated the first time they are requested. The cache is linked to the current
+        unweighted networks, so whenever the class property networks_unweighted is replaced by a new list (for example
+        after calling again the method check_windows()) the previous content is discarded.
+
+        :return: Dictionary with the unweighted networks from which the cache was built, the networkx graphs already
+            generated for each instant of study and the degrees of each network.
+        :rtype: {string: object}
+        """
+        if self.networks_cache is None or self.networks_cache['networks_unweighted'] is not self.networks_unweighted:
+            self.networks_cache = {'networks_unweighted': self.networks_unweighted, 'graphs': {}, 'degrees': None}
+        return self.networks_cache
+
+    def clear_network_cache(self):
+        """
+        Discards all the graph representations stored in the cache shared by the early warning signals. It must be
+        called if the unweighted networks are modified in place.
+        """
+        self.networks_cache = None
+
+    def network_graph(self, t):
+        """
+        Obtains the networkx graph of the unweighted network of a specific instant of study, reusing the one stored in
+        the cache if it has already been generated.
+
+        :param int t: Position of the instant of study between the established dates.
+
+        :return: Undirected graph of the unweighted network.
+        :rtype: networkx Graph
+        """
+        graphs = self.network_cache()['graphs']
+        if t not in graphs:
+            graphs[t] = nx.Graph(self.unweighted_network(t))
+        return graphs[t]
+
+    def network_degrees(self):
+        """
+        Obtains the degree of each country in the undirected graph of every unweighted network, reusing the degrees
+        stored in the cache if they have already been calculated. As in networkx, a self loop adds two to the degree.
+
+        :return: Matrix where each Row represents an instant of study and each Column contains the degree of each
+            country.
+        :rtype: numpy [[int]]
+        """
+        cache = self.network_cache()
+        if cache['degrees'] is None:
+            unweighted = self.unweighted_tensor()
+            unweighted = unweighted | unweighted.transpose(0, 2, 1)
+            cache['degrees'] = np.count_nonzero(unweighted, axis=2) + np.diagonal(unweighted, axis1=1, axis2=2)
+        return cache['degrees']
 
     def density(self):
         """
@@ -179,13 +414,9 @@ class EWarningSpecific(EWarningGeneral):
         :return: List of all the values of the densities of each network between the established dates.
         :rtype: numpy [float]
         """
-        densities = []
-        for netUnweighted, netAdjacency in zip(self.networks_unweighted, self.adjacencies):
-            # g = nx.Graph(netUnweighted)
-            # densities.append(nx.density(g))
-            densities.append(np.count_nonzero(netUnweighted == 1) / np.count_nonzero(netAdjacency > 0)
-                             if np.count_nonzero(netAdjacency > 0) > 0 else 0)
-        return np.array(densities)
+        adjacencies_count = np.count_nonzero(self.adjacencies > 0, axis=(1, 2))
+        return np.divide(self.unweighted_count(), adjacencies_count, out=np.zeros(adjacencies_count.shape),
+                         where=adjacencies_count > 0)
 
     def clustering_coefficient(self):
         """
@@ -194,11 +425,7 @@ class EWarningSpecific(EWarningGeneral):
         :return: List of all the values of the clustering coefficients of each network between the established dates.
         :rtype: numpy [float]
         """
-        clusterings = []
-        for netUnweighted in self.networks_unweighted:
-            g = nx.Graph(netUnweighted)
-            clusterings.append(nx.average_clustering(g) / 2)
-        return np.array(clusterings)
+        return np.array([self.graph_clustering(self.network_graph(t)) for t in range(len(self.networks_unweighted))])
 
     def assortativity_coefficient(self):
         """
@@ -209,13 +436,8 @@ class EWarningSpecific(EWarningGeneral):
             the established dates.
         :rtype: numpy [float]
         """
-        assortativities = []
-        for netUnweighted in self.networks_unweighted:
-            g = nx.Graph(netUnweighted)
-            with warnings.catch_warnings(record=True):  # Avoid unnecessary warnings
-                assortativities.append(nx.degree_assortativity_coefficient(g))
-
-        return np.array(assortativities)
+        return np.array([self.graph_assortativity(self.network_graph(t))
+                         for t in range(len(self.networks_unweighted))])
 
     def number_edges(self):
         """
@@ -224,11 +446,7 @@ class EWarningSpecific(EWarningGeneral):
         :return: List of all the values of the number of edges inside each network between the established dates.
         :rtype: numpy [int]
         """
-        edges = []
-        for netUnweighted in self.networks_unweighted:
-            g = nx.Graph(netUnweighted)
-            edges.append(nx.number_of_edges(g))
-        return np.array(edges)
+        return self.network_degrees().sum(axis=1) // 2
 
     def prs(self, population_file=COUNTRY_INFO):
         """
@@ -256,17 +474,36 @@ class EWarningSpecific(EWarningGeneral):
             between the established dates.
         :rtype: numpy [int]
         """
-        prs_s = []
-        population = pd.read_csv(population_file)
-        countries_population = np.array(
-            population.loc[population['ISO-3166-Alpha2'].isin(self.data_dataframe['ISO-3166-Alpha2'].to_list())]
-                      .sort_values('ISO-3166-Alpha2')['population'].to_list(), dtype=np.int64)
-        for t, netUnweighted in enumerate(self.networks_unweighted):
-            covid_cases = np.array(self.data_original[:, t + self.window_size - 1], dtype=np.int64)
-            susceptible_cases = countries_population - covid_cases
-            prs_s.append(np.dot(np.dot(susceptible_cases, netUnweighted.astype(dtype=np.int64)),
-                                susceptible_cases[np.newaxis].T)[0])
-        return np.array(prs_s, dtype=np.int64)
+        countries_population = self.countries_population(population_file)
+        covid_cases = np.array(self.data_original[:, self.window_size - 1:], dtype=np.int64)
+        susceptible_cases = countries_population[:, np.newaxis] - covid_cases
+        return np.einsum('it,tij,jt->t', susceptible_cases, self.unweighted_tensor().astype(dtype=np.int64),
+                         susceptible_cases).astype(np.int64)
+
+    def countries_population(self, population_file=COUNTRY_INFO):
+        """
+        Obtains the population of each country of study, ordered in the same way as the class property countries.
+        The file is only read the first time it is requested, the following calls reuse the same population vector
+        stored in the class property countries_info.
+
+        :param string population_file: Location of the file containing additional information of each country. It must
+            have the same structure as the one described in the method prs().
+
+        :return: List with the population of each country of study.
+        :rtype: numpy [int]
+
+        :raises:
+            CountryUndefinedException: If any country of study isn't contained in the population file.
+        """
+        if population_file not in self.countries_info:
+            population = pd.read_csv(population_file).drop_duplicates('ISO-3166-Alpha2').set_index('ISO-3166-Alpha2')
+            missing = sorted(set(self.countries).difference(population.index))
+            if missing:
+                raise CountryUndefinedException('All ISO-3166-Alpha2 country references in <countries> must be '
+                                                f'contained in the population file. Errors: {missing}')
+            self.countries_info[population_file] = np.array(population.loc[self.countries, 'population'].to_list(),
+                                                            dtype=np.int64)
+        return self.countries_info[population_file]
 
     def srs(self):
         pass
@@ -279,12 +516,221 @@ class EWarningSpecific(EWarningGeneral):
             the established dates.
         :rtype: numpy [float]
         """
-        forman_ricci_curvatures = []
+        return np.array([self.graph_forman_ricci_curvature(self.network_graph(t))
+                         for t in range(len(self.networks_unweighted))])
+
+    def spectral_networks(self, weighted=False):
+        """
+        Specialization of the method that obtains the networks used by the spectral early warning signals, which can be
+        the weighted networks or the unweighted networks obtained with the threshold.
+
+        :param bool weighted: Boolean that determines whether to use the weighted networks (True) or the unweighted
+            networks obtained with the threshold (False).
+
+        :return: List of the matrices of the networks for each instant of study.
+        :rtype: numpy [[[float]]]
+        """
+        if weighted:
+            return self.networks
+        return self.unweighted_tensor().astype(float)
+
+    def leading_eigenvalue(self, weighted=False):
+        """
+        Specialization of the method leading_eigenvalue(), which uses the unweighted networks by default.
+
+        :param bool weighted: Boolean that determines whether to use the weighted networks (True) or the unweighted
+            networks obtained with the threshold (False).
+
+        :return: List of all the values of the leading eigenvalue of each network between the established dates.
+        :rtype: numpy [float]
+        """
+        return super().leading_eigenvalue(weighted)
+
+    def spectral_gap(self, weighted=False):
+        """
+        Specialization of the method spectral_gap(), which uses the unweighted networks by default.
+
+        :param bool weighted: Boolean that determines whether to use the weighted networks (True) or the unweighted
+            networks obtained with the threshold (False).
+
+        :return: List of all the values of the spectral gap of each network between the established dates.
+        :rtype: numpy [float]
+        """
+        return super().spectral_gap(weighted)
+
+    def algebraic_connectivity(self, weighted=False):
+        """
+        Specialization of the method algebraic_connectivity(), which uses the unweighted networks by default.
+
+        :param bool weighted: Boolean that determines whether to use the weighted networks (True) or the unweighted
+            networks obtained with the threshold (False).
+
+        :return: List of all the values of the algebraic connectivity of each network between the established dates.
+        :rtype: numpy [float]
+        """
+        return super().algebraic_connectivity(weighted)
+
+    @staticmethod
+    def graph_clustering(g):
+        """
+        Calculates the clustering coefficient of a single graph, as used by the method clustering_coefficient().
+
+        :param networkx Graph g: Undirected graph of an unweighted network.
+
+        :return: Clustering coefficient of the graph.
+        :rtype: float
+        """
+        return nx.average_clustering(g) / 2
+
+    @staticmethod
+    def graph_assortativity(g):
+        """
+        Calculates the degree assortativity coefficient of a single graph, as used by the method
+        assortativity_coefficient().
+
+        :param networkx Graph g: Undirected graph of an unweighted network.
+
+        :return: Degree assortativity coefficient of the graph.
+        :rtype: float
+        """
+        with warnings.catch_warnings(record=True):  # Avoid unnecessary warnings
+            return nx.degree_assortativity_coefficient(g)
+
+    @staticmethod
+    def graph_forman_ricci_curvature(g):
+        """
+        Calculates the average of the Forman Ricci Curvature of all edges of a single graph, as used by the method
+        forman_ricci_curvature(). The original graph is not modified.
+
+        :param networkx Graph g: Undirected graph of an unweighted network.
+
+        :return: Average Forman Ricci Curvature of all edges of the graph.
+        :rtype: float
+        """
+        if g.number_of_edges() == 0:
+            return np.nan
         with HiddenPrints():
-            for netUnweighted in self.networks_unweighted:
-                g = nx.Graph(netUnweighted)
-                frc = FormanRicci(g)
-                frc.compute_ricci_curvature()
-                forman_ricci_curvatures.append(np.nan if g.number_of_edges() == 0 else sum(
-                    [fc for (_, _, fc) in frc.G.edges(data='formanCurvature')]) / g.number_of_edges())
-        return np.array(forman_ricci_curvatures)
+            frc = FormanRicci(g)
+            frc.compute_ricci_curvature()
+        return sum([fc for (_, _, fc) in frc.G.edges(data='formanCurvature')]) / g.number_of_edges()
+
+    def threshold_sweep(self, thresholds, signals=THRESHOLD_SWEEP_SIGNALS_DEFAULT, population_file=COUNTRY_INFO):
+        """
+        Calculates several early warning signals for a whole list of numeric thresholds at once, reusing the weighted
+        networks already generated instead of constructing and checking a new instance for each threshold. The
+        weights of each network are sorted only once, so the density, the number of edges and the Preparedness Risk
+        Score (PRS) of every threshold are obtained with a binary search over them. The clustering and assortativity
+        coefficients still need a graph for each pair of threshold and instant of study.
+
+        :param [float] thresholds: List of values from which it is determined that the correlation between two
+            countries is high enough establishing a connection.
+        :param [string] signals: List of the early warning signals to be calculated. List of possible values:
+                 - "density": Network density.
+                 - "number_edges": Number of edges inside the network.
+                 - "clustering_coefficient": Clustering coefficient of the network.
+                 - "assortativity_coefficient": Degree assortativity coefficient of the network.
+                 - "prs": Preparedness Risk Score (PRS) of the network.
+        :param string population_file: Location of the file containing additional information of each country. It must
+            have the same structure as the one described in the method prs(). Only used for the PRS.
+
+        :return: Dictionary with the name of each early warning signal as key, and as value a matrix where each Row
+            represents a threshold and each Column contains the value of the signal for each instant of study.
+        :rtype: {string: numpy [[float]]}
+        """
+        thresholds = np.array(thresholds, dtype=float)
+        days, nodes = self.networks.shape[0], self.networks.shape[1]
+        sweep = {signal: [] for signal in signals}
+
+        if 'density' in sweep or 'prs' in sweep:
+            weights = self.networks.reshape(days, nodes * nodes)
+            order = np.argsort(weights, axis=1, kind='stable')
+            weights_sorted = np.take_along_axis(weights, order, axis=1)
+        if 'density' in sweep:
+            adjacencies_count = np.count_nonzero(self.adjacencies > 0, axis=(1, 2))
+        if 'number_edges' in sweep:
+            rows, columns = np.triu_indices(nodes)
+            edges_sorted = np.sort(np.maximum(self.networks, self.networks.transpose(0, 2, 1))[:, rows, columns],
+                                   axis=1)
+        if 'prs' in sweep:
+            countries_population = self.countries_population(population_file)
+            covid_cases = np.array(self.data_original[:, self.window_size - 1:], dtype=np.int64)
+            susceptible_cases = (countries_population[:, np.newaxis] - covid_cases).T
+            products = (susceptible_cases[:, :, np.newaxis] * susceptible_cases[:, np.newaxis, :]).reshape(days, -1)
+            # Cumulative sum from the highest weight to the lowest one, with a zero for an empty selection
+            products_suffix = np.cumsum(np.take_along_axis(products, order, axis=1)[:, ::-1], axis=1)[:, ::-1]
+            products_suffix = np.concatenate((products_suffix, np.zeros((days, 1), dtype=np.int64)), axis=1)
+
+        for t in range(days):
+            if 'density' in sweep or 'prs' in sweep:
+                greater = np.searchsorted(weights_sorted[t], thresholds, side='right')
+            if 'density' in sweep:
+                sweep['density'].append(np.divide(nodes * nodes - greater, adjacencies_count[t],
+                                                  out=np.zeros(thresholds.shape), where=adjacencies_count[t] > 0))
+            if 'number_edges' in sweep:
+                sweep['number_edges'].append(edges_sorted.shape[1] -
+                                             np.searchsorted(edges_sorted[t], thresholds, side='right'))
+            if 'prs' in sweep:
+                sweep['prs'].append(products_suffix[t, greater])
+            if 'clustering_coefficient' in sweep or 'assortativity_coefficient' in sweep:
+                clusterings = []
+                assortativities = []
+                for threshold in thresholds:
+                    g = nx.Graph((self.networks[t] > threshold).astype(int))
+                    if 'clustering_coefficient' in sweep:
+                        clusterings.append(nx.average_clustering(g) / 2)
+                    if 'assortativity_coefficient' in sweep:
+                        with warnings.catch_warnings(record=True):  # Avoid unnecessary warnings
+                            assortativities.append(nx.degree_assortativity_coefficient(g))
+                if 'clustering_coefficient' in sweep:
+                    sweep['clustering_coefficient'].append(clusterings)
+                if 'assortativity_coefficient' in sweep:
+                    sweep['assortativity_coefficient'].append(assortativities)
+
+        return {signal: np.array(values).T for signal, values in sweep.items()}
+
+    def compute_signals(self, signals=COMPUTE_SIGNALS_DEFAULT, population_file=COUNTRY_INFO):
+        """
+        Calculates several early warning signals in a single pass over the instants of study. The markers that can be
+        obtained directly from the whole list of networks are calculated at once, while the ones that need a graph use
+        the same cached graph of each instant of study.
+
+        :param [string] signals: List of the early warning signals to be calculated. List of possible values:
+                 - "density": Network density.
+                 - "number_edges": Number of edges inside the network.
+                 - "clustering_coefficient": Clustering coefficient of the network.
+                 - "assortativity_coefficient": Degree assortativity coefficient of the network.
+                 - "prs": Preparedness Risk Score (PRS) of the network.
+                 - "forman_ricci_curvature": Average Forman Ricci Curvature of all network's edges.
+                 - "leading_eigenvalue": Leading eigenvalue of the unweighted network.
+                 - "spectral_gap": Spectral gap of the unweighted network.
+                 - "algebraic_connectivity": Algebraic connectivity of the unweighted network.
+        :param string population_file: Location of the file containing additional information of each country. It must
+            have the same structure as the one described in the method prs(). Only used for the PRS.
+
+        :return: Dictionary with the name of each early warning signal as key, and as value the list of all the values
+            of that signal for each instant of study.
+        :rtype: {string: numpy [float]}
+
+        :raises:
+            ValueError: If any of the early warning signals is not in the list of possible values.
+        """
+        graph_signals = {'clustering_coefficient': self.graph_clustering,
+                         'assortativity_coefficient': self.graph_assortativity,
+                         'forman_ricci_curvature': self.graph_forman_ricci_curvature}
+        tensor_signals = {'density': self.density, 'number_edges': self.number_edges,
+                          'prs': lambda: self.prs(population_file), 'leading_eigenvalue': self.leading_eigenvalue,
+                          'spectral_gap': self.spectral_gap, 'algebraic_connectivity': self.algebraic_connectivity}
+        unknown = [signal for signal in signals if signal not in graph_signals and signal not in tensor_signals]
+        if unknown:
+            raise ValueError(f'Unknown early warning signals: {unknown}')
+
+        results = {signal: tensor_signals[signal]() for signal in signals if signal in tensor_signals}
+        graph_results = {signal: [] for signal in signals if signal in graph_signals}
+        if graph_results:
+            for t in range(len(self.networks_unweighted)):
+                g = self.network_graph(t)
+                for signal, values in graph_results.items():
+                    values.append(graph_signals[signal](g))
+        results.update({signal: np.array(values) for signal, values in graph_results.items()})
+
+        return {signal: results[signal] for signal in signals}
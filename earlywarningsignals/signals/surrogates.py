@@ -0,0 +1,118 @@
+# Data Structures and basic Algorithms Libraries
+import numpy as np
+# Generic Python Libraries
+import multiprocessing as mp
+
+# Library classes
+from earlywarningsignals.signals.landscape_dnm import EWarningLDNM
+
+# Default Parameters
+SURROGATES_DEFAULT = 100
+SURROGATE_METHOD_DEFAULT = 'shuffle'
+BATCH_SIZE_DEFAULT = 10
+PROCESSES_DEFAULT = 1
+
+
+def generate_surrogates(data, surrogates=SURROGATES_DEFAULT, method=SURROGATE_METHOD_DEFAULT, seed=None):
+    """
+    Generates a batch of surrogate versions of the data, where the time series of each country are randomized
+    independently, destroying the correlation between countries while keeping the values (or the power spectrum)
+    of each country. The result is reproducible for the same seed.
+
+    :param numpy [[float]] data: Data of the confirmed covid cases, where the Rows represent each country and the
+        Columns represent each date.
+    :param int surrogates: Number of surrogate versions of the data to be generated.
+    :param string method: Type of randomization of each time series. List of possible values:
+             - "shuffle": Random permutation of the dates.
+             - "phase": Phase randomization, which keeps the power spectrum and the mean of the time series.
+             - any other value: Random permutation of the dates.
+    :param int seed: Seed of the random number generator.
+
+    :return: Surrogate data with shape (surrogates, countries, dates).
+    :rtype: numpy [[[float]]]
+    """
+    rng = np.random.default_rng(seed)
+    data = np.asarray(data, dtype=float)
+    if method == 'phase':
+        spectrum = np.fft.rfft(data, axis=-1)
+        phases = rng.uniform(0, 2 * np.pi, size=(surrogates,) + spectrum.shape)
+        phases[..., 0] = 0  # The mean remains the same
+        if data.shape[-1] % 2 == 0:
+            phases[..., -1] = 0  # The Nyquist frequency must remain real
+        return np.fft.irfft(spectrum * np.exp(1j * phases), n=data.shape[-1], axis=-1)
+    return rng.permuted(np.broadcast_to(data, (surrogates,) + data.shape), axis=-1)
+
+
+def surrogate_markers(ew, data, marker, marker_args=(), batch_size=BATCH_SIZE_DEFAULT):
+    """
+    Calculates an early warning signal for each surrogate version of the data. The networks of each batch of
+    surrogates are generated at once with the vectorized method windows_to_networks() of the class.
+
+    :param EWarningGeneral ew: Instance of any of the classes of the library, whose method check_windows() has already
+        been called.
+    :param numpy [[[float]]] data: Surrogate data with shape (surrogates, countries, dates).
+    :param string marker: Name of the method of the class that calculates the early warning signal.
+    :param tuple marker_args: Additional arguments of the method of the early warning signal.
+    :param int batch_size: Number of surrogates whose networks are generated at once.
+
+    :return: Values of the early warning signal for each surrogate, with shape (surrogates, ...).
+    :rtype: numpy [[float]]
+
+    :raises:
+        ValueError: If the early warning signal is the L-DNM.
+    """
+    if isinstance(ew, EWarningLDNM) and marker == 'landscape_dnm':
+        raise ValueError('The L-DNM is not calculated from the networks of the surrogates, so it can\'t be tested.')
+    values = []
+    for start in range(0, len(data), batch_size):
+        for networks in ew.windows_to_networks(data[start:start + batch_size]):
+            values.append(getattr(ew.with_networks(networks), marker)(*marker_args))
+    return np.array(values)
+
+
+def surrogate_test(ew, marker, marker_args=(), surrogates=SURROGATES_DEFAULT, method=SURROGATE_METHOD_DEFAULT,
+                   seed=None, batch_size=BATCH_SIZE_DEFAULT, processes=PROCESSES_DEFAULT):
+    """
+    Tests whether the values of an early warning signal are significantly higher than the ones obtained with
+    surrogate versions of the data, where the correlation between countries has been destroyed. The surrogates are
+    generated from the class property data, so the result is reproducible for the same seed whatever the number of
+    processes. Undefined values (NaN) of the surrogates are left out of the p-value of their instant, and the p-value
+    of an undefined value of the early warning signal is also undefined.
+
+    :param EWarningGeneral ew: Instance of any of the classes of the library, whose method check_windows() has already
+        been called.
+    :param string marker: Name of the method of the class that calculates the early warning signal, for example
+        "density" or "mst_dnm".
+    :param tuple marker_args: Additional arguments of the method of the early warning signal.
+    :param int surrogates: Number of surrogate versions of the data to be generated.
+    :param string method: Type of randomization of each time series, as described in the function
+        generate_surrogates().
+    :param int seed: Seed of the random number generator.
+    :param int batch_size: Number of surrogates whose networks are generated at once.
+    :param int processes: Number of processes between which the surrogates are distributed.
+
+    :return: The p-value of each value of the early warning signal, with the same shape as the signal, and the values
+        of the early warning signal for each surrogate, with shape (surrogates, ...). The p-value is NaN if the value
+        of the early warning signal is NaN.
+    :rtype: (numpy [float], numpy [[float]])
+
+    :raises:
+        ValueError: If the early warning signal is the L-DNM.
+    """
+    if isinstance(ew, EWarningLDNM) and marker == 'landscape_dnm':
+        raise ValueError('The L-DNM is not calculated from the networks of the surrogates, so it can\'t be tested.')
+    observed = np.asarray(getattr(ew, marker)(*marker_args), dtype=float)
+    data = generate_surrogates(ew.data, surrogates, method, seed)
+
+    if processes > 1:
+        with mp.Pool(processes) as pool:
+            null_distribution = np.concatenate(pool.starmap(
+                surrogate_markers, [(ew, chunk, marker, marker_args, batch_size)
+                                    for chunk in np.array_split(data, processes) if len(chunk) > 0]))
+    else:
+        null_distribution = surrogate_markers(ew, data, marker, marker_args, batch_size)
+
+    defined = ~np.isnan(np.asarray(null_distribution, dtype=float))
+    greater = np.count_nonzero(defined & (null_distribution >= observed), axis=0)
+    p_values = (1 + greater) / (1 + np.count_nonzero(defined, axis=0))
+    return np.where(np.isnan(observed), np.nan, p_values), null_distribution
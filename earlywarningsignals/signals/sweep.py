@@ -0,0 +1,153 @@
+# Data Structures and basic Algorithms Libraries
+import pandas as pd
+import numpy as np
+# Time Library
+from datetime import timedelta
+# Generic Python Libraries
+import copy
+
+# Library classes
+from earlywarningsignals.signals.dnm import EWarningDNM
+from earlywarningsignals.signals.landscape_dnm import EWarningLDNM
+# Vectorized correlation kernels
+import earlywarningsignals.signals.correlation as correlation
+
+
+def window_size_copies(ew, window_sizes):
+    """
+    Generates a copy of a class for each window size, with the same dates, data and adjacencies as the ones obtained
+    with the method check_windows() of the class with the corresponding window size, including the shift of the start
+    date when there aren't enough previous dates. The data is imported and transformed only once, for the largest
+    window. The networks are not generated.
+
+    :param EWarningGeneral ew: Instance of any of the classes of the library, whose method check_windows() doesn't need
+        to be called.
+    :param [int] window_sizes: List of the window sizes, all of them greater than zero.
+
+    :return: Dictionary with each window size as key and a copy of the class with its data and adjacencies as value,
+        dictionary with each window size as key and the position of the first date of its data as value, and the
+        transformed data of the largest window.
+    :rtype: ({int: EWarningGeneral}, {int: int}, numpy [[float]])
+
+    :raises:
+        ValueError: If any window size is not greater than zero.
+    """
+    if min(window_sizes) < 1:
+        raise ValueError('The sweep of window sizes requires every <window_size> to be greater than zero.')
+    dnm = isinstance(ew, EWarningDNM)
+    halos = {window_size: window_size if dnm else window_size - 1 for window_size in window_sizes}
+    first_date = pd.to_datetime(ew.data_dataframe.columns[4], format='%m/%d/%y')
+    first_date_window = max(first_date, ew.start_date - timedelta(days=max(halos.values())))
+
+    data_original = ew.import_data(first_date_window)
+    data = np.asarray(ew.transform_data(first_date_window), dtype=float)
+    copies, offsets = {}, {}
+    for window_size, halo in halos.items():
+        ew_size = copy.copy(ew)
+        ew_size.start_date = max(ew.start_date, first_date + timedelta(days=halo))
+        start_date_window = ew_size.start_date - timedelta(days=halo)
+        offsets[window_size] = (start_date_window - first_date_window).days
+        ew_size.data_original = data_original[:, offsets[window_size]:]
+        ew_size.data = data[:, offsets[window_size]:]
+        # The DNM classes generate their adjacencies with one date more in the window
+        ew_size.window_size = window_size + 1 if dnm else window_size
+        ew_size.adjacencies = ew_size.generate_adjacencies(start_date_window)
+        ew_size.window_size = window_size
+        ew_size.networks_unmasked = None
+        if isinstance(ew_size, EWarningLDNM):
+            ew_size.l_dnm_s = []
+        copies[window_size] = ew_size
+    return copies, offsets, data
+
+
+def window_size_sweep(ew, window_sizes):
+    """
+    Generates the networks of a class for several window sizes at once, with the copies of the class given by the
+    function window_size_copies(). With the Pearson Correlation the cumulative sums of the data are shared by every
+    window size, so the correlation of each window is obtained with a constant number of operations. The Spearman and
+    Kendall Correlations are computed with the vectorized kernels for each window size. Each result is equal to the one
+    obtained with the method check_windows() of the class with the corresponding window size. The L-DNM is not
+    calculated.
+
+    :param EWarningGeneral ew: Instance of any of the classes of the library, whose method check_windows() doesn't need
+        to be called.
+    :param [int] window_sizes: List of the window sizes, all of them greater than zero.
+
+    :return: Dictionary with each window size as key, and as value a copy of the class with its data, adjacencies and
+        networks.
+    :rtype: {int: EWarningGeneral}
+
+    :raises:
+        ValueError: If any window size is not greater than zero.
+    """
+    copies, offsets, data = window_size_copies(ew, window_sizes)
+    pearson = ew.correlation not in ['spearman', 'kendall']
+    sums = correlation.prefix_sums(data) if pearson else None
+
+    results = {}
+    for window_size, ew_size in copies.items():
+        offset = offsets[window_size]
+        if pearson:
+            correlations, deviations = correlation.prefix_statistics(
+                ew_size.data, (sums[0][:, offset:], sums[1][:, offset:], sums[2][offset:]), window_size)
+        else:
+            windows = correlation.sliding_windows(ew_size.data, window_size)
+            correlations, deviations = (correlation.correlation_matrices(windows, ew_size.correlation),
+                                        np.std(windows, axis=-1, ddof=1))
+        results[window_size] = ew_size.with_networks(ew_size.networks_from_statistics(correlations, deviations))
+    return results
+
+
+def correlation_sweep(ew, correlations):
+    """
+    Generates the networks of a class for several types of correlation at once. The data is imported and transformed
+    once, the windows and their standard deviations are computed once, the adjacencies are generated once, and the
+    ranks of the windows are shared by the Spearman and Kendall Correlations. Each result is equal to the one obtained
+    with the method check_windows() of the class with the corresponding type of correlation. The L-DNM is not
+    calculated.
+
+    :param EWarningGeneral ew: Instance of any of the classes of the library with window size greater than zero, whose
+        method check_windows() doesn't need to be called.
+    :param [string] correlations: List of the types of correlation, as described in the function
+        correlation.correlation_matrices().
+
+    :return: Dictionary with each type of correlation as key, and as value a copy of the class with its data,
+        adjacencies and networks.
+    :rtype: {string: EWarningGeneral}
+
+    :raises:
+        ValueError: If the window size is not greater than zero.
+    """
+    ew_size = window_size_copies(ew, [ew.window_size])[0][ew.window_size]
+    windows = correlation.sliding_windows(ew_size.data, ew_size.window_size)
+    deviations = np.std(windows, axis=-1, ddof=1)
+
+    results = {}
+    for correlation_type, correlation_matrices in correlation.multiple_correlation_matrices(windows,
+                                                                                            correlations).items():
+        ew_correlation = copy.copy(ew_size)
+        ew_correlation.correlation = correlation_type
+        results[correlation_type] = ew_correlation.with_networks(
+            ew_correlation.networks_from_statistics(correlation_matrices, deviations))
+    return results
+
+
+def window_size_markers(ew, window_sizes, markers):
+    """
+    Calculates several early warning signals of a class for several window sizes at once, with the networks generated
+    by the function window_size_sweep().
+
+    :param EWarningGeneral ew: Instance of any of the classes of the library.
+    :param [int] window_sizes: List of the window sizes, all of them greater than zero.
+    :param [string] markers: List of the names of the methods of the class that calculate the early warning signals,
+        for example "density" or "mst_dnm".
+
+    :return: Dictionary with each window size as key, and as value a dictionary with the name of each early warning
+        signal as key and its values as value.
+    :rtype: {int: {string: numpy [float]}}
+
+    :raises:
+        ValueError: If any window size is not greater than zero.
+    """
+    return {window_size: {marker: np.asarray(getattr(ew_size, marker)()) for marker in markers}
+            for window_size, ew_size in window_size_sweep(ew, window_sizes).items()}
@@ -0,0 +1,106 @@
+import unittest
+import pandas as pd
+import numpy as np
+
+from earlywarningsignals import COVID_CRIDA_CUMULATIVE
+from earlywarningsignals.signals import EWarningSpecific, EWarningDNM, EWarningLDNM
+from earlywarningsignals.signals.bootstrap import block_indices, bootstrap_markers, bootstrap_bands
+
+
+class MyTestCase(unittest.TestCase):
+    """
+    Unittest Class used to test the block bootstrap confidence bands.
+    """
+
+    def test_block_indices_1(self):
+        """
+        Tests that the function block_indices() returns reproducible positions inside each window, made of blocks of
+        consecutive dates.
+        """
+        indices = block_indices(replicates=4, windows=6, window_size=10, block_size=3, seed=0)
+
+        self.assertEqual(indices.shape, (4, 6, 10))
+        self.assertTrue(np.all((indices >= 0) & (indices < 10)))
+        self.assertTrue(np.all(np.diff(indices[..., :3], axis=-1) == 1))
+        self.assertTrue(np.array_equal(indices, block_indices(replicates=4, windows=6, window_size=10, block_size=3,
+                                                              seed=0)))
+        self.assertEqual(block_indices(replicates=2, windows=3, window_size=5, block_size=5).tolist(),
+                         [[[0, 1, 2, 3, 4]] * 3] * 2)
+
+    def test_bootstrap_bands_1(self):
+        """
+        Tests that the function bootstrap_bands() returns bands aligned with the early warning signals, which contain
+        the original values when each window is resampled as a single block.
+        """
+        ew = EWarningSpecific(covid_file=COVID_CRIDA_CUMULATIVE,
+                              start_date=pd.to_datetime('2020-02-15', format='%Y-%m-%d'),
+                              end_date=pd.to_datetime('2020-03-01', format='%Y-%m-%d'),
+                              window_size=14, correlation='pearson', threshold=0.5,
+                              cumulative_data=False, square_root_data=True, progress_bar=False)
+        ew.check_windows()
+
+        lower, upper = bootstrap_bands(ew, 'clustering_coefficient', replicates=3, block_size=14, seed=0)
+        self.assertTrue(np.allclose(lower, ew.clustering_coefficient()))
+        self.assertTrue(np.allclose(upper, ew.clustering_coefficient()))
+
+        lower, upper = bootstrap_bands(ew, 'density', replicates=20, block_size=3, confidence=0.9, seed=0)
+        self.assertEqual(lower.shape, ew.density().shape)
+        self.assertTrue(np.all(lower <= upper))
+
+    def test_bootstrap_bands_2(self):
+        """
+        Tests that the function bootstrap_bands() also works for EWarningDNM, and that it throws an Exception when
+        there is no window size.
+        """
+        ew = EWarningDNM(covid_file=COVID_CRIDA_CUMULATIVE,
+                         start_date=pd.to_datetime('2020-02-15', format='%Y-%m-%d'),
+                         end_date=pd.to_datetime('2020-03-01', format='%Y-%m-%d'),
+                         window_size=7, correlation='spearman', cumulative_data=False,
+                         progress_bar=False)
+        ew.check_windows()
+
+        lower, upper = bootstrap_bands(ew, 'mst_dnm', replicates=2, block_size=7, seed=1)
+        self.assertTrue(np.allclose(lower, ew.mst_dnm()))
+        self.assertTrue(np.allclose(upper, ew.mst_dnm()))
+
+        ew.window_size = 0
+        with self.assertRaises(ValueError):
+            bootstrap_bands(ew, 'mst_dnm', replicates=2)
+
+    def test_bootstrap_bands_3(self):
+        """
+        Tests that the function bootstrap_bands() keeps the pairing of the two windows of each network of EWarningDNM
+        when the blocks are smaller than the windows, so the bands contain the original early warning signal.
+        """
+        ew = EWarningDNM(covid_file=COVID_CRIDA_CUMULATIVE,
+                         start_date=pd.to_datetime('2020-03-01', format='%Y-%m-%d'),
+                         end_date=pd.to_datetime('2020-03-31', format='%Y-%m-%d'),
+                         window_size=7, cumulative_data=False, progress_bar=False)
+        ew.check_windows()
+
+        values = bootstrap_markers(ew, 'mst_dnm', replicates=50, block_size=3, seed=0)
+        self.assertFalse(np.allclose(values, ew.mst_dnm()))
+        lower, upper = np.nanquantile(values, [0.025, 0.975], axis=0)
+        self.assertTrue(np.all((lower <= ew.mst_dnm()) & (ew.mst_dnm() <= upper)))
+
+    def test_bootstrap_bands_4(self):
+        """
+        Tests that the function bootstrap_bands() throws an Exception for the L-DNM of EWarningLDNM, which can't be
+        obtained from the networks of the replicates, while the rest of early warning signals of the class have bands.
+        """
+        ew = EWarningLDNM(covid_file=COVID_CRIDA_CUMULATIVE,
+                          start_date=pd.to_datetime('2020-03-01', format='%Y-%m-%d'),
+                          end_date=pd.to_datetime('2020-03-05', format='%Y-%m-%d'),
+                          countries=['ES', 'FR', 'IT', 'DE', 'PT'], static_adjacency=np.ones((5, 5)) - np.eye(5),
+                          window_size=7, cumulative_data=False, progress_bar=False)
+        ew.check_windows()
+
+        with self.assertRaises(ValueError):
+            bootstrap_bands(ew, 'landscape_dnm', replicates=5, seed=0)
+        lower, upper = bootstrap_bands(ew, 'mst_dnm', replicates=5, seed=0)
+        self.assertEqual(lower.shape, ew.mst_dnm().shape)
+        self.assertTrue(np.all(lower <= upper))
+
+
+if __name__ == '__main__':
+    unittest.main()
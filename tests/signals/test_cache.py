@@ -0,0 +1,82 @@
+import unittest
+import tempfile
+import os
+import pandas as pd
+import numpy as np
+
+from earlywarningsignals import COVID_CRIDA_CUMULATIVE
+from earlywarningsignals.signals import EWarningSpecific, EWarningLDNM
+from earlywarningsignals.signals.cache import cache_key, cache_entries, check_windows_cached
+
+
+class MyTestCase(unittest.TestCase):
+    """
+    Unittest Class used to test the cache of the results of the method check_windows().
+    """
+
+    @staticmethod
+    def specific(threshold=0.5):
+        """
+        Generates the instance of the class EWarningSpecific used by the tests.
+
+        :param float threshold: Threshold of the class.
+
+        :return: The new constructed class.
+        :rtype: EWarningSpecific
+        """
+        return EWarningSpecific(covid_file=COVID_CRIDA_CUMULATIVE,
+                                start_date=pd.to_datetime('2020-01-25', format='%Y-%m-%d'),
+                                end_date=pd.to_datetime('2020-03-01', format='%Y-%m-%d'),
+                                countries=['ES', 'FR', 'IT', 'DE', 'PT'], window_size=7, threshold=threshold,
+                                static_adjacency=np.ones((5, 5)) - np.eye(5), cumulative_data=False,
+                                progress_bar=False)
+
+    def test_cache_key_1(self):
+        """
+        Tests that the function cache_key() generates the same key for classes with the same parameters, and a
+        different one when any parameter changes.
+        """
+        self.assertEqual(cache_key(self.specific()), cache_key(self.specific()))
+        self.assertNotEqual(cache_key(self.specific()), cache_key(self.specific(threshold=0.6)))
+
+    def test_check_windows_cached_1(self):
+        """
+        Tests that the function check_windows_cached() reads from the cache the same results as the method
+        check_windows(), including the shifted start date, and only for the same parameters.
+        """
+        ew = self.specific()
+        ew.check_windows()
+
+        with tempfile.TemporaryDirectory() as directory:
+            self.assertFalse(check_windows_cached(self.specific(), directory))
+            cached = self.specific()
+            self.assertTrue(check_windows_cached(cached, directory))
+            self.assertEqual(cached.start_date, ew.start_date)
+            for attribute in ['data_original', 'data', 'adjacencies', 'networks', 'networks_unweighted']:
+                self.assertTrue(np.array_equal(getattr(cached, attribute), getattr(ew, attribute)))
+            self.assertEqual(cached.density().tolist(), ew.density().tolist())
+            self.assertFalse(check_windows_cached(self.specific(threshold=0.6), directory))
+
+    def test_check_windows_cached_2(self):
+        """
+        Tests that the function check_windows_cached() stores the L-DNM of each country, and that it removes the least
+        recently used entries when the cache is too big.
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            for countries in [['ES', 'FR', 'IT'], ['ES', 'FR', 'DE'], ['ES', 'FR', 'IT']]:
+                ew = EWarningLDNM(covid_file=COVID_CRIDA_CUMULATIVE,
+                                  start_date=pd.to_datetime('2020-02-15', format='%Y-%m-%d'),
+                                  end_date=pd.to_datetime('2020-03-01', format='%Y-%m-%d'),
+                                  countries=countries, window_size=5, static_adjacency=np.ones((3, 3)) - np.eye(3),
+                                  cumulative_data=False, progress_bar=False)
+                check_windows_cached(ew, directory)
+            self.assertEqual(len(cache_entries(directory)), 2)
+            self.assertTrue(cache_entries(directory)[-1][0].endswith(cache_key(ew)))
+            self.assertEqual(ew.l_dnm_s.shape, (3, 16))
+
+            check_windows_cached(ew, directory, max_size=cache_entries(directory)[-1][1])
+            self.assertEqual([os.path.basename(path) for path, _ in cache_entries(directory)], [cache_key(ew)])
+
+
+if __name__ == '__main__':
+    unittest.main()
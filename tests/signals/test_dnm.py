@@ -274,6 +274,43 @@ class MyTestCase(unittest.TestCase):
 
         self.assertEqual([round(x, 10) for x in ew.mst_dnm()], [round(x, 10) for x in mst_dnm_s])
 
+    def test_mst_dnm_5(self):
+        """
+        Tests that the method mst_dnm() from the EWarningDNM doesn't modify the networks, even when they contain
+        edges with a weight lower than the minimum one considered by the markers.
+        """
+        ew = EWarningDNM(covid_file=COVID_CRIDA_CUMULATIVE,
+                         start_date=pd.to_datetime('2020-02-01', format='%Y-%m-%d'),
+                         end_date=pd.to_datetime('2020-03-01', format='%Y-%m-%d'),
+                         window_size=14, correlation='spearman', cumulative_data=True,
+                         progress_bar=False)
+        ew.check_windows()
+        ew.networks[:, 0, 1] = ew.networks[:, 1, 0] = 1.0e-13
+        networks = ew.networks.copy()
+        mst_dnm_s = ew.mst_dnm()
+
+        self.assertTrue(np.array_equal(ew.networks, networks))
+        ew.networks[ew.networks < 1.0e-12] = 0.
+        self.assertEqual([round(x, 10) for x in mst_dnm_s], [round(x, 10) for x in ew.mst_dnm()])
+
+    def test_spectral_markers_1(self):
+        """
+        Tests that the methods leading_eigenvalue(), spectral_gap() and algebraic_connectivity() from EWarningDNM
+        return the same values as the spectra of each weighted network obtained with numpy.
+        """
+        ew = EWarningDNM(covid_file=COVID_CRIDA_CUMULATIVE,
+                         start_date=pd.to_datetime('2020-02-01', format='%Y-%m-%d'),
+                         end_date=pd.to_datetime('2020-03-01', format='%Y-%m-%d'),
+                         window_size=14, correlation='pearson', cumulative_data=False,
+                         progress_bar=False)
+        ew.check_windows()
+        adjacency_spectra = [np.linalg.eigvalsh(network) for network in ew.networks]
+        laplacian_spectra = [np.linalg.eigvalsh(np.diag(network.sum(axis=1)) - network) for network in ew.networks]
+
+        self.assertTrue(np.allclose(ew.leading_eigenvalue(), [spectrum[-1] for spectrum in adjacency_spectra]))
+        self.assertTrue(np.allclose(ew.spectral_gap(), [spectrum[-1] - spectrum[-2] for spectrum in adjacency_spectra]))
+        self.assertTrue(np.allclose(ew.algebraic_connectivity(), [spectrum[1] for spectrum in laplacian_spectra]))
+
     def test_sp_dnm_1(self):
         """
         Tests that the method sp_dnm() from the EWarningDNM returns the correct List with a 10 decimal precision.
@@ -430,6 +467,67 @@ class MyTestCase(unittest.TestCase):
         self.assertEqual(str(context.exception), 'Some ISO-3166-Alpha2 references for the paths are '
                                                  'incorrect or not established in the Class.')
 
+    def test_sp_dnm_7(self):
+        """
+        Tests that the method sp_dnm() from the EWarningDNM with all_pairs = True returns the shortest path between
+        every pair of different countries, with the same values as the ones obtained specifying each path.
+        """
+        ew = EWarningDNM(covid_file=COVID_CRIDA_CUMULATIVE,
+                         start_date=pd.to_datetime('2020-02-01', format='%Y-%m-%d'),
+                         end_date=pd.to_datetime('2020-03-01', format='%Y-%m-%d'),
+                         window_size=14, correlation='pearson', cumulative_data=False,
+                         progress_bar=False)
+        ew.check_windows()
+        paths = [(origen, destination) for i, origen in enumerate(ew.countries) for destination in ew.countries[i + 1:]]
+        sp_dnm_s = ew.sp_dnm(all_pairs=True)
+
+        self.assertEqual(sp_dnm_s.shape, (1035, len(ew.networks)))
+        self.assertEqual([[round(i, 10) for i in path] for path in sp_dnm_s],
+                         [[round(i, 10) for i in path] for path in ew.sp_dnm(paths)])
+        self.assertEqual([[round(i, 10) for i in path] for path in sp_dnm_s[[paths.index(('IT', 'NO'))]]],
+                         [[round(i, 10) for i in path] for path in ew.sp_dnm([('NO', 'IT')])])
+
+    def test_executor_1(self):
+        """
+        Tests that the method check_windows() from the EWarningDNM returns the same networks whatever the executor used
+        to compute the windows, with and without window size.
+        """
+        for window_size in [0, 7]:
+            networks = []
+            for executor in ['serial', 'thread', 'process']:
+                ew = EWarningDNM(covid_file=COVID_CRIDA_CUMULATIVE,
+                                 start_date=pd.to_datetime('2020-02-20', format='%Y-%m-%d'),
+                                 end_date=pd.to_datetime('2020-03-10', format='%Y-%m-%d'),
+                                 window_size=window_size, correlation='spearman', cumulative_data=False,
+                                 progress_bar=False, executor=executor, workers=3)
+                ew.check_windows()
+                networks.append(ew.networks)
+
+            self.assertTrue(np.array_equal(networks[0], networks[1]))
+            self.assertTrue(np.array_equal(networks[0], networks[2]))
+
+    def test_with_adjacencies_1(self):
+        """
+        Tests that the method with_adjacencies() from the EWarningDNM returns the same networks and early warning
+        signals as the class constructed with the new adjacency, with and without window size.
+        """
+        countries = ['ES', 'FR', 'IT', 'DE', 'PT']
+        static_adjacency = np.array([[0, 1, 0, 1, 1], [1, 0, 1, 0, 0], [0, 1, 0, 1, 1], [1, 0, 1, 0, 0],
+                                     [1, 0, 1, 0, 0]])
+        for window_size in [0, 7]:
+            parameters = dict(covid_file=COVID_CRIDA_CUMULATIVE,
+                              start_date=pd.to_datetime('2020-02-20', format='%Y-%m-%d'),
+                              end_date=pd.to_datetime('2020-03-10', format='%Y-%m-%d'),
+                              countries=countries, window_size=window_size, cumulative_data=False, progress_bar=False)
+            ew = EWarningDNM(static_adjacency=np.ones((5, 5)) - np.eye(5), keep_unmasked=True, **parameters)
+            ew.check_windows()
+            ew_static = EWarningDNM(static_adjacency=static_adjacency, **parameters)
+            ew_static.check_windows()
+
+            ew_adjacencies = ew.with_adjacencies(ew_static.adjacencies)
+            self.assertTrue(np.array_equal(ew_adjacencies.networks, ew_static.networks))
+            self.assertEqual(ew_adjacencies.mst_dnm().tolist(), ew_static.mst_dnm().tolist())
+
 
 if __name__ == '__main__':
     unittest.main()
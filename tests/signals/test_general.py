@@ -1,4 +1,5 @@
 import unittest
+import tempfile
 
 import numpy as np
 import pandas as pd
@@ -206,6 +207,181 @@ class TestEWarningGeneral(unittest.TestCase):
 
         self.assertEqual(ew.start_date, pd.to_datetime('2020-02-10', format='%Y-%m-%d'))
 
+    def test_k_fold_changes_1(self):
+        """
+        Tests that the method k_fold_changes() from the EWarningGeneral Class returns the correct tipping points for a
+        single time series, and for a matrix where each Row is an independent time series.
+        """
+        series = np.array([[1, 3, 0, 2, 8, 9], [2, 2, 5, 1, 1, 3]])
+
+        self.assertEqual(EWarningGeneral.k_fold_changes(series[0], k_fold=2, step=2).tolist(), [0, 1, 0, 0, 1, 1])
+        self.assertEqual(EWarningGeneral.k_fold_changes(series, k_fold=2, step=2).tolist(),
+                         [[0, 1, 0, 0, 1, 1], [0, 0, 1, 0, 0, 1]])
+        self.assertEqual(EWarningGeneral.k_fold_changes(series[0], k_fold=2, step=6).tolist(), [0, 0, 0, 0, 0, 0])
+
+    def test_k_fold_changes_multiple_1(self):
+        """
+        Tests that the method k_fold_changes_multiple() from the EWarningGeneral Class returns the correct tipping
+        points of a group of time series for different values of rate_compare.
+        """
+        series = np.array([[1, 3, 0, 2, 8, 9], [2, 2, 5, 1, 1, 3]])
+
+        self.assertEqual(EWarningGeneral.k_fold_changes_multiple(series, k_fold=2, step=2, rate_compare=0.5).tolist(),
+                         [0, 1, 1, 1, 1, 1])
+        self.assertEqual(EWarningGeneral.k_fold_changes_multiple(series, k_fold=2, step=2, rate_compare=1).tolist(),
+                         [0, 0, 0, 0, 0, 1])
+        self.assertEqual(EWarningGeneral.k_fold_changes_multiple(series[0], k_fold=2, step=2).tolist(),
+                         EWarningGeneral.k_fold_changes(series[0], k_fold=2, step=2).tolist())
+
+    def test_k_fold_changes_grid_1(self):
+        """
+        Tests that the method k_fold_changes_grid() from the EWarningGeneral Class returns for every combination of
+        parameters the same tipping points as the method k_fold_changes_multiple(), and the number of them.
+        """
+        series = np.array([[1, 3, 0, 2, 8, 9], [2, 2, 5, 1, 1, 3], [0, 1, 4, 4, 2, 9]])
+        k_folds, steps, rates_compare = [1, 2, 3.5], [1, 2, 4], [0.3, 0.5, 1]
+
+        tipping_points, counts = EWarningGeneral.k_fold_changes_grid(series, k_folds, steps, rates_compare)
+        self.assertEqual(tipping_points.shape, (3, 3, 3, 6))
+        for i, k_fold in enumerate(k_folds):
+            for j, step in enumerate(steps):
+                for k, rate_compare in enumerate(rates_compare):
+                    expected = EWarningGeneral.k_fold_changes_multiple(series, k_fold, step, rate_compare)
+                    self.assertEqual(tipping_points[i, j, k].tolist(), expected.tolist())
+                    self.assertEqual(counts[i, j, k], sum(expected))
+
+    def test_save_load_1(self):
+        """
+        Tests that the method load() from the EWarningGeneral Class recovers the same class saved with the method
+        save(), with the arrays memory-mapped or compressed in chunks of dates.
+        """
+        ew = EWarningGeneral(covid_file=COVID_CRIDA_CUMULATIVE,
+                             start_date=pd.to_datetime('2020-02-20', format='%Y-%m-%d'),
+                             end_date=pd.to_datetime('2020-03-10', format='%Y-%m-%d'),
+                             countries=['ES', 'FR', 'IT', 'DE', 'PT'], window_size=7,
+                             static_adjacency=np.ones((5, 5)) - np.eye(5), progress_bar=False)
+        ew.check_windows()
+
+        for compress, mmap in [(False, False), (False, True), (True, False)]:
+            with tempfile.TemporaryDirectory() as name:
+                ew.save(name, compress=compress, chunk_days=4)
+                loaded = EWarningGeneral.load(name, mmap=mmap)
+                self.assertEqual(isinstance(loaded.networks, np.memmap), mmap)
+                self.assertEqual(loaded.countries, ew.countries)
+                self.assertEqual(loaded.start_date, ew.start_date)
+                for attribute in ['data_original', 'data', 'adjacencies', 'networks']:
+                    self.assertTrue(np.array_equal(getattr(loaded, attribute), getattr(ew, attribute)))
+                del loaded
+
+    def test_save_load_2(self):
+        """
+        Tests that the method load() from the EWarningGeneral Class reads only an interval of dates, obtaining the same
+        networks as the class constructed for that interval, and that it fails for dates out of the saved ones.
+        """
+        ew = EWarningGeneral(covid_file=COVID_CRIDA_CUMULATIVE,
+                             start_date=pd.to_datetime('2020-02-20', format='%Y-%m-%d'),
+                             end_date=pd.to_datetime('2020-03-10', format='%Y-%m-%d'),
+                             countries=['ES', 'FR', 'IT', 'DE', 'PT'], window_size=7,
+                             static_adjacency=np.ones((5, 5)) - np.eye(5), progress_bar=False)
+        ew.check_windows()
+        ew_march = EWarningGeneral(covid_file=COVID_CRIDA_CUMULATIVE,
+                                   start_date=pd.to_datetime('2020-03-01', format='%Y-%m-%d'),
+                                   end_date=pd.to_datetime('2020-03-05', format='%Y-%m-%d'),
+                                   countries=['ES', 'FR', 'IT', 'DE', 'PT'], window_size=7,
+                                   static_adjacency=np.ones((5, 5)) - np.eye(5), progress_bar=False)
+        ew_march.check_windows()
+
+        for compress in [False, True]:
+            with tempfile.TemporaryDirectory() as name:
+                ew.save(name, compress=compress, chunk_days=4)
+                loaded = EWarningGeneral.load(name, start_date=pd.to_datetime('2020-03-01', format='%Y-%m-%d'),
+                                              end_date=pd.to_datetime('2020-03-05', format='%Y-%m-%d'))
+                self.assertEqual(loaded.start_date, ew_march.start_date)
+                self.assertEqual(loaded.end_date, ew_march.end_date)
+                for attribute in ['data_original', 'data', 'adjacencies', 'networks']:
+                    self.assertTrue(np.array_equal(getattr(loaded, attribute), getattr(ew_march, attribute)))
+                with self.assertRaises(DateOutRangeException):
+                    EWarningGeneral.load(name, end_date=pd.to_datetime('2020-03-11', format='%Y-%m-%d'))
+
+    def test_executor_1(self):
+        """
+        Tests that the method check_windows() from the EWarningGeneral Class returns the same networks whatever the
+        executor used to compute the windows.
+        """
+        networks = []
+        for executor in ['serial', 'thread', 'process']:
+            ew = EWarningGeneral(covid_file=COVID_CRIDA_CUMULATIVE,
+                                 start_date=pd.to_datetime('2020-02-20', format='%Y-%m-%d'),
+                                 end_date=pd.to_datetime('2020-03-10', format='%Y-%m-%d'),
+                                 countries=['ES', 'FR', 'IT', 'DE', 'PT'], window_size=7, correlation='kendall',
+                                 static_adjacency=np.ones((5, 5)) - np.eye(5), progress_bar=False,
+                                 executor=executor, workers=3)
+            ew.check_windows()
+            networks.append(ew.networks)
+
+        self.assertEqual(networks[0].shape, (20, 5, 5))
+        self.assertTrue(np.array_equal(networks[0], networks[1]))
+        self.assertTrue(np.array_equal(networks[0], networks[2]))
+
+    def test_with_adjacencies_1(self):
+        """
+        Tests that the method with_adjacencies() from the EWarningGeneral Class returns the same networks as the class
+        constructed with the new adjacency, and that the method restricted_adjacencies() only modifies the edges of
+        the restricted countries between the given dates.
+        """
+        parameters = dict(covid_file=COVID_CRIDA_CUMULATIVE,
+                          start_date=pd.to_datetime('2020-02-20', format='%Y-%m-%d'),
+                          end_date=pd.to_datetime('2020-03-10', format='%Y-%m-%d'),
+                          countries=['ES', 'FR', 'IT', 'DE', 'PT'], window_size=7, progress_bar=False)
+        static_adjacency = np.array([[0, 1, 0, 1, 1], [1, 0, 1, 0, 0], [0, 1, 0, 1, 1], [1, 0, 1, 0, 0],
+                                     [1, 0, 1, 0, 0]])
+        ew = EWarningGeneral(static_adjacency=np.ones((5, 5)) - np.eye(5), keep_unmasked=True, **parameters)
+        ew.check_windows()
+        ew_static = EWarningGeneral(static_adjacency=static_adjacency, **parameters)
+        ew_static.check_windows()
+        self.assertIsNone(ew_static.networks_unmasked)
+        with self.assertRaises(ValueError):
+            ew_static.with_adjacencies(ew.adjacencies)
+
+        ew_adjacencies = ew.with_adjacencies(ew_static.adjacencies)
+        self.assertTrue(np.array_equal(ew_adjacencies.networks, ew_static.networks))
+        self.assertTrue(np.array_equal(ew.networks, ew.networks_unmasked * ew.adjacencies))
+
+        adjacencies = ew.restricted_adjacencies(['IT'], start_date=pd.to_datetime('2020-03-01', format='%Y-%m-%d'))
+        self.assertTrue(np.array_equal(adjacencies[:10], ew.adjacencies[:10]))
+        self.assertEqual(adjacencies[10:, ew.countries_index['IT']].sum(), 0)
+        self.assertEqual(adjacencies[10:, :, ew.countries_index['IT']].sum(), 0)
+        self.assertEqual(adjacencies[10:].sum(), 12 * 10)
+        self.assertEqual(ew.with_adjacencies(adjacencies).networks[10:, ew.countries_index['IT']].sum(), 0)
+        with self.assertRaises(CountryUndefinedException):
+            ew.restricted_adjacencies(['GB'])
+
+    def test_restricted_adjacencies_1(self):
+        """
+        Tests that the method restricted_adjacencies() from the EWarningGeneral Class doesn't restrict any adjacency
+        when the dates of the restrictions are out of the dates of the adjacencies, and that it throws an Exception when
+        the dates are inverted.
+        """
+        ew = EWarningGeneral(covid_file=COVID_CRIDA_CUMULATIVE,
+                             start_date=pd.to_datetime('2020-02-20', format='%Y-%m-%d'),
+                             end_date=pd.to_datetime('2020-03-10', format='%Y-%m-%d'),
+                             countries=['ES', 'FR', 'IT', 'DE', 'PT'], window_size=7,
+                             static_adjacency=np.ones((5, 5)) - np.eye(5), progress_bar=False)
+        ew.check_windows()
+
+        for start_date, end_date in [('2020-01-01', '2020-01-31'), ('2020-04-01', '2020-04-30')]:
+            adjacencies = ew.restricted_adjacencies(['IT'], start_date=pd.to_datetime(start_date, format='%Y-%m-%d'),
+                                                    end_date=pd.to_datetime(end_date, format='%Y-%m-%d'))
+            self.assertTrue(np.array_equal(adjacencies, ew.adjacencies))
+
+        adjacencies = ew.restricted_adjacencies(['IT'], start_date=pd.to_datetime('2020-01-01', format='%Y-%m-%d'),
+                                                end_date=pd.to_datetime('2020-02-20', format='%Y-%m-%d'))
+        self.assertEqual(adjacencies[0, ew.countries_index['IT']].sum(), 0)
+        self.assertTrue(np.array_equal(adjacencies[1:], ew.adjacencies[1:]))
+        with self.assertRaises(ValueError):
+            ew.restricted_adjacencies(['IT'], start_date=pd.to_datetime('2020-03-05', format='%Y-%m-%d'),
+                                      end_date=pd.to_datetime('2020-03-01', format='%Y-%m-%d'))
+
 
 if __name__ == '__main__':
     unittest.main()
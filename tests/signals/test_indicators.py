@@ -0,0 +1,86 @@
+import unittest
+import pandas as pd
+import numpy as np
+from scipy import stats
+
+from earlywarningsignals import COVID_CRIDA_CUMULATIVE
+from earlywarningsignals.signals import EWarningSpecific, EWarningDNM
+from earlywarningsignals.signals.indicators import critical_slowing_down
+
+
+class MyTestCase(unittest.TestCase):
+    """
+    Unittest Class used to test the critical slowing down indicators.
+    """
+
+    def assert_indicators(self, indicators, data, starts, ends):
+        """
+        Checks the indicators of every country and window against the ones obtained with numpy and scipy for each
+        window separately.
+        """
+        for t, (start, end) in enumerate(zip(starts, ends)):
+            for i, series in enumerate(data[:, start:end].astype(float)):
+                self.assertAlmostEqual(indicators['variance'][i, t], np.var(series, ddof=1), places=6)
+                if np.std(series) > 0:
+                    self.assertAlmostEqual(indicators['skewness'][i, t], stats.skew(series), places=6)
+                    self.assertAlmostEqual(indicators['coefficient_variation'][i, t],
+                                           np.std(series, ddof=1) / np.mean(series), places=6)
+                else:
+                    self.assertTrue(np.isnan(indicators['skewness'][i, t]))
+                if np.std(series[:-1]) > 0 and np.std(series[1:]) > 0:
+                    self.assertAlmostEqual(indicators['autocorrelation'][i, t],
+                                           stats.pearsonr(series[:-1], series[1:])[0], places=6)
+                else:
+                    self.assertTrue(np.isnan(indicators['autocorrelation'][i, t]))
+
+    def test_critical_slowing_down_1(self):
+        """
+        Tests that the function critical_slowing_down() returns the indicators of each country for the windows of
+        each instant of study of EWarningSpecific.
+        """
+        countries = ['AL', 'BE', 'FR', 'ES', 'SE', 'CH', 'GB', 'TR', 'UA']
+
+        static_adjacency = np.ones(shape=(len(countries), len(countries)))
+        np.fill_diagonal(static_adjacency, 0)
+
+        ew = EWarningSpecific(covid_file=COVID_CRIDA_CUMULATIVE,
+                              start_date=pd.to_datetime('2020-02-10', format='%Y-%m-%d'),
+                              end_date=pd.to_datetime('2020-03-15', format='%Y-%m-%d'),
+                              countries=countries, window_size=14, correlation='pearson', threshold=0.5,
+                              cumulative_data=False, square_root_data=True,
+                              static_adjacency=static_adjacency, progress_bar=False)
+        ew.check_windows()
+        indicators = critical_slowing_down(ew)
+
+        self.assertEqual(indicators['variance'].shape, (len(countries), len(ew.networks)))
+        ends = np.arange(14, ew.data.shape[1] + 1)
+        self.assert_indicators(indicators, ew.data, ends - 14, ends)
+
+    def test_critical_slowing_down_2(self):
+        """
+        Tests that the function critical_slowing_down() returns the indicators of each country for the windows of
+        each instant of study of EWarningDNM, with and without window size.
+        """
+        countries = ['AL', 'BE', 'FR', 'ES', 'SE', 'CH', 'GB', 'TR', 'UA']
+
+        static_adjacency = np.ones(shape=(len(countries), len(countries)))
+        np.fill_diagonal(static_adjacency, 0)
+
+        for window_size in [0, 7]:
+            ew = EWarningDNM(covid_file=COVID_CRIDA_CUMULATIVE,
+                             start_date=pd.to_datetime('2020-02-10', format='%Y-%m-%d'),
+                             end_date=pd.to_datetime('2020-03-15', format='%Y-%m-%d'),
+                             countries=countries, window_size=window_size, correlation='pearson',
+                             cumulative_data=True, static_adjacency=static_adjacency, progress_bar=False)
+            ew.check_windows()
+            indicators = critical_slowing_down(ew, ['variance', 'autocorrelation', 'skewness',
+                                                    'coefficient_variation'])
+
+            self.assertEqual(indicators['autocorrelation'].shape, (len(countries), len(ew.networks)))
+            ends = np.arange(ew.data.shape[1] - len(ew.networks) + 1, ew.data.shape[1] + 1)
+            starts = ends - window_size if window_size else np.zeros(ends.shape, dtype=int)
+            self.assert_indicators(indicators, ew.data, starts, ends)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,4 +1,7 @@
 import unittest
+from unittest import mock
+import tempfile
+import os
 import pandas as pd
 import numpy as np
 
@@ -115,6 +118,61 @@ class MyTestCase(unittest.TestCase):
         self.assertEqual([[round(i, 10) for i in path] for path in ew.landscape_dnm()],
                          [[round(i, 10) for i in path] for path in landscape_dnm_s])
 
+    def test_checkpoint_1(self):
+        """
+        Tests that the EWarningLDNM saves a checkpoint of the days already calculated, writing a new file for each
+        interval, and that an interrupted run is resumed from the checkpoint obtaining the same networks and L-DNM as a
+        run without interruptions, with and without window size. Classes with different dates don't share the
+        checkpoint.
+        """
+        for window_size in [0, 5]:
+            parameters = dict(covid_file=COVID_CRIDA_CUMULATIVE,
+                              start_date=pd.to_datetime('2020-02-15', format='%Y-%m-%d'),
+                              end_date=pd.to_datetime('2020-03-01', format='%Y-%m-%d'),
+                              countries=['ES', 'FR', 'IT'], window_size=window_size, correlation='kendall',
+                              cumulative_data=False, static_adjacency=np.ones((3, 3)) - np.eye(3), progress_bar=False)
+            ew = EWarningLDNM(**parameters)
+            ew.check_windows()
+
+            with tempfile.TemporaryDirectory() as directory:
+                window_to_network = EWarningLDNM.window_to_network
+                calculated = []
+
+                def interrupt(self, window_t0, window_t1, index):
+                    if index == 10:
+                        raise KeyboardInterrupt
+                    calculated.append(index)
+                    return window_to_network(self, window_t0, window_t1, index)
+
+                with mock.patch.object(EWarningLDNM, 'window_to_network', autospec=True, side_effect=interrupt):
+                    interrupted = EWarningLDNM(checkpoint_dir=directory, checkpoint_interval=4, **parameters)
+                    with self.assertRaises(KeyboardInterrupt):
+                        interrupted.check_windows()
+                    folder = os.path.join(directory, os.listdir(directory)[0])
+                    self.assertEqual(sorted(os.listdir(folder)), ['0.npz', '4.npz'])
+                    for name in ['0.npz', '4.npz']:
+                        with np.load(os.path.join(folder, name)) as f:
+                            self.assertEqual(f['networks'].shape[0], 4)
+
+                    calculated.clear()
+                    resumed = EWarningLDNM(checkpoint_dir=directory, checkpoint_interval=4, **parameters)
+                    with self.assertRaises(KeyboardInterrupt):
+                        resumed.check_windows()
+                    self.assertEqual(calculated, [8, 9])
+
+                resumed = EWarningLDNM(checkpoint_dir=directory, checkpoint_interval=4, **parameters)
+                resumed.check_windows()
+
+                self.assertEqual(resumed.start_date, ew.start_date)
+                self.assertTrue(np.array_equal(resumed.networks, ew.networks))
+                self.assertTrue(np.array_equal(resumed.landscape_dnm(), ew.landscape_dnm()))
+
+                shard = EWarningLDNM(checkpoint_dir=directory, checkpoint_interval=4,
+                                     **dict(parameters, end_date=pd.to_datetime('2020-02-25', format='%Y-%m-%d')))
+                shard.check_windows()
+                self.assertEqual(len(os.listdir(directory)), 2)
+                self.assertTrue(np.array_equal(shard.networks, ew.networks[:len(shard.networks)]))
+
 
 if __name__ == '__main__':
     unittest.main()
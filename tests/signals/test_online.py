@@ -0,0 +1,51 @@
+import unittest
+import numpy as np
+
+from earlywarningsignals.signals import EWarningGeneral, FoldChangeDetector
+
+
+class MyTestCase(unittest.TestCase):
+    """
+    Unittest Class used to test the class FoldChangeDetector.
+    """
+
+    def test_update_1(self):
+        """
+        Tests that the method update() from the FoldChangeDetector returns the same tipping points as the method
+        k_fold_changes() from EWarningGeneral for a single time series, except for the last step instants of study.
+        """
+        rng = np.random.default_rng(0)
+        series = rng.integers(0, 6, size=60).astype(float)
+
+        for step in [1, 3, 7]:
+            detector = FoldChangeDetector(k_fold=1.5, step=step)
+            alarms = [detector.update(value) for value in series]
+            expected = EWarningGeneral.k_fold_changes(series, k_fold=1.5, step=step)
+            self.assertEqual(alarms[:len(series) - step + 1], expected[:len(series) - step + 1].tolist())
+
+    def test_process_1(self):
+        """
+        Tests that the method process() from the FoldChangeDetector returns the same tipping points as the methods
+        k_fold_changes() and k_fold_changes_multiple() from EWarningGeneral for a group of time series, even when they
+        are received in several parts.
+        """
+        rng = np.random.default_rng(1)
+        series = rng.integers(0, 6, size=(5, 50)).astype(float)
+        step = 4
+
+        detector = FoldChangeDetector(k_fold=2, step=step, series=5)
+        alarms = np.concatenate((detector.process(series[:, :20]), detector.process(series[:, 20:])), axis=1)
+        expected = EWarningGeneral.k_fold_changes(series, k_fold=2, step=step)
+        self.assertEqual(alarms[:, :-step + 1].tolist(), expected[:, :-step + 1].tolist())
+
+        detector = FoldChangeDetector(k_fold=2, step=step, rate_compare=0.6, series=5)
+        alarms = detector.process(series)
+        expected = EWarningGeneral.k_fold_changes_multiple(series, k_fold=2, step=step, rate_compare=0.6)
+        self.assertEqual(alarms[:-step + 1].tolist(), expected[:-step + 1].tolist())
+
+        detector.reset()
+        self.assertEqual(detector.process(series).tolist(), alarms.tolist())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,87 @@
+import unittest
+import pandas as pd
+import numpy as np
+from datetime import timedelta
+
+from earlywarningsignals import COVID_CRIDA_CUMULATIVE
+from earlywarningsignals.signals import EWarningGeneral, EWarningSpecific, EWarningDNM, EWarningLDNM
+from earlywarningsignals.signals.refinement import strided_networks, refinement_positions, refine_tipping_points, \
+    position_dates
+
+
+class MyTestCase(unittest.TestCase):
+    """
+    Unittest Class used to test the strided evaluation and the adaptive refinement around the tipping points.
+    """
+
+    def test_strided_networks_1(self):
+        """
+        Tests that the function strided_networks() returns the networks and the early warning signals of the method
+        check_windows() every stride dates, for the classes EWarningSpecific, EWarningDNM and EWarningLDNM.
+        """
+        countries = ['ES', 'FR', 'IT', 'DE', 'PT']
+        for ew_class, marker in [(EWarningSpecific, 'density'), (EWarningDNM, 'mst_dnm'), (EWarningLDNM, 'mst_dnm')]:
+            parameters = dict(covid_file=COVID_CRIDA_CUMULATIVE,
+                              start_date=pd.to_datetime('2020-01-25', format='%Y-%m-%d'),
+                              end_date=pd.to_datetime('2020-04-15', format='%Y-%m-%d'),
+                              countries=countries, static_adjacency=np.ones((5, 5)) - np.eye(5), window_size=7,
+                              cumulative_data=False, progress_bar=False)
+            ew = ew_class(**parameters)
+            ew.check_windows()
+            ew_strided, positions = strided_networks(ew_class(**parameters), stride=7)
+
+            self.assertEqual(positions.tolist(), list(range(0, len(ew.networks), 7)))
+            self.assertEqual(ew_strided.start_date, ew.start_date)
+            self.assertTrue(np.allclose(ew_strided.networks, ew.networks[positions], rtol=1e-9, atol=1e-12))
+            self.assertTrue(np.allclose(getattr(ew_strided, marker)(), np.asarray(getattr(ew, marker)())[positions]))
+            if ew_class == EWarningSpecific:
+                self.assertEqual(ew_strided.prs().tolist(), ew.prs()[positions].tolist())
+
+        with self.assertRaises(ValueError):
+            strided_networks(EWarningDNM(**dict(parameters, window_size=0)))
+        with self.assertRaises(ValueError):
+            strided_networks(EWarningDNM(**parameters), stride=0)
+
+    def test_refinement_positions_1(self):
+        """
+        Tests that the function refinement_positions() covers the dates since the origin of the comparison of each
+        candidate until the margin after it, limited to the instants of study.
+        """
+        self.assertEqual(refinement_positions([14], 40, 7).tolist(), list(range(0, 22)))
+        self.assertEqual(refinement_positions([35], 40, 7, step=2, margin=2).tolist(), list(range(19, 38)))
+        self.assertEqual(refinement_positions([14, 35], 40, 7, margin=0).tolist(),
+                         list(range(7, 15)) + list(range(28, 36)))
+        self.assertEqual(refinement_positions([], 40, 7).tolist(), [])
+
+    def test_refine_tipping_points_1(self):
+        """
+        Tests that the function refine_tipping_points() returns the early warning signal of the method check_windows()
+        at the coarse dates and at every date around the candidate tipping points of the coarse pass.
+        """
+        parameters = dict(covid_file=COVID_CRIDA_CUMULATIVE,
+                          start_date=pd.to_datetime('2020-02-01', format='%Y-%m-%d'),
+                          end_date=pd.to_datetime('2020-04-15', format='%Y-%m-%d'),
+                          countries=['ES', 'FR', 'IT', 'DE', 'PT'], static_adjacency=np.ones((5, 5)) - np.eye(5),
+                          window_size=7, cumulative_data=False, progress_bar=False)
+        ew = EWarningSpecific(**parameters)
+        ew.check_windows()
+        ew_refined, positions, candidates = refine_tipping_points(EWarningSpecific(**parameters), 'density', 1.5,
+                                                                  stride=7)
+
+        coarse_positions = np.arange(0, len(ew.networks), 7)
+        coarse_tipping_points = EWarningGeneral.k_fold_changes(ew.density()[coarse_positions], 1.5)
+        self.assertEqual(candidates.tolist(), coarse_positions[coarse_tipping_points == 1].tolist())
+        self.assertTrue(len(candidates) > 0)
+        self.assertEqual(positions.tolist(), sorted(set(coarse_positions) |
+                                                    set(refinement_positions(candidates, len(ew.networks), 7))))
+        self.assertTrue(len(positions) < len(ew.networks))
+        self.assertTrue(np.allclose(ew_refined.density(), ew.density()[positions]))
+        self.assertEqual(position_dates(ew_refined, candidates[:1]),
+                         [ew.start_date + timedelta(days=int(candidates[0]))])
+
+        ew_refined, positions, _ = refine_tipping_points(EWarningSpecific(**parameters), 'prs', 1.5, stride=7)
+        self.assertEqual(ew_refined.prs().tolist(), ew.prs()[positions].tolist())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,71 @@
+import unittest
+import pandas as pd
+import numpy as np
+
+from earlywarningsignals import COVID_CRIDA_CUMULATIVE
+from earlywarningsignals.signals import EWarningSpecific, EWarningDNM
+from earlywarningsignals.signals.sensitivity import leave_one_out, country_influence
+from earlywarningsignals.signals.exceptions import CountryUndefinedException
+
+
+class MyTestCase(unittest.TestCase):
+    """
+    Unittest Class used to test the leave-one-out sensitivity analysis of the countries.
+    """
+
+    def test_with_countries_1(self):
+        """
+        Tests that the method with_countries() returns the same data and networks as the classes constructed with only
+        the subset of countries, and that it fails for countries that aren't in the class.
+        """
+        countries = ['ES', 'FR', 'IT', 'DE', 'PT']
+        for ew_class in [EWarningSpecific, EWarningDNM]:
+            parameters = dict(covid_file=COVID_CRIDA_CUMULATIVE,
+                              start_date=pd.to_datetime('2020-02-15', format='%Y-%m-%d'),
+                              end_date=pd.to_datetime('2020-03-15', format='%Y-%m-%d'),
+                              window_size=7, correlation='spearman', cumulative_data=False, progress_bar=False)
+            ew = ew_class(countries=countries, static_adjacency=np.ones((5, 5)) - np.eye(5), **parameters)
+            ew.check_windows()
+            ew_subset = ew_class(countries=['ES', 'IT', 'PT'], static_adjacency=np.ones((3, 3)) - np.eye(3),
+                                 **parameters)
+            ew_subset.check_windows()
+
+            subset = ew.with_countries(['PT', 'ES', 'IT'])
+            self.assertEqual(subset.countries, ew_subset.countries)
+            self.assertEqual(subset.countries_index, ew_subset.countries_index)
+            for attribute in ew_subset.time_axes():
+                self.assertTrue(np.array_equal(getattr(subset, attribute), getattr(ew_subset, attribute)))
+            self.assertEqual(len(ew.countries), 5)
+
+            with self.assertRaises(CountryUndefinedException):
+                ew.with_countries(['ES', 'GB'])
+
+    def test_leave_one_out_1(self):
+        """
+        Tests that the functions leave_one_out() and country_influence() return the early warning signals of the
+        classes constructed without each country.
+        """
+        countries = ['ES', 'FR', 'IT', 'DE']
+        parameters = dict(covid_file=COVID_CRIDA_CUMULATIVE,
+                          start_date=pd.to_datetime('2020-02-15', format='%Y-%m-%d'),
+                          end_date=pd.to_datetime('2020-03-15', format='%Y-%m-%d'),
+                          window_size=7, correlation='pearson', threshold=0.5, cumulative_data=False,
+                          progress_bar=False)
+        ew = EWarningSpecific(countries=countries, static_adjacency=np.ones((4, 4)) - np.eye(4), **parameters)
+        ew.check_windows()
+
+        values = leave_one_out(ew, 'density')
+        self.assertEqual(list(values), ew.countries)
+        for country in countries:
+            ew_subset = EWarningSpecific(countries=[other for other in countries if other != country],
+                                         static_adjacency=np.ones((3, 3)) - np.eye(3), **parameters)
+            ew_subset.check_windows()
+            self.assertEqual(values[country].tolist(), ew_subset.density().tolist())
+
+        influence = country_influence(ew, 'density', countries=['IT', 'ES'])
+        self.assertEqual(influence.shape, (2, len(ew.networks)))
+        self.assertEqual(influence[1].tolist(), (ew.density() - values['ES']).tolist())
+
+
+if __name__ == '__main__':
+    unittest.main()
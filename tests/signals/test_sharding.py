@@ -0,0 +1,69 @@
+import unittest
+import tempfile
+import pandas as pd
+import numpy as np
+
+from earlywarningsignals import COVID_CRIDA_CUMULATIVE
+from earlywarningsignals.signals import EWarningSpecific, EWarningDNM, EWarningLDNM
+from earlywarningsignals.signals.sharding import halo_days, plan_shards, run_shards
+
+
+class MyTestCase(unittest.TestCase):
+    """
+    Unittest Class used to test the partition of the dates of study in shards.
+    """
+
+    def test_plan_shards_1(self):
+        """
+        Tests that the function plan_shards() splits the dates of study in consecutive shards with the right halo,
+        shifting the start date when there aren't enough previous dates.
+        """
+        ew = EWarningSpecific(covid_file=COVID_CRIDA_CUMULATIVE,
+                              start_date=pd.to_datetime('2020-01-22', format='%Y-%m-%d'),
+                              end_date=pd.to_datetime('2020-03-01', format='%Y-%m-%d'),
+                              window_size=14, progress_bar=False)
+        shards = plan_shards(ew, 3)
+
+        self.assertEqual(halo_days(ew), 13)
+        self.assertEqual(len(shards), 3)
+        self.assertEqual(shards[0][0], pd.to_datetime('2020-02-04', format='%Y-%m-%d'))
+        self.assertEqual(shards[-1][1], pd.to_datetime('2020-03-01', format='%Y-%m-%d'))
+        for (start_date, end_date, halo_date), (next_start_date, _, _) in zip(shards[:-1], shards[1:]):
+            self.assertEqual(next_start_date, end_date + pd.Timedelta(days=1))
+            self.assertEqual(halo_date, start_date - pd.Timedelta(days=13))
+
+        ew = EWarningDNM(covid_file=COVID_CRIDA_CUMULATIVE, window_size=7, progress_bar=False)
+        self.assertEqual(halo_days(ew), 7)
+        ew = EWarningDNM(covid_file=COVID_CRIDA_CUMULATIVE, window_size=0, progress_bar=False)
+        with self.assertRaises(ValueError):
+            plan_shards(ew, 3)
+
+    def test_run_shards_1(self):
+        """
+        Tests that the function run_shards() returns the same arrays as the method check_windows() for the whole
+        interval of dates, for the classes EWarningSpecific, EWarningDNM and EWarningLDNM.
+        """
+        countries = ['ES', 'FR', 'IT', 'DE', 'PT']
+        static_adjacency = np.ones((5, 5)) - np.eye(5)
+        parameters = dict(covid_file=COVID_CRIDA_CUMULATIVE,
+                          start_date=pd.to_datetime('2020-01-25', format='%Y-%m-%d'),
+                          end_date=pd.to_datetime('2020-03-10', format='%Y-%m-%d'),
+                          countries=countries, window_size=7, static_adjacency=static_adjacency,
+                          cumulative_data=False, progress_bar=False)
+
+        for ew_class in [EWarningSpecific, EWarningDNM, EWarningLDNM]:
+            ew = ew_class(**parameters)
+            ew.check_windows()
+            with tempfile.TemporaryDirectory() as directory:
+                # The L-DNM already uses a pool of processes for each date
+                processes = 1 if ew_class == EWarningLDNM else 2
+                merged = run_shards(ew_class(**parameters), 3, directory, processes=processes)
+
+            self.assertEqual(merged.start_date, ew.start_date)
+            self.assertEqual(merged.end_date, ew.end_date)
+            for attribute in ew.time_axes():
+                self.assertTrue(np.array_equal(getattr(merged, attribute), getattr(ew, attribute)))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,6 +1,8 @@
 import unittest
+from unittest import mock
 import pandas as pd
 import numpy as np
+import networkx as nx
 
 from earlywarningsignals import COVID_CRIDA_CUMULATIVE, COUNTRY_INFO_CRIDA
 
@@ -485,6 +487,169 @@ class MyTestCase(unittest.TestCase):
 
         self.assertEqual([round(x, 10) for x in ew.prs(COUNTRY_INFO_CRIDA)], [round(x, 10) for x in prs_s])
 
+    def test_prs_5(self):
+        """
+        Tests that the method prs() from EWarningSpecific only reads the population file once, reusing the population
+        of each country aligned with the class property countries for the following calls.
+        """
+        countries = ['AL', 'BE', 'FR', 'ES', 'SE', 'CH', 'GB', 'TR', 'UA']
+
+        static_adjacency = np.ones(shape=(len(countries), len(countries)))
+        np.fill_diagonal(static_adjacency, 0)
+
+        ew = EWarningSpecific(covid_file=COVID_CRIDA_CUMULATIVE,
+                              start_date=pd.to_datetime('2020-01-31', format='%Y-%m-%d'),
+                              end_date=pd.to_datetime('2020-02-23', format='%Y-%m-%d'),
+                              countries=countries,
+                              window_size=14, correlation='pearson', threshold=0.7,
+                              cumulative_data=True, square_root_data=True,
+                              static_adjacency=static_adjacency, progress_bar=False)
+        ew.check_windows()
+        with mock.patch('earlywarningsignals.signals.specific.pd.read_csv', wraps=pd.read_csv) as read_csv:
+            prs_s = ew.prs(COUNTRY_INFO_CRIDA)
+            population = ew.countries_population(COUNTRY_INFO_CRIDA)
+            prs_t = ew.prs(COUNTRY_INFO_CRIDA)
+
+        self.assertEqual(read_csv.call_count, 1)
+        self.assertEqual(list(ew.countries_info.keys()), [COUNTRY_INFO_CRIDA])
+        self.assertEqual(population.tolist(),
+                         [2877800, 11589616, 8654618, 46754783, 65273512, 67886004, 10099270, 84339067, 43733759])
+        self.assertEqual(prs_t.tolist(), prs_s.tolist())
+
+    def test_unweighted_format_1(self):
+        """
+        Tests that the storage formats "bool" and "packed" of the unweighted networks from EWarningSpecific reduce the
+        memory footprint while all the early warning signals stay the same as with the default "int" format.
+        """
+        ews = []
+        for unweighted_format in ['int', 'bool', 'packed']:
+            ew = EWarningSpecific(covid_file=COVID_CRIDA_CUMULATIVE,
+                                  start_date=pd.to_datetime('2020-02-15', format='%Y-%m-%d'),
+                                  end_date=pd.to_datetime('2020-03-01', format='%Y-%m-%d'),
+                                  window_size=14, correlation='pearson', threshold=0.5,
+                                  cumulative_data=False, square_root_data=False, progress_bar=False,
+                                  unweighted_format=unweighted_format)
+            ew.check_windows()
+            ews.append(ew)
+
+        self.assertEqual(ews[0].networks_unweighted.nbytes, 8 * ews[1].networks_unweighted.nbytes)
+        self.assertEqual(ews[1].networks_unweighted.shape[-1], 46)
+        self.assertEqual(ews[2].networks_unweighted.shape[-1], 6)
+        for ew in ews[1:]:
+            self.assertEqual(ew.density().tolist(), ews[0].density().tolist())
+            self.assertEqual(ew.number_edges().tolist(), ews[0].number_edges().tolist())
+            self.assertEqual(ew.prs(COUNTRY_INFO_CRIDA).tolist(), ews[0].prs(COUNTRY_INFO_CRIDA).tolist())
+            self.assertTrue(np.allclose(ew.clustering_coefficient(), ews[0].clustering_coefficient(), rtol=0,
+                                        atol=1e-10, equal_nan=True))
+
+    def test_giant_component_1(self):
+        """
+        Tests that the threshold = "GC" from EWarningSpecific connects every pair of nodes inside the largest connected
+        component of each correlation network, comparing it with the components obtained with networkx.
+        """
+        ew = EWarningSpecific(covid_file=COVID_CRIDA_CUMULATIVE,
+                              start_date=pd.to_datetime('2020-01-25', format='%Y-%m-%d'),
+                              end_date=pd.to_datetime('2020-03-01', format='%Y-%m-%d'),
+                              window_size=7, correlation='pearson', threshold='GC',
+                              cumulative_data=False, square_root_data=False, progress_bar=False)
+        ew.check_windows()
+
+        for t, network in enumerate(ew.networks):
+            gc = sorted(max(nx.connected_components(nx.Graph(network)), key=len))
+            gc_network = np.zeros(shape=network.shape, dtype=int)
+            gc_network[np.ix_(gc, gc)] = 1
+            np.fill_diagonal(gc_network, 0)
+            self.assertEqual(ew.unweighted_network(t).tolist(), gc_network.tolist())
+
+        ew.networks = ew.networks[:0]
+        self.assertEqual(ew.giant_components().shape, (0, len(ew.countries), len(ew.countries)))
+
+    def test_threshold_sweep_1(self):
+        """
+        Tests that the method threshold_sweep() from EWarningSpecific returns for each threshold the same early warning
+        signals as the ones obtained by an instance generated with that threshold.
+        """
+        thresholds = [-0.2, 0., 0.3, 0.5, 0.7, 0.9]
+        countries = ['AL', 'BE', 'FR', 'ES', 'SE', 'CH', 'GB', 'TR', 'UA']
+
+        static_adjacency = np.ones(shape=(len(countries), len(countries)))
+        np.fill_diagonal(static_adjacency, 0)
+
+        ew = EWarningSpecific(covid_file=COVID_CRIDA_CUMULATIVE,
+                              start_date=pd.to_datetime('2020-01-31', format='%Y-%m-%d'),
+                              end_date=pd.to_datetime('2020-03-01', format='%Y-%m-%d'),
+                              countries=countries,
+                              window_size=14, correlation='pearson', threshold=0.5,
+                              cumulative_data=True, square_root_data=True,
+                              static_adjacency=static_adjacency, progress_bar=False)
+        ew.check_windows()
+        sweep = ew.threshold_sweep(thresholds, population_file=COUNTRY_INFO_CRIDA)
+
+        for i, threshold in enumerate(thresholds):
+            ew.threshold = threshold
+            ew.networks_unweighted = ew.generate_unweighted()
+            self.assertEqual(sweep['density'][i].tolist(), ew.density().tolist())
+            self.assertEqual(sweep['number_edges'][i].tolist(), ew.number_edges().tolist())
+            self.assertEqual(sweep['prs'][i].tolist(), ew.prs(COUNTRY_INFO_CRIDA).tolist())
+            self.assertTrue(np.allclose(sweep['clustering_coefficient'][i], ew.clustering_coefficient(), rtol=0,
+                                        atol=1e-10, equal_nan=True))
+            self.assertTrue(np.allclose(sweep['assortativity_coefficient'][i], ew.assortativity_coefficient(),
+                                        rtol=0, atol=1e-10, equal_nan=True))
+
+    def test_compute_signals_1(self):
+        """
+        Tests that the method compute_signals() from EWarningSpecific returns the same early warning signals as each
+        individual method, and that the cached graphs are reused until new unweighted networks are generated.
+        """
+        countries = ['AL', 'BE', 'FR', 'ES', 'SE', 'CH', 'GB', 'TR', 'UA']
+
+        static_adjacency = np.ones(shape=(len(countries), len(countries)))
+        np.fill_diagonal(static_adjacency, 0)
+
+        ew = EWarningSpecific(covid_file=COVID_CRIDA_CUMULATIVE,
+                              start_date=pd.to_datetime('2020-01-31', format='%Y-%m-%d'),
+                              end_date=pd.to_datetime('2020-03-01', format='%Y-%m-%d'),
+                              countries=countries, window_size=14, correlation='pearson', threshold=0.5,
+                              cumulative_data=True, square_root_data=True, static_adjacency=static_adjacency,
+                              progress_bar=False)
+        ew.check_windows()
+        signals = ew.compute_signals(population_file=COUNTRY_INFO_CRIDA)
+
+        self.assertEqual(signals['density'].tolist(), ew.density().tolist())
+        self.assertEqual(signals['number_edges'].tolist(), ew.number_edges().tolist())
+        self.assertEqual(signals['prs'].tolist(), ew.prs(COUNTRY_INFO_CRIDA).tolist())
+        for signal in ['clustering_coefficient', 'assortativity_coefficient', 'forman_ricci_curvature']:
+            self.assertTrue(np.allclose(signals[signal], getattr(ew, signal)(), equal_nan=True))
+
+        graph = ew.network_graph(0)
+        self.assertIs(ew.network_graph(0), graph)
+        ew.check_windows()
+        self.assertIsNot(ew.network_graph(0), graph)
+        self.assertRaises(ValueError, ew.compute_signals, ['density', 'unknown'])
+
+    def test_spectral_markers_1(self):
+        """
+        Tests that the methods leading_eigenvalue(), spectral_gap() and algebraic_connectivity() from EWarningSpecific
+        return the same values as the spectra obtained with networkx for each network, weighted and unweighted.
+        """
+        ew = EWarningSpecific(covid_file=COVID_CRIDA_CUMULATIVE,
+                              start_date=pd.to_datetime('2020-02-01', format='%Y-%m-%d'),
+                              end_date=pd.to_datetime('2020-03-01', format='%Y-%m-%d'),
+                              window_size=14, correlation='pearson', threshold=0.5,
+                              cumulative_data=False, square_root_data=True, progress_bar=False)
+        ew.check_windows()
+
+        for weighted, networks in [(False, [ew.unweighted_network(t) for t in range(len(ew.networks))]),
+                                   (True, ew.networks)]:
+            adjacency_spectra = [np.sort(nx.adjacency_spectrum(nx.Graph(network)).real) for network in networks]
+            laplacian_spectra = [np.sort(nx.laplacian_spectrum(nx.Graph(network))) for network in networks]
+            self.assertTrue(np.allclose(ew.leading_eigenvalue(weighted), [spectrum[-1] for spectrum in
+                                                                          adjacency_spectra]))
+            self.assertTrue(np.allclose(ew.spectral_gap(weighted), [spectrum[-1] - spectrum[-2] for spectrum in
+                                                                    adjacency_spectra]))
+            self.assertTrue(np.allclose(ew.algebraic_connectivity(weighted), [spectrum[1] for spectrum in
+                                                                              laplacian_spectra]))
+
     def test_forman_ricci_curvature_1(self):
         """
         Tests that the method forman_ricci_curvature() from EWarningSpecific returns the correct List with
@@ -0,0 +1,122 @@
+import unittest
+import pandas as pd
+import numpy as np
+
+from earlywarningsignals import COVID_CRIDA_CUMULATIVE
+from earlywarningsignals.signals import EWarningSpecific, EWarningDNM, EWarningLDNM
+from earlywarningsignals.signals.surrogates import generate_surrogates, surrogate_test
+
+
+class MyTestCase(unittest.TestCase):
+    """
+    Unittest Class used to test the surrogate data significance testing.
+    """
+
+    def test_generate_surrogates_1(self):
+        """
+        Tests that the function generate_surrogates() keeps the values of each country when shuffling, keeps the power
+        spectrum of each country with the phase randomization, and that both are reproducible with the same seed.
+        """
+        data = np.random.default_rng(0).random((4, 21))
+
+        surrogates = generate_surrogates(data, surrogates=5, method='shuffle', seed=1)
+        self.assertEqual(surrogates.shape, (5, 4, 21))
+        self.assertTrue(np.array_equal(np.sort(surrogates, axis=-1), np.broadcast_to(np.sort(data, axis=-1),
+                                                                                      surrogates.shape)))
+        self.assertTrue(np.array_equal(surrogates, generate_surrogates(data, surrogates=5, method='shuffle', seed=1)))
+
+        surrogates = generate_surrogates(data, surrogates=5, method='phase', seed=1)
+        self.assertTrue(np.allclose(np.abs(np.fft.rfft(surrogates, axis=-1)),
+                                    np.broadcast_to(np.abs(np.fft.rfft(data, axis=-1)), (5, 4, 11))))
+        self.assertTrue(np.array_equal(surrogates, generate_surrogates(data, surrogates=5, method='phase', seed=1)))
+
+    def test_surrogate_test_1(self):
+        """
+        Tests that the function surrogate_test() returns reproducible p-values for each instant of study, consistent
+        with the values of the early warning signal obtained for the surrogates, whatever the number of processes.
+        """
+        ew = EWarningSpecific(covid_file=COVID_CRIDA_CUMULATIVE,
+                              start_date=pd.to_datetime('2020-02-15', format='%Y-%m-%d'),
+                              end_date=pd.to_datetime('2020-03-01', format='%Y-%m-%d'),
+                              window_size=14, correlation='pearson', threshold=0.5,
+                              cumulative_data=False, square_root_data=True, progress_bar=False)
+        ew.check_windows()
+
+        p_values, null_distribution = surrogate_test(ew, 'density', surrogates=9, seed=3, batch_size=4)
+        self.assertEqual(p_values.shape, ew.density().shape)
+        self.assertEqual(null_distribution.shape, (9,) + ew.density().shape)
+        self.assertEqual(p_values.tolist(),
+                         ((1 + np.sum(null_distribution >= ew.density(), axis=0)) / 10).tolist())
+        self.assertTrue(np.all((p_values > 0) & (p_values <= 1)))
+
+        p_values_parallel, _ = surrogate_test(ew, 'density', surrogates=9, seed=3, processes=2)
+        self.assertEqual(p_values_parallel.tolist(), p_values.tolist())
+
+    def test_surrogate_test_2(self):
+        """
+        Tests that the function surrogate_test() returns undefined p-values for the undefined values of the early
+        warning signal, and that the undefined values of the surrogates are left out of the p-values.
+        """
+        ew = EWarningSpecific(covid_file=COVID_CRIDA_CUMULATIVE,
+                              start_date=pd.to_datetime('2020-02-15', format='%Y-%m-%d'),
+                              end_date=pd.to_datetime('2020-03-15', format='%Y-%m-%d'),
+                              window_size=14, correlation='pearson', threshold=0.8,
+                              cumulative_data=False, square_root_data=True, progress_bar=False)
+        ew.check_windows()
+        observed = ew.assortativity_coefficient()
+
+        p_values, null_distribution = surrogate_test(ew, 'assortativity_coefficient', surrogates=9, seed=3)
+        self.assertTrue(np.any(np.isnan(observed)) and np.any(np.isnan(null_distribution)))
+        self.assertTrue(np.array_equal(np.isnan(p_values), np.isnan(observed)))
+        for t in np.flatnonzero(~np.isnan(observed)):
+            null_values = null_distribution[:, t][~np.isnan(null_distribution[:, t])]
+            self.assertEqual(p_values[t], (1 + np.sum(null_values >= observed[t])) / (1 + len(null_values)))
+
+    def test_surrogate_test_3(self):
+        """
+        Tests that the function surrogate_test() throws an Exception for the L-DNM of EWarningLDNM, which can't be
+        obtained from the networks of the surrogates, while the rest of early warning signals of the class are tested.
+        """
+        ew = EWarningLDNM(covid_file=COVID_CRIDA_CUMULATIVE,
+                          start_date=pd.to_datetime('2020-03-01', format='%Y-%m-%d'),
+                          end_date=pd.to_datetime('2020-03-05', format='%Y-%m-%d'),
+                          countries=['ES', 'FR', 'IT', 'DE', 'PT'], static_adjacency=np.ones((5, 5)) - np.eye(5),
+                          window_size=7, cumulative_data=False, progress_bar=False)
+        ew.check_windows()
+
+        self.assertEqual(len(ew.with_networks(ew.networks).landscape_dnm()), 0)
+        self.assertTrue(np.array_equal(ew.with_networks(ew.networks).mst_dnm(), ew.mst_dnm()))
+        with self.assertRaises(ValueError):
+            surrogate_test(ew, 'landscape_dnm', surrogates=5, seed=0)
+        p_values, _ = surrogate_test(ew, 'mst_dnm', surrogates=5, seed=0)
+        self.assertEqual(p_values.shape, ew.mst_dnm().shape)
+
+    def test_windows_to_networks_1(self):
+        """
+        Tests that the vectorized method windows_to_networks() used with the surrogates returns the same networks as
+        the method check_windows(), for EWarningSpecific and for EWarningDNM with and without window size.
+        """
+        ew = EWarningSpecific(covid_file=COVID_CRIDA_CUMULATIVE,
+                              start_date=pd.to_datetime('2020-02-15', format='%Y-%m-%d'),
+                              end_date=pd.to_datetime('2020-03-01', format='%Y-%m-%d'),
+                              window_size=7, correlation='kendall', threshold=0.5,
+                              cumulative_data=False, square_root_data=True, progress_bar=False)
+        ew.check_windows()
+        self.assertTrue(np.allclose(ew.windows_to_networks(ew.data), ew.networks, rtol=0, atol=1e-10))
+
+        for window_size in [0, 7]:
+            ew = EWarningDNM(covid_file=COVID_CRIDA_CUMULATIVE,
+                             start_date=pd.to_datetime('2020-02-15', format='%Y-%m-%d'),
+                             end_date=pd.to_datetime('2020-03-01', format='%Y-%m-%d'),
+                             window_size=window_size, correlation='spearman', cumulative_data=False,
+                             progress_bar=False)
+            ew.check_windows()
+            networks = ew.networks.copy()
+            self.assertTrue(np.allclose(ew.windows_to_networks(ew.data), networks, rtol=0, atol=1e-10))
+
+            surrogate_test(ew, 'mst_dnm', surrogates=3, method='phase', seed=5)
+            self.assertTrue(np.array_equal(ew.networks, networks))
+
+
+if __name__ == '__main__':
+    unittest.main()
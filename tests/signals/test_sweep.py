@@ -0,0 +1,110 @@
+import unittest
+import pandas as pd
+import numpy as np
+
+from earlywarningsignals import COVID_CRIDA_CUMULATIVE
+from earlywarningsignals.signals import EWarningSpecific, EWarningDNM
+from earlywarningsignals.signals.correlation import prefix_sums, prefix_statistics, sliding_windows, pearson, \
+    correlation_matrices, multiple_correlation_matrices
+from earlywarningsignals.signals.sweep import window_size_sweep, window_size_markers, correlation_sweep
+
+
+class MyTestCase(unittest.TestCase):
+    """
+    Unittest Class used to test the sweep of several window sizes at once.
+    """
+
+    def test_prefix_statistics_1(self):
+        """
+        Tests that the function prefix_statistics() returns the same correlations and standard deviations as the
+        vectorized kernels, including constant windows, and for cumulative sums of a longer period.
+        """
+        data = np.random.default_rng(0).integers(0, 10 ** 6, size=(5, 40)).astype(float)
+        data[2, 10:20] = 7
+
+        sums, squares, products = prefix_sums(data)
+        for window_size in [2, 5, 12]:
+            correlations, deviations = prefix_statistics(data[:, 3:], (sums[:, 3:], squares[:, 3:], products[3:]),
+                                                         window_size)
+            windows = sliding_windows(data[:, 3:], window_size)
+            self.assertTrue(np.allclose(correlations, pearson(windows), rtol=0, atol=1e-12))
+            self.assertTrue(np.allclose(deviations, np.std(windows, axis=-1, ddof=1), rtol=1e-12, atol=0))
+
+    def test_window_size_sweep_1(self):
+        """
+        Tests that the function window_size_sweep() returns the same dates, data, adjacencies and networks as the
+        method check_windows() with each window size, for the classes EWarningSpecific and EWarningDNM.
+        """
+        countries = ['ES', 'FR', 'IT', 'DE', 'PT']
+        for ew_class, correlation in [(EWarningSpecific, 'pearson'), (EWarningDNM, 'pearson'),
+                                      (EWarningDNM, 'spearman')]:
+            parameters = dict(covid_file=COVID_CRIDA_CUMULATIVE,
+                              start_date=pd.to_datetime('2020-01-25', format='%Y-%m-%d'),
+                              end_date=pd.to_datetime('2020-04-15', format='%Y-%m-%d'),
+                              countries=countries, static_adjacency=np.ones((5, 5)) - np.eye(5),
+                              correlation=correlation, cumulative_data=False, progress_bar=False)
+            results = window_size_sweep(ew_class(**parameters), [3, 7, 14])
+
+            self.assertEqual(list(results), [3, 7, 14])
+            for window_size, ew_size in results.items():
+                ew = ew_class(window_size=window_size, **parameters)
+                ew.check_windows()
+                self.assertEqual(ew_size.window_size, window_size)
+                self.assertEqual(ew_size.start_date, ew.start_date)
+                self.assertTrue(np.array_equal(ew_size.data, ew.data))
+                self.assertTrue(np.array_equal(ew_size.adjacencies, ew.adjacencies))
+                self.assertTrue(np.allclose(ew_size.networks, ew.networks, rtol=1e-9, atol=1e-12))
+
+    def test_window_size_markers_1(self):
+        """
+        Tests that the function window_size_markers() returns the early warning signals of each window size.
+        """
+        parameters = dict(covid_file=COVID_CRIDA_CUMULATIVE,
+                          start_date=pd.to_datetime('2020-02-15', format='%Y-%m-%d'),
+                          end_date=pd.to_datetime('2020-04-15', format='%Y-%m-%d'),
+                          threshold=0.5, cumulative_data=False, square_root_data=True, progress_bar=False)
+        markers = window_size_markers(EWarningSpecific(**parameters), [7, 14], ['density', 'number_edges'])
+
+        for window_size in [7, 14]:
+            ew = EWarningSpecific(window_size=window_size, **parameters)
+            ew.check_windows()
+            self.assertEqual(markers[window_size]['density'].tolist(), ew.density().tolist())
+            self.assertEqual(markers[window_size]['number_edges'].tolist(), ew.number_edges().tolist())
+
+    def test_multiple_correlation_matrices_1(self):
+        """
+        Tests that the function multiple_correlation_matrices() returns the same matrices as the function
+        correlation_matrices() for each type of correlation, including windows with ties.
+        """
+        windows = np.random.default_rng(1).integers(0, 4, size=(6, 5, 9)).astype(float)
+        correlations = ['kendall', 'pearson', 'spearman', 'other']
+
+        results = multiple_correlation_matrices(windows, correlations)
+        self.assertEqual(list(results), correlations)
+        for correlation in correlations:
+            self.assertTrue(np.allclose(results[correlation], correlation_matrices(windows, correlation),
+                                        rtol=0, atol=1e-14))
+
+    def test_correlation_sweep_1(self):
+        """
+        Tests that the function correlation_sweep() returns the same networks as the method check_windows() with each
+        type of correlation, for the classes EWarningSpecific and EWarningDNM.
+        """
+        for ew_class in [EWarningSpecific, EWarningDNM]:
+            parameters = dict(covid_file=COVID_CRIDA_CUMULATIVE,
+                              start_date=pd.to_datetime('2020-02-15', format='%Y-%m-%d'),
+                              end_date=pd.to_datetime('2020-03-15', format='%Y-%m-%d'),
+                              countries=['ES', 'FR', 'IT', 'DE', 'PT'], static_adjacency=np.ones((5, 5)) - np.eye(5),
+                              window_size=7, cumulative_data=False, progress_bar=False)
+            results = correlation_sweep(ew_class(**parameters), ['pearson', 'spearman', 'kendall'])
+
+            for correlation, ew_correlation in results.items():
+                ew = ew_class(correlation=correlation, **parameters)
+                ew.check_windows()
+                self.assertEqual(ew_correlation.correlation, correlation)
+                self.assertTrue(np.array_equal(ew_correlation.adjacencies, ew.adjacencies))
+                self.assertTrue(np.allclose(ew_correlation.networks, ew.networks, rtol=1e-9, atol=1e-12))
+
+
+if __name__ == '__main__':
+    unittest.main()